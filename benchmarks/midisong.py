@@ -0,0 +1,94 @@
+#! python
+
+"""
+Checks and times the conversion of MIDI time to real time in
+midifile.song.TempoMap.
+
+The results of real_time(), real_times(), msec() and msecs() are compared
+with the straightforward computation that adds up the duration of all
+earlier tempo segments, on a synthetic song with many tempo changes.
+
+Simply run this from the toplevel frescobaldi directory:
+
+python benchmarks/midisong.py [tempo_changes] [events]
+
+"""
+
+from __future__ import print_function
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'frescobaldi_app'))
+from midifile import event, song
+
+
+def tempo_event(tempo):
+    """Returns a Set Tempo Meta-event for the tempo in microseconds per beat."""
+    return event.MetaEvent(0x51, chr(tempo >> 16) + chr(tempo >> 8 & 0xFF) + chr(tempo & 0xFF))
+
+
+def make_events(tempo_changes, events, division):
+    """Returns a per-track events dictionary and the sorted list of event times."""
+    length = tempo_changes * division * 4
+    d = {}
+    for midi_time in random.sample(range(1, length), tempo_changes):
+        d[midi_time] = {0: [tempo_event(random.randint(300000, 1000000))]}
+    times = sorted(random.randint(0, length + division) for i in range(events))
+    for midi_time in times:
+        d.setdefault(midi_time, {}).setdefault(1, []).append(
+            event.NoteEvent(0x90, 0, 60, 64))
+    return d, times
+
+
+def real_time(tempomap, midi_time):
+    """Returns the real time in microseconds, adding up all earlier segments."""
+    real_time = 0
+    times = tempomap.times
+    for i in range(1, len(times)):
+        if times[i][0] >= midi_time:
+            real_time += (midi_time - times[i-1][0]) * times[i-1][1]
+            break
+        real_time += (times[i][0] - times[i-1][0]) * times[i-1][1]
+    else:
+        real_time += (midi_time - times[-1][0]) * times[-1][1]
+    return real_time // tempomap.division
+
+
+def main(tempo_changes=5000, events=20000):
+    random.seed(0)
+    division = 384
+    d, times = make_events(tempo_changes, events, division)
+    start = time.time()
+    tempomap = song.TempoMap(d, division)
+    print("TempoMap creation:     {0:8.3f} s".format(time.time() - start))
+
+    # the reference is slow, so compare a part of the times with it
+    step = max(1, len(times) // 2000)
+    sample = times[::step]
+    start = time.time()
+    expected = [real_time(tempomap, t) for t in sample]
+    reference = (time.time() - start) * len(times) / len(sample)
+    assert [tempomap.real_time(t) for t in sample] == expected
+    assert tempomap.real_times(sample) == expected
+    assert [tempomap.msec(t) for t in sample] == [t // 1000 for t in expected]
+    assert tempomap.msecs(sample) == [t // 1000 for t in expected]
+    print("results identical for {0} of {1} event times, {2} tempo changes".format(
+        len(sample), len(times), len(tempomap.times)))
+
+    start = time.time()
+    for t in times:
+        tempomap.msec(t)
+    print("msec() per event:      {0:8.3f} s (adding up segments: {1:.3f} s)".format(
+        time.time() - start, reference))
+    start = time.time()
+    tempomap.msecs(times)
+    print("msecs() for all times: {0:8.3f} s".format(time.time() - start))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
+
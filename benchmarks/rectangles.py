@@ -0,0 +1,197 @@
+#! python
+
+"""
+Checks and times the searches in qpopplerview.rectangles.Rectangles.
+
+The results and the timings are compared with the former implementation,
+which kept the objects in four lists sorted on either coordinate. It is
+copied below as OldRectangles. Both are compared after bulk adding and
+after adding and removing single objects.
+
+Simply run this from the toplevel frescobaldi directory:
+
+python benchmarks/rectangles.py [count]
+
+count is the number of rectangles (default 5000).
+
+"""
+
+from __future__ import print_function
+
+import bisect
+import os
+import random
+import sys
+import time
+
+# import the module directly, without the PyQt4-dependent qpopplerview package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'frescobaldi_app', 'qpopplerview'))
+import rectangles
+from rectangles import Left, Top, Right, Bottom
+
+
+class OldRectangles(object):
+    """The former Rectangles, using four lists sorted on either coordinate."""
+    def __init__(self, objects=None, func=None):
+        self._items = {} # maps object to the result of func(object)
+        self._index = {} # maps side to indices, objects (index=coordinate of that side)
+        if func:
+            self._func = func
+        if objects:
+            self.bulk_add(objects)
+
+    def add(self, obj):
+        if obj in self._items:
+            return
+        self._items[obj] = coords = self._func(obj)
+        for side, (indices, objects) in self._index.items():
+            i = bisect.bisect_left(indices, coords[side])
+            indices.insert(i, coords[side])
+            objects.insert(i, obj)
+
+    def bulk_add(self, objects):
+        self._items.update((obj, self._func(obj)) for obj in objects)
+        self._index.clear()
+
+    def remove(self, obj):
+        del self._items[obj]
+        for indices, objects in self._index.values():
+            i = objects.index(obj)
+            del objects[i]
+            del indices[i]
+
+    def at(self, x, y):
+        return self._test(
+            (self._smaller, Top, y),
+            (self._larger, Bottom, y),
+            (self._smaller, Left, x),
+            (self._larger, Right, x))
+
+    def inside(self, left, top, right, bottom):
+        return self._test(
+            (self._larger, Top, top),
+            (self._smaller, Bottom, bottom),
+            (self._larger, Left, left),
+            (self._smaller, Right, right))
+
+    def intersecting(self, left, top, right, bottom):
+        return self._test(
+            (self._smaller, Top, bottom),
+            (self._larger, Bottom, top),
+            (self._smaller, Left, right),
+            (self._larger, Right, left))
+
+    def _test(self, *tests):
+        result = None
+        for meth, side, value in tests:
+            objects = meth(side, value)
+            if not result:
+                result = set(objects)
+            else:
+                result &= set(objects)
+            if not result:
+                break
+        return result
+
+    def _smaller(self, side, value):
+        indices, objects = self._sorted(side)
+        i = bisect.bisect_right(indices, value)
+        return objects[:i]
+
+    def _larger(self, side, value):
+        indices, objects = self._sorted(side)
+        i = bisect.bisect_left(indices, value)
+        return objects[i:]
+
+    def _sorted(self, side):
+        try:
+            return self._index[side]
+        except KeyError:
+            if self._items:
+                objects = [(coords[side], obj) for obj, coords in self._items.items()]
+                objects.sort()
+                result = tuple(map(list, zip(*objects)))
+            else:
+                result = [], []
+            self._index[side] = result
+            return result
+
+
+def make_rects(count, size=1000.0):
+    """Returns a dict mapping count objects to small random rectangles."""
+    rects = {}
+    for obj in range(count):
+        x, y = random.uniform(0, size), random.uniform(0, size)
+        w, h = random.uniform(1, size / 50), random.uniform(1, size / 100)
+        rects[obj] = (x, y, x + w, y + h)
+    return rects
+
+
+def make_areas(count, size=1000.0, fraction=0.1):
+    """Returns a list of random rectangles of fraction times size."""
+    areas = []
+    for i in range(count):
+        x, y = random.uniform(0, size), random.uniform(0, size)
+        areas.append((x, y, x + size * fraction, y + size * fraction))
+    return areas
+
+
+def check(r, old, points, areas):
+    """Compares the searches of Rectangles r with those of OldRectangles old."""
+    for x, y in points:
+        assert r.at(x, y) == old.at(x, y), ("at", x, y)
+    for area in areas:
+        assert r.inside(*area) == old.inside(*area), ("inside", area)
+        assert r.intersecting(*area) == old.intersecting(*area), ("intersecting", area)
+    assert r.batch_at(points) == [old.at(x, y) for x, y in points]
+    assert r.batch_intersecting(areas) == [old.intersecting(*a) for a in areas]
+
+
+def timeit(func, *args):
+    """Returns the time in microseconds func takes for every item in args."""
+    start = time.time()
+    for arg in args:
+        func(*arg)
+    return (time.time() - start) * 1e6 / len(args)
+
+
+def main(count=5000):
+    random.seed(0)
+    rects = make_rects(count)
+    # search mostly at places where rectangles are
+    points = [(c[Left] + 1, c[Top] + 1) for c in random.sample(list(rects.values()), 200)]
+    points += [(random.uniform(-10, 1010), random.uniform(-10, 1010)) for i in range(100)]
+    areas = make_areas(50)
+
+    r = rectangles.Rectangles(rects, rects.get)
+    old = OldRectangles(rects, rects.get)
+    # the old index consists of four sorted lists, a search may need them all
+    print("index creation:  {0:8.1f} ms (old: {1:.1f} ms)".format(
+        timeit(r.at, (0, 0)) / 1000, timeit(old._sorted, *zip(range(4))) * 4 / 1000))
+    check(r, old, points, areas)
+
+    # add and remove single objects, also outside the initial area
+    removed = [(obj,) for obj in random.sample(list(rects), count // 10)]
+    extra = make_rects(count // 10, 1200.0)
+    added = []
+    for obj, c in extra.items():
+        obj += count
+        rects[obj] = c
+        added.append((obj,))
+    changes = timeit(r.remove, *removed) + timeit(r.add, *added)
+    old_changes = timeit(old.remove, *removed) + timeit(old.add, *added)
+    for obj, in removed:
+        del rects[obj]
+    check(r, old, points, areas)
+    print("results identical to the old implementation for {0} rectangles".format(len(rects)))
+
+    print("remove() + add(): {0:7.1f} us (old: {1:.1f} us)".format(changes, old_changes))
+    print("at():            {0:8.1f} us per query (old: {1:.1f} us)".format(
+        timeit(r.at, *points), timeit(old.at, *points)))
+    print("intersecting():  {0:8.1f} us per query (old: {1:.1f} us)".format(
+        timeit(r.intersecting, *areas), timeit(old.intersecting, *areas)))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -159,12 +159,12 @@ lilypond_midi_variables = listmodel.ListModel(
 
 lilypond_contexts = listmodel.ListModel(sorted(ly.words.contexts))
 
-lilypond_grobs = listmodel.ListModel(ly.data.grobs())
+lilypond_grobs = listmodel.CompletionListModel(ly.data.grobs())
 
 lilypond_contexts_and_grobs = listmodel.ListModel(
     sorted(ly.words.contexts) + ly.data.grobs())
 
-lilypond_context_properties = listmodel.ListModel(
+lilypond_context_properties = listmodel.CompletionListModel(
     ly.data.context_properties())
 
 lilypond_contexts_and_properties = listmodel.ListModel(
@@ -208,8 +208,8 @@ def lilypond_grob_properties(grob):
     return listmodel.ListModel(ly.data.grob_properties(grob),
         display = lambda item: "#'" + item)
 
-lilypond_all_grob_properties = listmodel.ListModel(ly.data.all_grob_properties(),
-    display = lambda item: "#'" + item)
+lilypond_all_grob_properties = listmodel.CompletionListModel(
+    ly.data.all_grob_properties(), display = lambda item: "#'" + item)
 
 lilypond_markup_properties = listmodel.ListModel(
     sorted(set(sum(map(ly.data.grob_interface_properties, (
@@ -225,9 +225,9 @@ lilypond_clefs = listmodel.ListModel(ly.words.clefs_plain)
 
 lilypond_repeat_types = listmodel.ListModel(ly.words.repeat_types)
 
-music_glyphs = listmodel.ListModel(ly.data.music_glyphs())
+music_glyphs = listmodel.CompletionListModel(ly.data.music_glyphs())
 
-midi_instruments = listmodel.ListModel(ly.words.midi_instruments)
+midi_instruments = listmodel.CompletionListModel(ly.words.midi_instruments)
 
 language_names = listmodel.ListModel(sorted(ly.pitch.pitchInfo))
 
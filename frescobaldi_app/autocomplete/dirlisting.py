@@ -0,0 +1,176 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2011 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+"""
+Cached and watched listings of directories with LilyPond files.
+
+Used for the completion of \include file names. Directories are read in a
+background thread; the changed signal is emitted when a listing is ready.
+Listed directories are watched for changes using a QFileSystemWatcher. If a
+directory can't be watched, its modification time is checked now and then.
+"""
+
+from __future__ import unicode_literals
+
+import os
+import time
+
+from PyQt4.QtCore import QFileSystemWatcher, QThread, pyqtSignal
+
+import signals
+
+
+# emitted with the path when the listing of a directory is ready or updated
+changed = signals.Signal()
+
+# how often (in seconds) directories that can't be watched are checked
+poll_interval = 5.0
+
+# the listings: path -> (files, files and subdirectories), sorted
+_listings = {}
+
+# the running Lister threads, by path
+_listers = {}
+
+# the directories that can't be watched: path -> [mtime, last check]
+_polled = {}
+
+_watcher = None
+
+
+def listing(path, directories=False):
+    """Returns the sorted list of LilyPond file names in the directory.
+    
+    If directories is True, the names of subdirectories (ending with os.sep)
+    are included as well.
+    
+    If the directory has not been read before, it is read in the background,
+    the changed signal is emitted when done, and an empty list is returned.
+    
+    """
+    try:
+        files, names = _listings[path]
+    except KeyError:
+        _listings[path] = [], []
+        load(path)
+        return []
+    if path in _polled:
+        poll(path)
+    return names if directories else files
+
+
+def load(path):
+    """Reads the directory in a background thread (if not already busy)."""
+    if path not in _listers:
+        lister = _listers[path] = Lister(path)
+        lister.listed.connect(_slotListed)
+        lister.start()
+
+
+def poll(path):
+    """Reloads a directory that can't be watched if it has changed."""
+    mtime, checked = _polled[path]
+    now = time.time()
+    if now - checked > poll_interval:
+        _polled[path][1] = now
+        if modified(path) != mtime:
+            load(path)
+
+
+def modified(path):
+    """Returns the modification time of the directory, or None."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def watcher():
+    """Returns the QFileSystemWatcher that watches the listed directories."""
+    global _watcher
+    if _watcher is None:
+        _watcher = QFileSystemWatcher()
+        _watcher.directoryChanged.connect(load)
+    return _watcher
+
+
+def _slotListed(path, files, dirs):
+    """Called in the main thread when a Lister has read a directory."""
+    del _listers[path]
+    names = sorted(files + dirs)
+    files.sort()
+    _listings[path] = files, names
+    if path not in _polled:
+        w = watcher()
+        if path not in w.directories():
+            w.addPath(path)
+            if path not in w.directories():
+                _polled[path] = [modified(path), time.time()]
+    else:
+        _polled[path][0] = modified(path)
+    changed(path)
+
+
+def get_filenames(path):
+    """Returns two lists: LilyPond files and subdirectories in path.
+    
+    The subdirectories have an os.sep appended.
+    
+    """
+    files, dirs = [], []
+    try:
+        for root, dirnames, filenames in os.walk(path):
+            for f in filenames:
+                if f and f[0] not in '.~':
+                    name, ext = os.path.splitext(f)
+                    if ext.lower() in ('.ly', '.lyi', '.ily'):
+                        files.append(f)
+            for f in dirnames:
+                if f and not f.startswith('.'):
+                    dirs.append(f + os.sep)
+            break
+    except UnicodeDecodeError:
+        # this only happens when there are filenames in the wrong encoding,
+        # but never ever bug the user about this while typing :)
+        pass
+    return files, dirs
+
+
+class Lister(QThread):
+    """Reads a directory in the background."""
+    listed = pyqtSignal(object, object, object)
+    
+    def __init__(self, path):
+        super(Lister, self).__init__()
+        self.path = path
+        self._result = [], []
+        self.finished.connect(self.slotFinished)
+    
+    def run(self):
+        """Main method of this thread, called by Qt on start()."""
+        self._result = get_filenames(self.path)
+    
+    def slotFinished(self):
+        """Emits the listed signal with the path and the found names."""
+        files, dirs = self._result
+        self._result = [], []
+        self.listed.emit(self.path, files, dirs)
+
+
@@ -23,13 +23,17 @@ Completions data harvested from a Document.
 
 from __future__ import unicode_literals
 
+import functools
 import itertools
 import os
 
+from PyQt4.QtGui import QTextCursor
+
 import listmodel
 import plugin
 import ly.words
 
+from . import dirlisting
 from . import harvest
 from . import util
 
@@ -39,14 +43,122 @@ def doc(document):
     return DocumentDataSource.instance(document)
 
 
+def document_model(func):
+    """Decorates a DocumentDataSource method that harvests the whole document.
+    
+    The returned model is kept until the document changes.
+    
+    """
+    @functools.wraps(func)
+    def wrapper(self):
+        return self.cachedModel(func, None)
+    return wrapper
+
+
+def cursor_model(func):
+    """Decorates a DocumentDataSource method that harvests until the cursor.
+    
+    The method gets a cursor argument and should only look at the blocks
+    before the cursor's block. The returned model is kept for the cursor's
+    block until one of the blocks before it changes.
+    
+    """
+    @functools.wraps(func)
+    def wrapper(self, cursor):
+        return self.cachedModel(func, cursor.blockNumber())
+    return wrapper
+
+
+def include_model(func):
+    """Decorates a DocumentDataSource method that harvests until the cursor.
+    
+    Like cursor_model, but the model is also rebuilt when one of the files
+    included before the cursor changes on disk.
+    
+    """
+    @functools.wraps(func)
+    def wrapper(self, cursor):
+        return self.cachedModel(func, cursor.blockNumber(), include_mtimes(cursor))
+    return wrapper
+
+
+def include_mtimes(cursor):
+    """Returns a sorted tuple of (filename, mtime) for the files included before the cursor."""
+    mtimes = []
+    for filename in harvest.include_files(cursor):
+        try:
+            mtimes.append((filename, os.path.getmtime(filename)))
+        except (IOError, OSError):
+            pass
+    return tuple(sorted(mtimes))
+
+
+class Entry(object):
+    """A model cached by the DocumentDataSource."""
+    __slots__ = ('blockNumber', 'stamp', 'model', 'valid')
+    def __init__(self, blockNumber, stamp, model):
+        self.blockNumber = blockNumber
+        self.stamp = stamp
+        self.model = model
+        self.valid = True
+
+
 class DocumentDataSource(plugin.DocumentPlugin):
-    @util.keep
+    """Provides completion models with data harvested from a Document.
+    
+    The models are cached. When the document changes, the models that are
+    affected are marked invalid, and rebuilt when they are requested again.
+    
+    """
+    def __init__(self, document):
+        self._models = {}
+        self._includeModel = (), None
+        document.contentsChange.connect(self.slotContentsChange)
+    
+    def cachedModel(self, func, blockNumber, stamp=None):
+        """Returns the model func builds, using the cache if possible.
+        
+        blockNumber is None for models harvested from the whole document,
+        otherwise the number of the block until which is harvested.
+        If stamp is given, the cached model is only used if it was built
+        with the same stamp.
+        
+        """
+        entry = self._models.get(func.__name__)
+        if (entry and entry.valid and entry.blockNumber == blockNumber
+            and entry.stamp == stamp):
+            return entry.model
+        model = self.buildModel(func, blockNumber)
+        self._models[func.__name__] = Entry(blockNumber, stamp, model)
+        return model
+    
+    def buildModel(self, func, blockNumber):
+        """Calls func to build a model, with a cursor if blockNumber is not None."""
+        if blockNumber is None:
+            return func(self)
+        block = self.document().findBlockByNumber(blockNumber)
+        return func(self, QTextCursor(block))
+    
+    def slotContentsChange(self, position, removed, added):
+        """Called when the document changes, invalidates the affected models."""
+        changed = None
+        for entry in self._models.values():
+            if not entry.valid:
+                continue
+            if entry.blockNumber is not None:
+                if changed is None:
+                    changed = self.document().findBlock(position).blockNumber()
+                if changed >= entry.blockNumber:
+                    continue
+            entry.valid = False
+
+    @document_model
     def words(self):
         """Returns the list of words in comments, markup etc."""
-        return listmodel.ListModel(
+        return listmodel.CompletionListModel(
             sorted(set(harvest.words(self.document()))))
 
-    @util.keep
+    @document_model
     def schemewords(self):
         """Scheme names, including those harvested from document."""
         schemewords = set(itertools.chain(
@@ -56,18 +168,18 @@ class DocumentDataSource(plugin.DocumentPlugin):
                 for t in harvest.schemewords(self.document())
                 if len(t) > 2),
             ))
-        return listmodel.ListModel(sorted(schemewords))
+        return listmodel.CompletionListModel(sorted(schemewords))
 
-    @util.keep
+    @document_model
     def markup(self):
         """Completes markup commands and normal text from the document."""
-        return listmodel.ListModel(
+        return listmodel.CompletionListModel(
             ['\\' + w for w in sorted(ly.words.markupcommands)]
             + sorted(set(harvest.words(self.document()))))
 
-    @util.keep
+    @include_model
     def musiccommands(self, cursor):
-        return listmodel.ListModel(sorted(set(itertools.chain(
+        return listmodel.CompletionListModel(sorted(set(itertools.chain(
             ly.words.lilypond_keywords,
             ly.words.lilypond_music_commands,
             ly.words.articulations,
@@ -78,7 +190,7 @@ class DocumentDataSource(plugin.DocumentPlugin):
             harvest.include_identifiers(cursor),
             harvest.names(cursor)))), display = util.command)
 
-    @util.keep
+    @cursor_model
     def lyriccommands(self, cursor):
         return listmodel.ListModel(sorted(set(itertools.chain(
             ('set stanza = ', 'set', 'override', 'markup', 'notemode'),
@@ -93,53 +205,66 @@ class DocumentDataSource(plugin.DocumentPlugin):
         Then looks in the user-set include paths, and finally in LilyPond's
         own ly/ folder.
         
+        The directory listings are cached. Directories that were not read
+        before are read in the background; the returned model is updated
+        when their listings are ready.
+        
         """
-        names = []
+        roots = self.includeroots(directory)
+        model = listmodel.ListModel(self.includenamesList(roots))
+        self._includeModel = roots, model
+        dirlisting.changed.connect(self.slotListingChanged)
+        return model
+    
+    def includeroots(self, directory=None):
+        """Returns a tuple of (path, prefix, kind) tuples to find include files.
+        
+        kind is 'local' for the document's directory (where subdirectories
+        are also listed), 'include' for the include paths and 'lilypond' for
+        LilyPond's own ly/ folder. prefix is prepended to the found names.
+        
+        """
+        roots = []
         # names in current dir
         path = self.document().url().toLocalFile()
         if path:
             basedir = os.path.dirname(path)
             if directory:
-                basedir = os.path.join(basedir, directory)
-                names.extend(sorted(os.path.join(directory, f)
-                    for f in get_filenames(basedir, True)))
+                roots.append((os.path.join(basedir, directory), directory, 'local'))
             else:
-                names.extend(sorted(get_filenames(basedir, True)))
+                roots.append((basedir, '', 'local'))
         
         # names in specified include paths
         import documentinfo
         for basedir in documentinfo.info(self.document()).includepath():
-            names.extend(sorted(get_filenames(basedir)))
+            roots.append((basedir, '', 'include'))
         
         # names from LilyPond itself
         import engrave.command
         datadir = engrave.command.info(self.document()).datadir()
         if datadir:
-            basedir = os.path.join(datadir, 'ly')
-            # get the filenames but avoid the -init files here
-            names.extend(sorted(f for f in get_filenames(basedir)
-                if not f.endswith('init.ly')
-                and f.islower()))
-        
-        return listmodel.ListModel(names)
-
-
-def get_filenames(path, directories = False):
-    try:
-        for root, dirs, files in os.walk(path):
-            for f in files:
-                if f and f[0] not in '.~':
-                    name, ext = os.path.splitext(f)
-                    if ext.lower() in ('.ly', '.lyi', '.ily'):
-                        yield f
-            if directories:
-                for f in dirs:
-                    if f and not f.startswith('.'):
-                        yield f + os.sep
-            return
-    except UnicodeDecodeError:
-        # this only happens when there are filenames in the wrong encoding,
-        # but never ever bug the user about this while typing :)
-        pass
+            roots.append((os.path.join(datadir, 'ly'), '', 'lilypond'))
+        return tuple(roots)
+    
+    def includenamesList(self, roots):
+        """Returns the list of file names found in the roots."""
+        names = []
+        for basedir, prefix, kind in roots:
+            listing = dirlisting.listing(basedir, kind == 'local')
+            if prefix:
+                names.extend(os.path.join(prefix, f) for f in listing)
+            elif kind == 'lilypond':
+                # avoid the -init files here
+                names.extend(f for f in listing
+                    if not f.endswith('init.ly') and f.islower())
+            else:
+                names.extend(listing)
+        return names
+    
+    def slotListingChanged(self, path):
+        """Called when a directory listing is ready, updates the model."""
+        roots, model = self._includeModel
+        if any(path == basedir for basedir, prefix, kind in roots):
+            model.setItems(self.includenamesList(roots))
 
 
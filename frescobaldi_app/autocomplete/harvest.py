@@ -32,17 +32,12 @@ import tokeniter
 import ly.lex.lilypond
 import ly.lex.scheme
 
+from . import symboltable
+
 
 def names(cursor):
     """Harvests names from assignments until the cursor."""
-    end = cursor.block()
-    block = cursor.document().firstBlock()
-    while block.isValid() and block != end:
-        for t in tokeniter.tokens(block)[:2]:
-            if type(t) is ly.lex.lilypond.Name:
-                yield t
-                break
-        block = block.next()
+    return symboltable.table(cursor.document()).names(cursor.blockNumber())
 
 
 def schemewords(document):
@@ -52,21 +47,18 @@ def schemewords(document):
             yield t
 
 
-def include_identifiers(cursor):
-    """Harvests identifier definitions from included files."""
-    def tokens():
-        end = cursor.block()
-        block = cursor.document().firstBlock()
-        while block < end:
-            yield tokeniter.tokens(block)
-            block = block.next()
-    
-    includeargs = ly.parse.includeargs(itertools.chain.from_iterable(tokens()))
+def include_files(cursor):
+    """Returns the set of files included before the cursor."""
+    includeargs = symboltable.table(cursor.document()).includeargs(cursor.blockNumber())
     dinfo = documentinfo.info(cursor.document())
     fname = cursor.document().url().toLocalFile()
-    files = fileinfo.includefiles(fname, dinfo.includepath(), includeargs)
+    return fileinfo.includefiles(fname, dinfo.includepath(), includeargs)
+
+
+def include_identifiers(cursor):
+    """Harvests identifier definitions from included files."""
     return itertools.chain.from_iterable(fileinfo.FileInfo.info(f).names()
-                                         for f in files)
+                                         for f in include_files(cursor))
 
 
 _words = re.compile(r'\w{5,}|\w{2,}(?:[:-]\w+)+').finditer
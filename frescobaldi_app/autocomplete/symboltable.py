@@ -0,0 +1,191 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2011 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+"""
+A per-document table of the assignments and includes, used for completion.
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+import itertools
+
+import cursortools
+import highlighter
+import plugin
+import tokeniter
+import ly.lex
+import ly.lex.lilypond
+
+
+def table(document):
+    """Returns the SymbolTable for the document."""
+    return SymbolTable.instance(document)
+
+
+class SymbolTable(plugin.DocumentPlugin):
+    """Keeps the names that are assigned to and the files that are included.
+    
+    The table is kept in sync with the tokens of the highlighter. When the
+    document changes, only the changed blocks are read again, plus the blocks
+    after them as long as the highlighter's state at their start changed.
+    
+    The names and include arguments are kept in lists sorted by block number,
+    so the ones defined before a block are found by bisecting. An include
+    argument may start on a later line than its \\include command, it is
+    then stored with the block where the argument ends.
+    
+    """
+    def __init__(self, document):
+        self._highlighter = highlighter.highlighter(document)
+        self._generation = -1
+        self._blockCount = 0
+        self._nameBlocks = []
+        self._names = []
+        self._includeBlocks = []
+        self._includes = []
+        document.contentsChange.connect(self.slotContentsChange)
+    
+    def names(self, blockNumber):
+        """Returns the list of names assigned to in blocks before blockNumber."""
+        self.update()
+        return self._names[:bisect.bisect_left(self._nameBlocks, blockNumber)]
+    
+    def includeargs(self, blockNumber):
+        """Returns the arguments of \\include commands before blockNumber."""
+        self.update()
+        index = bisect.bisect_left(self._includeBlocks, blockNumber)
+        return list(itertools.chain.from_iterable(self._includes[:index]))
+    
+    def update(self):
+        """Reads the whole document if the highlighter fully rehighlighted it."""
+        if self._generation != self._highlighter.generation():
+            # make sure there are tokens
+            tokeniter.tokens(self.document().firstBlock())
+            self._generation = self._highlighter.generation()
+            del self._nameBlocks[:], self._names[:]
+            del self._includeBlocks[:], self._includes[:]
+            self._blockCount = self.document().blockCount()
+            self.scan(self.document().firstBlock(), self._blockCount - 1)
+    
+    def slotContentsChange(self, position, removed, added):
+        """Called after the highlighter has processed a change in the document."""
+        if self._generation != self._highlighter.generation():
+            return # the whole document will be read again anyway
+        document = self.document()
+        first = document.findBlock(position)
+        start = first.blockNumber()
+        # the same range the highlighter rehighlights
+        end = document.findBlock(position + added + bool(removed)).blockNumber()
+        blockCount = document.blockCount()
+        delta, self._blockCount = blockCount - self._blockCount, blockCount
+        for blocks, values in (
+            (self._nameBlocks, self._names),
+            (self._includeBlocks, self._includes)):
+            # remove the entries of the changed blocks, and renumber the others
+            i = bisect.bisect_left(blocks, start)
+            j = bisect.bisect_right(blocks, end - delta)
+            del blocks[i:j], values[i:j]
+            if delta:
+                for k in range(i, len(blocks)):
+                    blocks[k] += delta
+        self.scan(first, end)
+    
+    def scan(self, block, end):
+        """Reads the blocks from block up to and including block number end.
+        
+        Reading continues after end while the state at the end of the
+        previous block differs from the last time it was read, because the
+        highlighter then has changed the tokens of the following block as well.
+        The same holds for an \\include command that is not complete at the
+        end of a block.
+        
+        """
+        pending = None
+        if block.previous().isValid():
+            data = cursortools.data(block.previous())
+            pending = getattr(data, 'symbolState', (None, None))[1]
+        changed = True
+        while block.isValid():
+            num = block.blockNumber()
+            if num > end and not changed:
+                break
+            data = cursortools.data(block)
+            pending = self.read(num, tokeniter.tokens(block), pending)
+            state = (block.userState(), pending)
+            changed = getattr(data, 'symbolState', None) != state
+            data.symbolState = state
+            block = block.next()
+    
+    def read(self, num, tokens, pending=None):
+        """Updates the entries for block number num from its tokens.
+        
+        pending is the unfinished \\include command at the end of the previous
+        block, see includeargs(). Returns the one at the end of this block.
+        
+        """
+        name = None
+        for t in tokens[:2]:
+            if type(t) is ly.lex.lilypond.Name:
+                name = t
+                break
+        includes, pending = includeargs(tokens, pending)
+        for blocks, values, value in (
+            (self._nameBlocks, self._names, name),
+            (self._includeBlocks, self._includes, includes)):
+            i = bisect.bisect_left(blocks, num)
+            if i < len(blocks) and blocks[i] == num:
+                if value:
+                    values[i] = value
+                else:
+                    del blocks[i], values[i]
+            elif value:
+                blocks.insert(i, num)
+                values.insert(i, value)
+        return pending
+
+
+def includeargs(tokens, pending=None):
+    """Returns the arguments of the \\include commands in the tokens of a block.
+    
+    Reads the tokens like ly.parse.includeargs(), but returns a tuple
+    (args, pending), where pending describes an \\include command that is
+    not complete at the end of the tokens: None if there is none, a one-tuple
+    if the argument has not started yet, or a two-tuple with the text read so
+    far if the argument string is not finished. Give pending to the call for
+    the next block to continue reading.
+    
+    """
+    args = []
+    for t in tokens:
+        if pending is None:
+            if isinstance(t, ly.lex.lilypond.Keyword) and t == "\\include":
+                pending = ('\\include',)
+        elif len(pending) == 1:
+            if not isinstance(t, (ly.lex.Space, ly.lex.Comment)):
+                pending = ('"', '') if t == '"' else None
+        elif t == '"':
+            args.append(pending[1])
+            pending = None
+        else:
+            pending = ('"', pending[1] + t)
+    return args, pending
+
+
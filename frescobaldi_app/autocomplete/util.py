@@ -23,31 +23,6 @@ Utility functions used in the autocomplete package.
 
 from __future__ import unicode_literals
 
-import functools
-import time
-import weakref
-
-
-def keep(f):
-    """Returns a decorator that remembers its return value for some time."""
-    _delay = 5.0 # sec
-    _cache = weakref.WeakKeyDictionary()
-    @functools.wraps(f)
-    def decorator(self, *args):
-        try:
-            result = _cache[self]
-        except KeyError:
-            pass
-        else:
-            t, ret = result
-            if (time.time() - t) < _delay:
-                return ret
-        ret = f(self, *args)
-        _cache[self] = (time.time(), ret)
-        return ret
-    return decorator
-
-
 # helper functions for displaying data from models
 def command(item):
     """Prepends '\\' to item."""
@@ -182,6 +182,7 @@ class Highlighter(QSyntaxHighlighter, plugin.Plugin):
     
     """
     def __init__(self, document):
+        self._generation = 0
         QSyntaxHighlighter.__init__(self, document)
         self._fridge = ly.lex.Fridge()
         app.settingsChanged.connect(self.rehighlight)
@@ -244,6 +245,21 @@ class Highlighter(QSyntaxHighlighter, plugin.Plugin):
                 if f:
                     setFormat(f)
         
+    def rehighlight(self):
+        """Reimplemented to count the times the whole document is rehighlighted."""
+        self._generation += 1
+        QSyntaxHighlighter.rehighlight(self)
+    
+    def generation(self):
+        """Return the number of times the whole document has been rehighlighted.
+        
+        Other tokens than before may result from a full rehighlight (e.g.
+        when the mode changed), while on editing the document only the
+        changed blocks, and the blocks whose state changed, are rehighlighted.
+        
+        """
+        return self._generation
+        
     def setHighlighting(self, enable):
         """Enable or disable highlighting."""
         changed = enable != self._highlighting
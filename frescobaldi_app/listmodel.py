@@ -22,8 +22,15 @@ Simple readonly subclass of QAbstractListModel around a Python sequence.
 
 Functions are used to present the data from an item for a role.
 There are some predefined functions to use in this module.
+
+The CompletionListModel filters itself on a completion prefix, for use
+with widgets.completer.Completer.
 """
 
+import bisect
+import itertools
+import re
+
 from PyQt4.QtCore import QAbstractListModel, Qt
 
 
@@ -105,5 +112,101 @@ class ListModel(QAbstractListModel):
         self.dataChanged.emit(
             self.createIndex(0, 0),
             self.createIndex(len(self._data) - 1, 0))
+    
+    def setItems(self, data):
+        """Replaces the list of items, resetting the model."""
+        self.beginResetModel()
+        self._data = data
+        self.endResetModel()
+
+
+class CompletionListModel(ListModel):
+    """A ListModel that filters itself on a completion prefix.
+    
+    The items are kept sorted on the text they complete to (the EditRole),
+    so the items that start with a prefix are found by bisecting, instead
+    of testing every item on every keystroke.
+    
+    setCompletionPrefix() first selects the items starting with the prefix,
+    then those starting with the prefix when case is ignored, and then the
+    items that start with the first character and contain the other
+    characters of the prefix in the same order (fuzzy matching).
+    
+    The matching items are found lazily, and at most limit of them are shown;
+    typing more characters narrows the list.
+    
+    The _data attribute contains the shown items, the full sorted list
+    of items is in the _items attribute.
+    
+    """
+    limit = 100
+    
+    def __init__(self, data, parent=None, display=display, edit=None, tooltip=None, icon=None):
+        super(CompletionListModel, self).__init__([], parent, display, edit, tooltip, icon)
+        self._prefix = ""
+        self.setItems(data)
+    
+    def setItems(self, data):
+        """Replaces the list of items, and shows the ones matching the current prefix."""
+        data = list(data)
+        key = self._roles.get(Qt.EditRole) or (lambda item: item)
+        keys = sorted((key(item), i) for i, item in enumerate(data))
+        self._items = [data[i] for k, i in keys]
+        self._keys = [k for k, i in keys]
+        lower = sorted((k.lower(), i) for i, k in enumerate(self._keys))
+        self._lowerKeys = [k for k, i in lower]
+        self._lowerIndex = [i for k, i in lower]
+        self.beginResetModel()
+        self._data = self._match(self._prefix)
+        self.endResetModel()
+    
+    def setCompletionPrefix(self, prefix):
+        """Shows the items matching prefix, the best matches first."""
+        if prefix == self._prefix:
+            return
+        self._prefix = prefix
+        self.beginResetModel()
+        self._data = self._match(prefix)
+        self.endResetModel()
+    
+    def completionPrefix(self):
+        """Returns the prefix set with setCompletionPrefix()."""
+        return self._prefix
+    
+    def matches(self, prefix):
+        """Yields the indices in the sorted items that match the prefix."""
+        keys = self._keys
+        if not prefix:
+            for i in range(len(keys)):
+                yield i
+            return
+        # the items starting with the prefix
+        start, end = _prefixrange(keys, prefix)
+        for i in range(start, end):
+            yield i
+        # the items starting with the prefix, ignoring case
+        lower = prefix.lower()
+        lstart, lend = _prefixrange(self._lowerKeys, lower)
+        for j in range(lstart, lend):
+            i = self._lowerIndex[j]
+            if not start <= i < end:
+                yield i
+        # the items containing the characters of the prefix in order
+        if len(lower) > 1:
+            match = re.compile('.*?'.join(map(re.escape, lower)), re.DOTALL).match
+            for j in range(*_prefixrange(self._lowerKeys, lower[0])):
+                if not lstart <= j < lend and match(self._lowerKeys[j]):
+                    yield self._lowerIndex[j]
+    
+    def _match(self, prefix):
+        """Returns a list with at most limit items matching the prefix."""
+        return [self._items[i] for i in
+            itertools.islice(self.matches(prefix), self.limit)]
+
+
+def _prefixrange(keys, prefix):
+    """Returns the (start, end) range of the sorted keys starting with prefix."""
+    return (bisect.bisect_left(keys, prefix),
+            bisect.bisect_left(keys, prefix + u'\uffff'))
 
 
@@ -19,14 +19,18 @@
 
 """
 Query functions to get data from the LilyPond-generated _data.py module.
+
+The sorted lists and reverse lookups are precomputed in the _index.py module,
+which is generated from _data.py by makeindex.py (see the Makefile).
+Both modules are only imported when first needed.
+
+The returned lists should not be modified.
 """
 
 def grob_properties(grob):
     """Returns the list of properties the named grob supports."""
-    from . import _data
-    return sorted(uniq(prop
-        for iface in _data.grobs.get(grob, [])
-        for prop in _data.interfaces[iface]))
+    from . import _index
+    return _index.grobproperties.get(grob, [])
 
 def grob_properties_with_interface(grob):
     """Returns a list of two-tuples (property, interface)."""
@@ -46,8 +50,8 @@ def grob_interfaces(grob, prop=None):
     ifaces = _data.grobs.get(grob, [])
     if prop is None:
         return ifaces
-    return [iface for iface in ifaces
-            if prop in grob_interface_properties(iface)]
+    defining = grob_interfaces_for_property(prop)
+    return [iface for iface in ifaces if iface in defining]
 
 def grob_interface_properties(iface):
     """Returns the list of properties an interface supports."""
@@ -60,20 +64,18 @@ def grob_interfaces_for_property(prop):
     Most times returns one, but several interface names may be returned.
     
     """
-    from . import _data
-    return [iface
-        for iface, props in _data.interfaces.items()
-        if prop in props]
+    from . import _index
+    return _index.propertyinterfaces.get(prop, [])
 
 def grobs():
     """Returns the sorted list of all grob names."""
-    from . import _data
-    return sorted(_data.grobs.keys())
+    from . import _index
+    return _index.grobnames
     
 def all_grob_properties():
-    """Returns the list of all properties."""
-    from . import _data
-    return sorted(uniq(sum(_data.interfaces.values(), [])))
+    """Returns the sorted list of all properties."""
+    from . import _index
+    return _index.allgrobproperties
 
 def context_properties():
     """Returns the list of context properties."""
@@ -82,6 +84,7 @@ def context_properties():
 
 def engravers():
     """Returns the list of engravers and performers."""
+    from . import _data
     return _data.engravers
 
 def music_glyphs():
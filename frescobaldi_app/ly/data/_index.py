@@ -0,0 +1,384 @@
+#! python
+# generated by makeindex.py from _data.py (LilyPond 2.14.1)
+
+grobnames = ["Accidental", "AccidentalCautionary", "AccidentalPlacement", "AccidentalSuggestion", "Ambitus", "AmbitusAccidental", "AmbitusLine", "AmbitusNoteHead", "Arpeggio", "BalloonTextItem", "BarLine", "BarNumber", "BassFigure", "BassFigureAlignment", "BassFigureAlignmentPositioning", "BassFigureBracket", "BassFigureContinuation", "BassFigureLine", "Beam", "BendAfter", "BreakAlignGroup", "BreakAlignment", "BreathingSign", "ChordName", "Clef", "ClusterSpanner", "ClusterSpannerBeacon", "CombineTextScript", "CueClef", "CueEndClef", "Custos", "DotColumn", "Dots", "DoublePercentRepeat", "DoublePercentRepeatCounter", "DoubleRepeatSlash", "DynamicLineSpanner", "DynamicText", "DynamicTextSpanner", "Episema", "Fingering", "FootnoteItem", "FootnoteSpanner", "FretBoard", "Glissando", "GraceSpacing", "GridLine", "GridPoint", "Hairpin", "HorizontalBracket", "InstrumentName", "InstrumentSwitch", "KeyCancellation", "KeySignature", "LaissezVibrerTie", "LaissezVibrerTieColumn", "LedgerLineSpanner", "LeftEdge", "LigatureBracket", "LyricExtender", "LyricHyphen", "LyricSpace", "LyricText", "MeasureGrouping", "MelodyItem", "MensuralLigature", "MetronomeMark", "MultiMeasureRest", "MultiMeasureRestNumber", "MultiMeasureRestText", "NonMusicalPaperColumn", "NoteCollision", "NoteColumn", "NoteHead", "NoteName", "NoteSpacing", "OctavateEight", "OttavaBracket", "PaperColumn", "ParenthesesItem", "PercentRepeat", "PercentRepeatCounter", "PhrasingSlur", "PianoPedalBracket", "RehearsalMark", "RepeatSlash", "RepeatTie", "RepeatTieColumn", "Rest", "RestCollision", "Script", "ScriptColumn", "ScriptRow", "Slur", "SostenutoPedal", "SostenutoPedalLineSpanner", "SpacingSpanner", "SpanBar", "StaffGrouper", "StaffSpacing", "StaffSymbol", "StanzaNumber", "Stem", "StemTremolo", "StringNumber", "StrokeFinger", "SustainPedal", "SustainPedalLineSpanner", "System", "SystemStartBar", "SystemStartBrace", "SystemStartBracket", "SystemStartSquare", "TabNoteHead", "TextScript", "TextSpanner", "Tie", "TieColumn", "TimeSignature", "TrillPitchAccidental", "TrillPitchGroup", "TrillPitchHead", "TrillSpanner", "TupletBracket", "TupletNumber", "UnaCordaPedal", "UnaCordaPedalLineSpanner", "VaticanaLigature", "VerticalAlignment", "VerticalAxisGroup", "VoiceFollower", "VoltaBracket", "VoltaBracketSpanner"]
+
+allgrobproperties = ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "align-dir", "allow-loose-spacing", "allow-span-bar", "alteration", "alteration-alist", "annotation", "annotation-balloon", "annotation-line", "arpeggio-direction", "arrow-length", "arrow-width", "auto-knee-gap", "average-spacing-wishes", "avoid-note-head", "avoid-slur", "axes", "base-shortest-duration", "baseline-skip", "beam-thickness", "beam-width", "beamed-stem-shorten", "beaming", "beamlet-default-length", "beamlet-max-length-proportion", "before-line-breaking", "between-cols", "bound-details", "bound-padding", "bracket-flare", "bracket-visibility", "break-align-anchor", "break-align-anchor-alignment", "break-align-orders", "break-align-symbol", "break-align-symbols", "break-overshoot", "break-visibility", "breakable", "c0-position", "circled-tip", "clip-edges", "collapse-height", "collision-interfaces", "collision-voice-only", "color", "common-shortest-duration", "concaveness", "connect-to-neighbor", "control-points", "cross-staff", "damping", "dash-definition", "dash-fraction", "dash-period", "default-direction", "default-staff-staff-spacing", "details", "digit-names", "direction", "dot-count", "dot-negative-kern", "dot-placement-list", "duration-log", "eccentricity", "edge-height", "edge-text", "expand-limit", "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset", "extra-spacing-height", "extra-spacing-width", "flag", "flag-count", "flag-style", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "footnote-text", "force-hshift", "fraction", "french-beaming", "fret-diagram-details", "full-length-padding", "full-length-to-extent", "full-measure-extra-space", "full-size-change", "gap", "gap-count", "glyph", "glyph-name", "glyph-name-alist", "graphical", "grow-direction", "hair-thickness", "harp-pedal-details", "head-direction", "height", "height-limit", "hide-tied-accidental-after-break", "horizontal-shift", "horizontal-skylines", "ignore-collision", "implicit", "inspect-index", "inspect-quants", "keep-inside-line", "kern", "knee", "knee-spacing-correction", "labels", "layer", "ledger-line-thickness", "left-bound-info", "left-padding", "length", "length-fraction", "line-break-penalty", "line-break-permission", "line-break-system-details", "line-count", "line-positions", "line-thickness", "long-text", "max-beam-connect", "max-stretch", "measure-count", "measure-length", "merge-differently-dotted", "merge-differently-headed", "minimum-X-extent", "minimum-Y-extent", "minimum-distance", "minimum-length", "minimum-length-fraction", "minimum-space", "neutral-direction", "neutral-position", "next", "no-alignment", "no-ledgers", "no-stem-extend", "non-break-align-symbols", "non-default", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "note-names", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "packed-spacing", "padding", "padding-pairs", "page-break-penalty", "page-break-permission", "page-turn-penalty", "page-turn-permission", "parenthesized", "positioning-done", "positions", "prefer-dotted-right", "ratio", "remove-empty", "remove-first", "restore-first", "rhythmic-location", "right-bound-info", "right-padding", "rotation", "same-direction-correction", "script-priority", "self-alignment-X", "self-alignment-Y", "shorten-pair", "shortest-duration-space", "shortest-playing-duration", "shortest-starter-duration", "side-axis", "side-relative-direction", "size", "skyline-horizontal-padding", "skyline-vertical-padding", "slash-negative-kern", "slope", "slur-padding", "space-alist", "space-to-barline", "spacing-increment", "spacing-pair", "springs-and-rods", "stacking-dir", "staff-affinity", "staff-padding", "staff-position", "staff-space", "staff-staff-spacing", "staffgroup-staff-spacing", "stem-attachment", "stem-end-position", "stem-spacing-correction", "stemlet-length", "stencil", "stencils", "strict-grace-spacing", "strict-note-spacing", "stroke-style", "style", "text", "text-direction", "thick-thickness", "thickness", "thin-kern", "tie-configuration", "to-barline", "toward-stem-shift", "transparent", "uniform-stretching", "used", "vertical-skylines", "when", "whiteout", "width", "word-space", "zigzag-length", "zigzag-width"]
+
+grobproperties = {
+    "Accidental": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "alteration", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name-alist", "hide-tied-accidental-after-break", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "parenthesized", "restore-first", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "AccidentalCautionary": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "alteration", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name-alist", "hide-tied-accidental-after-break", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "parenthesized", "restore-first", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "AccidentalPlacement": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "positioning-done", "right-padding", "rotation", "script-priority", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "AccidentalSuggestion": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "alteration", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name-alist", "hide-tied-accidental-after-break", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "parenthesized", "positioning-done", "restore-first", "rotation", "script-priority", "self-alignment-X", "self-alignment-Y", "side-axis", "side-relative-direction", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "toward-stem-shift", "transparent", "whiteout"],
+    "Ambitus": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "gap", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "thickness", "transparent", "vertical-skylines", "whiteout"],
+    "AmbitusAccidental": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "alteration", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name-alist", "hide-tied-accidental-after-break", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "parenthesized", "restore-first", "rotation", "side-axis", "slur-padding", "space-alist", "springs-and-rods", "staff-padding", "stencil", "transparent", "whiteout"],
+    "AmbitusLine": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "AmbitusNoteHead": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "duration-log", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent", "no-ledgers", "non-musical", "note-names", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-position", "stem-attachment", "stencil", "style", "thickness", "transparent", "whiteout"],
+    "Arpeggio": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arpeggio-direction", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "dash-definition", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "positions", "rotation", "script-priority", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "staff-position", "stencil", "transparent", "whiteout"],
+    "BalloonTextItem": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "annotation-balloon", "annotation-line", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "BarLine": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "allow-span-bar", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "glyph", "glyph-name", "hair-thickness", "kern", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "stencil", "thick-thickness", "thin-kern", "transparent", "whiteout"],
+    "BarNumber": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-align-symbols", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-break-align-symbols", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "BassFigure": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "implicit", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "BassFigureAlignment": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "align-dir", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "positioning-done", "rotation", "springs-and-rods", "stacking-dir", "staff-affinity", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "BassFigureAlignmentPositioning": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "BassFigureBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "bracket-flare", "break-visibility", "color", "cross-staff", "edge-height", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "shorten-pair", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "BassFigureContinuation": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "BassFigureLine": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "Beam": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "annotation", "auto-knee-gap", "avoid-slur", "beam-thickness", "beamed-stem-shorten", "beaming", "before-line-breaking", "break-overshoot", "breakable", "clip-edges", "collision-interfaces", "collision-voice-only", "color", "concaveness", "cross-staff", "damping", "details", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "gap-count", "grow-direction", "inspect-quants", "knee", "layer", "length-fraction", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "neutral-direction", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positions", "rotation", "springs-and-rods", "staff-position", "stencil", "to-barline", "transparent", "whiteout"],
+    "BendAfter": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "BreakAlignGroup": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "transparent", "vertical-skylines", "whiteout"],
+    "BreakAlignment": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "break-align-orders", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "rotation", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "transparent", "vertical-skylines", "whiteout"],
+    "BreathingSign": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "ChordName": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "Clef": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "full-size-change", "glyph", "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent", "non-default", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "staff-position", "stencil", "transparent", "whiteout"],
+    "ClusterSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "style", "to-barline", "transparent", "whiteout"],
+    "ClusterSpannerBeacon": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positions", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "CombineTextScript": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "script-priority", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "CueClef": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "full-size-change", "glyph", "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent", "non-default", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "staff-position", "stencil", "transparent", "whiteout"],
+    "CueEndClef": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "full-size-change", "glyph", "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent", "non-default", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "staff-position", "stencil", "transparent", "whiteout"],
+    "Custos": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "neutral-direction", "neutral-position", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "staff-position", "stencil", "style", "transparent", "whiteout"],
+    "DotColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "rotation", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "transparent", "vertical-skylines", "whiteout"],
+    "Dots": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "dot-count", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-position", "stencil", "style", "transparent", "whiteout"],
+    "DoublePercentRepeat": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "dot-negative-kern", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "slash-negative-kern", "slope", "space-alist", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "DoublePercentRepeatCounter": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "dot-negative-kern", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slash-negative-kern", "slope", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "thickness", "transparent", "whiteout", "word-space"],
+    "DoubleRepeatSlash": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "dot-negative-kern", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "slash-negative-kern", "slope", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "DynamicLineSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "DynamicText": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "right-padding", "rotation", "script-priority", "self-alignment-X", "self-alignment-Y", "side-relative-direction", "slur-padding", "springs-and-rods", "stencil", "text", "text-direction", "toward-stem-shift", "transparent", "whiteout", "word-space"],
+    "DynamicTextSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "baseline-skip", "before-line-breaking", "bound-details", "color", "cross-staff", "dash-fraction", "dash-period", "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "layer", "left-bound-info", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "right-bound-info", "rotation", "springs-and-rods", "stencil", "style", "text", "text-direction", "thickness", "to-barline", "transparent", "whiteout", "word-space", "zigzag-length", "zigzag-width"],
+    "Episema": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bound-details", "color", "cross-staff", "dash-fraction", "dash-period", "direction", "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "layer", "left-bound-info", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "right-bound-info", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "Fingering": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "script-priority", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "FootnoteItem": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "annotation-balloon", "annotation-line", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "footnote-text", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "FootnoteSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "annotation-balloon", "annotation-line", "avoid-slur", "baseline-skip", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "footnote-text", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "text", "text-direction", "to-barline", "transparent", "whiteout", "word-space"],
+    "FretBoard": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "align-dir", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "dot-placement-list", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "fret-diagram-details", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "size", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "Glissando": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bound-details", "breakable", "color", "cross-staff", "dash-fraction", "dash-period", "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset", "gap", "layer", "left-bound-info", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "right-bound-info", "rotation", "springs-and-rods", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "GraceSpacing": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "common-shortest-duration", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "shortest-duration-space", "spacing-increment", "springs-and-rods", "stencil", "to-barline", "transparent", "whiteout"],
+    "GridLine": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "GridPoint": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "Hairpin": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bound-padding", "circled-tip", "color", "cross-staff", "dash-fraction", "dash-period", "extra-X-extent", "extra-Y-extent", "extra-offset", "grow-direction", "height", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "HorizontalBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bracket-flare", "color", "connect-to-neighbor", "cross-staff", "dash-fraction", "dash-period", "direction", "edge-height", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "shorten-pair", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "InstrumentName": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "long-text", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "to-barline", "transparent", "whiteout"],
+    "InstrumentSwitch": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "KeyCancellation": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "alteration-alist", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "c0-position", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name-alist", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "padding-pairs", "rotation", "space-alist", "springs-and-rods", "staff-position", "stencil", "transparent", "whiteout"],
+    "KeySignature": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "alteration-alist", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "c0-position", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name-alist", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "padding-pairs", "rotation", "space-alist", "springs-and-rods", "staff-position", "stencil", "transparent", "whiteout"],
+    "LaissezVibrerTie": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "control-points", "cross-staff", "details", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "head-direction", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "LaissezVibrerTieColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "head-direction", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "rotation", "springs-and-rods", "stencil", "tie-configuration", "transparent", "whiteout"],
+    "LedgerLineSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "gap", "layer", "length-fraction", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-length-fraction", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "LeftEdge": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "LigatureBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bracket-flare", "bracket-visibility", "break-overshoot", "color", "connect-to-neighbor", "control-points", "cross-staff", "dash-fraction", "dash-period", "direction", "edge-height", "edge-text", "extra-X-extent", "extra-Y-extent", "extra-offset", "full-length-padding", "full-length-to-extent", "gap", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "positions", "rotation", "shorten-pair", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "LyricExtender": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "left-padding", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "next", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "right-padding", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "LyricHyphen": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "dash-period", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "height", "layer", "length", "minimum-X-extent", "minimum-Y-extent", "minimum-distance", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "LyricSpace": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "dash-period", "extra-X-extent", "extra-Y-extent", "extra-offset", "height", "layer", "length", "minimum-X-extent", "minimum-Y-extent", "minimum-distance", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "LyricText": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "MeasureGrouping": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "height", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout"],
+    "MelodyItem": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "neutral-direction", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "MensuralLigature": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "MetronomeMark": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-align-symbols", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-break-align-symbols", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "MultiMeasureRest": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "bound-padding", "color", "cross-staff", "direction", "expand-limit", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "hair-thickness", "layer", "measure-count", "minimum-X-extent", "minimum-Y-extent", "minimum-distance", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "spacing-pair", "springs-and-rods", "staff-position", "stencil", "style", "thick-thickness", "to-barline", "transparent", "whiteout"],
+    "MultiMeasureRestNumber": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "bound-padding", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "to-barline", "transparent", "whiteout", "word-space"],
+    "MultiMeasureRestText": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "bound-padding", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "to-barline", "transparent", "whiteout", "word-space"],
+    "NonMusicalPaperColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "allow-loose-spacing", "avoid-slur", "axes", "before-line-breaking", "between-cols", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "full-measure-extra-space", "horizontal-skylines", "keep-inside-line", "labels", "layer", "line-break-penalty", "line-break-permission", "line-break-system-details", "max-stretch", "measure-length", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "page-break-penalty", "page-break-permission", "page-turn-penalty", "page-turn-permission", "rhythmic-location", "rotation", "shortest-playing-duration", "shortest-starter-duration", "skyline-vertical-padding", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "transparent", "used", "vertical-skylines", "when", "whiteout"],
+    "NoteCollision": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "max-stretch", "merge-differently-dotted", "merge-differently-headed", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "prefer-dotted-right", "rotation", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "transparent", "vertical-skylines", "whiteout"],
+    "NoteColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "force-hshift", "horizontal-shift", "horizontal-skylines", "ignore-collision", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "skyline-vertical-padding", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "transparent", "vertical-skylines", "whiteout"],
+    "NoteHead": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "duration-log", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent", "no-ledgers", "non-musical", "note-names", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-position", "stem-attachment", "stencil", "style", "thickness", "transparent", "whiteout"],
+    "NoteName": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "NoteSpacing": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "knee-spacing-correction", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "same-direction-correction", "space-to-barline", "springs-and-rods", "stem-spacing-correction", "stencil", "transparent", "whiteout"],
+    "OctavateEight": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "OttavaBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "baseline-skip", "before-line-breaking", "bracket-flare", "color", "connect-to-neighbor", "cross-staff", "dash-fraction", "dash-period", "direction", "edge-height", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "shorten-pair", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "text", "text-direction", "thickness", "to-barline", "transparent", "whiteout", "word-space", "zigzag-length", "zigzag-width"],
+    "PaperColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "allow-loose-spacing", "avoid-slur", "axes", "before-line-breaking", "between-cols", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "full-measure-extra-space", "horizontal-skylines", "keep-inside-line", "labels", "layer", "line-break-penalty", "line-break-permission", "line-break-system-details", "max-stretch", "measure-length", "minimum-X-extent", "minimum-Y-extent", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "page-break-penalty", "page-break-permission", "page-turn-penalty", "page-turn-permission", "rhythmic-location", "rotation", "shortest-playing-duration", "shortest-starter-duration", "skyline-vertical-padding", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "transparent", "used", "vertical-skylines", "when", "whiteout"],
+    "ParenthesesItem": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "springs-and-rods", "stencil", "stencils", "transparent", "whiteout"],
+    "PercentRepeat": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "bound-padding", "color", "cross-staff", "dot-negative-kern", "expand-limit", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "hair-thickness", "layer", "measure-count", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "slash-negative-kern", "slope", "spacing-pair", "springs-and-rods", "stencil", "thick-thickness", "thickness", "to-barline", "transparent", "whiteout"],
+    "PercentRepeatCounter": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "color", "cross-staff", "direction", "dot-negative-kern", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slash-negative-kern", "slope", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "thickness", "to-barline", "transparent", "whiteout", "word-space"],
+    "PhrasingSlur": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "annotation", "avoid-slur", "before-line-breaking", "color", "control-points", "cross-staff", "dash-definition", "details", "direction", "eccentricity", "extra-X-extent", "extra-Y-extent", "extra-offset", "height-limit", "inspect-index", "inspect-quants", "layer", "line-thickness", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positions", "ratio", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "PianoPedalBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bound-padding", "bracket-flare", "color", "cross-staff", "dash-fraction", "dash-period", "edge-height", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "shorten-pair", "springs-and-rods", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "RehearsalMark": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-align-symbols", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-break-align-symbols", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "RepeatSlash": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "dot-negative-kern", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "slash-negative-kern", "slope", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "RepeatTie": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "control-points", "cross-staff", "details", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "head-direction", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thickness", "transparent", "whiteout"],
+    "RepeatTieColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "head-direction", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "rotation", "springs-and-rods", "stencil", "tie-configuration", "transparent", "whiteout"],
+    "Rest": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "duration-log", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-distance", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-position", "stencil", "style", "transparent", "whiteout"],
+    "RestCollision": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-distance", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "Script": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "positioning-done", "rotation", "script-priority", "side-axis", "side-relative-direction", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "toward-stem-shift", "transparent", "whiteout"],
+    "ScriptColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "ScriptRow": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "transparent", "whiteout"],
+    "Slur": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "annotation", "avoid-slur", "before-line-breaking", "color", "control-points", "cross-staff", "dash-definition", "details", "direction", "eccentricity", "extra-X-extent", "extra-Y-extent", "extra-offset", "height-limit", "inspect-index", "inspect-quants", "layer", "line-thickness", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positions", "ratio", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "SostenutoPedal": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "SostenutoPedalLineSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "SpacingSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "average-spacing-wishes", "avoid-slur", "base-shortest-duration", "before-line-breaking", "color", "common-shortest-duration", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "packed-spacing", "rotation", "shortest-duration-space", "spacing-increment", "springs-and-rods", "stencil", "strict-grace-spacing", "strict-note-spacing", "to-barline", "transparent", "uniform-stretching", "whiteout"],
+    "SpanBar": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "allow-span-bar", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "glyph", "glyph-name", "hair-thickness", "kern", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thick-thickness", "thin-kern", "transparent", "whiteout"],
+    "StaffGrouper": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-staff-spacing", "staffgroup-staff-spacing", "stencil", "to-barline", "transparent", "whiteout"],
+    "StaffSpacing": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stem-spacing-correction", "stencil", "transparent", "whiteout"],
+    "StaffSymbol": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "ledger-line-thickness", "line-count", "line-positions", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-space", "stencil", "thickness", "to-barline", "transparent", "whiteout", "width"],
+    "StanzaNumber": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "Stem": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-note-head", "avoid-slur", "beaming", "beamlet-default-length", "beamlet-max-length-proportion", "before-line-breaking", "break-visibility", "color", "cross-staff", "default-direction", "details", "direction", "duration-log", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "flag", "flag-style", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "french-beaming", "layer", "length", "length-fraction", "max-beam-connect", "minimum-X-extent", "minimum-Y-extent", "neutral-direction", "no-stem-extend", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "rotation", "springs-and-rods", "stem-end-position", "stemlet-length", "stencil", "stroke-style", "thickness", "transparent", "whiteout"],
+    "StemTremolo": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "beam-thickness", "beam-width", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "flag-count", "layer", "length-fraction", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "slope", "springs-and-rods", "stencil", "style", "transparent", "whiteout"],
+    "StringNumber": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "script-priority", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "StrokeFinger": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "digit-names", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "script-priority", "self-alignment-X", "self-alignment-Y", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "SustainPedal": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "SustainPedalLineSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "System": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "labels", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "skyline-horizontal-padding", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "SystemStartBar": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "collapse-height", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout"],
+    "SystemStartBrace": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "collapse-height", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout"],
+    "SystemStartBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "collapse-height", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout"],
+    "SystemStartSquare": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "collapse-height", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout"],
+    "TabNoteHead": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "details", "duration-log", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "note-names", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-position", "stem-attachment", "stencil", "style", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "TextScript": ["X-extent", "X-offset", "Y-extent", "Y-offset", "add-stem-support", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "fret-diagram-details", "graphical", "harp-pedal-details", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "script-priority", "self-alignment-X", "self-alignment-Y", "side-axis", "size", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "text", "text-direction", "thickness", "transparent", "whiteout", "word-space"],
+    "TextSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bound-details", "color", "cross-staff", "dash-fraction", "dash-period", "direction", "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "layer", "left-bound-info", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "right-bound-info", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "Tie": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "annotation", "avoid-slur", "before-line-breaking", "color", "control-points", "cross-staff", "dash-definition", "details", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "head-direction", "layer", "line-thickness", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "neutral-direction", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-position", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "TieColumn": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "positioning-done", "rotation", "springs-and-rods", "stencil", "tie-configuration", "to-barline", "transparent", "whiteout"],
+    "TimeSignature": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-align-anchor", "break-align-anchor-alignment", "break-align-symbol", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "fraction", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "space-alist", "springs-and-rods", "stencil", "style", "transparent", "whiteout"],
+    "TrillPitchAccidental": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "alteration", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name-alist", "hide-tied-accidental-after-break", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "parenthesized", "restore-first", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "transparent", "whiteout"],
+    "TrillPitchGroup": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "break-visibility", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-space", "no-alignment", "non-musical", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "note-names", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding", "staff-staff-spacing", "stem-attachment", "stencil", "stencils", "style", "transparent", "vertical-skylines", "whiteout"],
+    "TrillPitchHead": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "break-visibility", "color", "cross-staff", "duration-log", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "no-ledgers", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "staff-position", "stencil", "transparent", "whiteout"],
+    "TrillSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bound-details", "color", "cross-staff", "dash-fraction", "dash-period", "direction", "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "gap", "layer", "left-bound-info", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "right-bound-info", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "TupletBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bracket-flare", "bracket-visibility", "break-overshoot", "color", "connect-to-neighbor", "control-points", "cross-staff", "dash-fraction", "dash-period", "direction", "edge-height", "edge-text", "extra-X-extent", "extra-Y-extent", "extra-offset", "full-length-padding", "full-length-to-extent", "gap", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "positions", "rotation", "shorten-pair", "springs-and-rods", "staff-padding", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "TupletNumber": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "text", "text-direction", "to-barline", "transparent", "whiteout", "word-space"],
+    "UnaCordaPedal": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "baseline-skip", "before-line-breaking", "break-visibility", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "extra-spacing-height", "extra-spacing-width", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "layer", "minimum-X-extent", "minimum-Y-extent", "non-musical", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "self-alignment-X", "self-alignment-Y", "springs-and-rods", "stencil", "text", "text-direction", "transparent", "whiteout", "word-space"],
+    "UnaCordaPedalLineSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "VaticanaLigature": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "before-line-breaking", "color", "cross-staff", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "glyph-name", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "rotation", "springs-and-rods", "stencil", "thickness", "to-barline", "transparent", "whiteout"],
+    "VerticalAlignment": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "align-dir", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "positioning-done", "rotation", "springs-and-rods", "stacking-dir", "staff-affinity", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "VerticalAxisGroup": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "remove-empty", "remove-first", "rotation", "springs-and-rods", "staff-affinity", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+    "VoiceFollower": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "before-line-breaking", "bound-details", "color", "cross-staff", "dash-fraction", "dash-period", "extra-X-extent", "extra-Y-extent", "extra-dy", "extra-offset", "gap", "layer", "left-bound-info", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "right-bound-info", "rotation", "springs-and-rods", "stencil", "style", "thickness", "to-barline", "transparent", "whiteout", "zigzag-length", "zigzag-width"],
+    "VoltaBracket": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "arrow-length", "arrow-width", "avoid-slur", "baseline-skip", "before-line-breaking", "bracket-flare", "color", "connect-to-neighbor", "cross-staff", "dash-fraction", "dash-period", "direction", "edge-height", "extra-X-extent", "extra-Y-extent", "extra-offset", "font-encoding", "font-family", "font-name", "font-series", "font-shape", "font-size", "height", "layer", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "shorten-pair", "side-axis", "slur-padding", "springs-and-rods", "staff-padding", "stencil", "style", "text", "text-direction", "thickness", "to-barline", "transparent", "whiteout", "word-space", "zigzag-length", "zigzag-width"],
+    "VoltaBracketSpanner": ["X-extent", "X-offset", "Y-extent", "Y-offset", "after-line-breaking", "avoid-slur", "axes", "before-line-breaking", "color", "cross-staff", "default-staff-staff-spacing", "direction", "extra-X-extent", "extra-Y-extent", "extra-offset", "layer", "max-stretch", "minimum-X-extent", "minimum-Y-extent", "minimum-length", "minimum-space", "no-alignment", "nonstaff-nonstaff-spacing", "nonstaff-relatedstaff-spacing", "nonstaff-unrelatedstaff-spacing", "normalized-endpoints", "outside-staff-horizontal-padding", "outside-staff-padding", "outside-staff-priority", "padding", "rotation", "side-axis", "slur-padding", "springs-and-rods", "staff-affinity", "staff-padding", "staff-staff-spacing", "stencil", "to-barline", "transparent", "vertical-skylines", "whiteout"],
+}
+
+propertyinterfaces = {
+    "X-extent": ["grob-interface", "separation-item-interface"],
+    "X-offset": ["grob-interface"],
+    "Y-extent": ["grob-interface"],
+    "Y-offset": ["grob-interface"],
+    "add-stem-support": ["script-interface", "text-script-interface"],
+    "after-line-breaking": ["grob-interface"],
+    "align-dir": ["align-interface", "fret-diagram-interface"],
+    "allow-loose-spacing": ["spaceable-grob-interface"],
+    "allow-span-bar": ["bar-line-interface"],
+    "alteration": ["accidental-interface"],
+    "alteration-alist": ["key-signature-interface"],
+    "annotation": ["beam-interface", "slur-interface", "tie-interface"],
+    "annotation-balloon": ["balloon-interface"],
+    "annotation-line": ["balloon-interface"],
+    "arpeggio-direction": ["arpeggio-interface"],
+    "arrow-length": ["line-interface"],
+    "arrow-width": ["line-interface"],
+    "auto-knee-gap": ["beam-interface"],
+    "average-spacing-wishes": ["spacing-spanner-interface"],
+    "avoid-note-head": ["stem-interface"],
+    "avoid-slur": ["accidental-interface", "dynamic-line-spanner-interface", "grob-interface", "script-interface", "slur-interface", "text-script-interface", "tie-interface", "tuplet-number-interface"],
+    "axes": ["align-interface", "axis-group-interface"],
+    "base-shortest-duration": ["spacing-spanner-interface"],
+    "baseline-skip": ["text-interface"],
+    "beam-thickness": ["beam-interface", "stem-tremolo-interface"],
+    "beam-width": ["stem-tremolo-interface"],
+    "beamed-stem-shorten": ["beam-interface"],
+    "beaming": ["beam-interface", "stem-interface"],
+    "beamlet-default-length": ["stem-interface"],
+    "beamlet-max-length-proportion": ["stem-interface"],
+    "before-line-breaking": ["grob-interface"],
+    "between-cols": ["paper-column-interface"],
+    "bound-details": ["line-spanner-interface"],
+    "bound-padding": ["hairpin-interface", "multi-measure-interface", "multi-measure-rest-interface", "piano-pedal-bracket-interface"],
+    "bracket-flare": ["enclosing-bracket-interface", "horizontal-bracket-interface", "ottava-bracket-interface", "piano-pedal-bracket-interface", "tuplet-bracket-interface"],
+    "bracket-visibility": ["tuplet-bracket-interface"],
+    "break-align-anchor": ["break-aligned-interface"],
+    "break-align-anchor-alignment": ["break-aligned-interface"],
+    "break-align-orders": ["break-alignment-interface"],
+    "break-align-symbol": ["break-aligned-interface"],
+    "break-align-symbols": ["break-alignable-interface"],
+    "break-overshoot": ["beam-interface", "tuplet-bracket-interface"],
+    "break-visibility": ["item-interface"],
+    "breakable": ["unbreakable-spanner-interface"],
+    "c0-position": ["key-signature-interface"],
+    "circled-tip": ["hairpin-interface"],
+    "clip-edges": ["beam-interface"],
+    "collapse-height": ["system-start-delimiter-interface"],
+    "collision-interfaces": ["beam-interface"],
+    "collision-voice-only": ["beam-interface"],
+    "color": ["grob-interface"],
+    "common-shortest-duration": ["grace-spacing-interface", "spacing-spanner-interface"],
+    "concaveness": ["beam-interface"],
+    "connect-to-neighbor": ["horizontal-bracket-interface", "tuplet-bracket-interface"],
+    "control-points": ["semi-tie-interface", "slur-interface", "tie-interface", "tuplet-bracket-interface"],
+    "cross-staff": ["grob-interface"],
+    "damping": ["beam-interface"],
+    "dash-definition": ["arpeggio-interface", "slur-interface", "tie-interface"],
+    "dash-fraction": ["line-interface"],
+    "dash-period": ["line-interface", "lyric-hyphen-interface"],
+    "default-direction": ["stem-interface"],
+    "default-staff-staff-spacing": ["axis-group-interface"],
+    "details": ["beam-interface", "semi-tie-interface", "slur-interface", "stem-interface", "tab-note-head-interface", "tie-interface"],
+    "digit-names": ["stroke-finger-interface"],
+    "direction": ["accidental-placement-interface", "beam-interface", "breathing-sign-interface", "dot-column-interface", "dots-interface", "rest-interface", "semi-tie-interface", "side-position-interface", "slur-interface", "stem-interface", "tie-interface", "tuplet-bracket-interface"],
+    "dot-count": ["dots-interface"],
+    "dot-negative-kern": ["percent-repeat-interface", "percent-repeat-item-interface"],
+    "dot-placement-list": ["fret-diagram-interface"],
+    "duration-log": ["rhythmic-head-interface", "stem-interface"],
+    "eccentricity": ["slur-interface"],
+    "edge-height": ["enclosing-bracket-interface", "horizontal-bracket-interface", "ottava-bracket-interface", "piano-pedal-bracket-interface", "tuplet-bracket-interface"],
+    "edge-text": ["tuplet-bracket-interface"],
+    "expand-limit": ["multi-measure-rest-interface"],
+    "extra-X-extent": ["grob-interface"],
+    "extra-Y-extent": ["grob-interface"],
+    "extra-dy": ["line-spanner-interface"],
+    "extra-offset": ["grob-interface"],
+    "extra-spacing-height": ["item-interface"],
+    "extra-spacing-width": ["item-interface"],
+    "flag": ["stem-interface"],
+    "flag-count": ["stem-tremolo-interface"],
+    "flag-style": ["stem-interface"],
+    "font-encoding": ["font-interface"],
+    "font-family": ["font-interface"],
+    "font-name": ["font-interface"],
+    "font-series": ["font-interface"],
+    "font-shape": ["font-interface"],
+    "font-size": ["font-interface"],
+    "footnote-text": ["footnote-interface", "footnote-spanner-interface"],
+    "force-hshift": ["note-column-interface"],
+    "fraction": ["time-signature-interface"],
+    "french-beaming": ["stem-interface"],
+    "fret-diagram-details": ["fret-diagram-interface", "instrument-specific-markup-interface"],
+    "full-length-padding": ["tuplet-bracket-interface"],
+    "full-length-to-extent": ["tuplet-bracket-interface"],
+    "full-measure-extra-space": ["paper-column-interface"],
+    "full-size-change": ["clef-interface"],
+    "gap": ["ambitus-interface", "bar-line-interface", "beam-interface", "ledger-line-spanner-interface", "line-spanner-interface", "tuplet-bracket-interface"],
+    "gap-count": ["beam-interface"],
+    "glyph": ["bar-line-interface", "clef-interface"],
+    "glyph-name": ["bar-line-interface", "clef-interface", "note-head-interface", "span-bar-interface", "vaticana-ligature-interface"],
+    "glyph-name-alist": ["accidental-interface", "key-signature-interface"],
+    "graphical": ["instrument-specific-markup-interface"],
+    "grow-direction": ["beam-interface", "hairpin-interface"],
+    "hair-thickness": ["bar-line-interface", "multi-measure-rest-interface"],
+    "harp-pedal-details": ["instrument-specific-markup-interface"],
+    "head-direction": ["semi-tie-column-interface", "semi-tie-interface", "tie-interface"],
+    "height": ["hairpin-interface", "ligature-bracket-interface", "lyric-hyphen-interface", "measure-grouping-interface", "volta-bracket-interface"],
+    "height-limit": ["slur-interface"],
+    "hide-tied-accidental-after-break": ["accidental-interface"],
+    "horizontal-shift": ["note-column-interface"],
+    "horizontal-skylines": ["separation-item-interface"],
+    "ignore-collision": ["note-column-interface"],
+    "implicit": ["bass-figure-interface"],
+    "inspect-index": ["slur-interface"],
+    "inspect-quants": ["beam-interface", "slur-interface"],
+    "keep-inside-line": ["spaceable-grob-interface"],
+    "kern": ["bar-line-interface"],
+    "knee": ["beam-interface"],
+    "knee-spacing-correction": ["note-spacing-interface"],
+    "labels": ["paper-column-interface", "system-interface"],
+    "layer": ["grob-interface"],
+    "ledger-line-thickness": ["staff-symbol-interface"],
+    "left-bound-info": ["line-spanner-interface"],
+    "left-padding": ["lyric-extender-interface"],
+    "length": ["lyric-hyphen-interface", "stem-interface"],
+    "length-fraction": ["beam-interface", "ledger-line-spanner-interface", "stem-interface", "stem-tremolo-interface"],
+    "line-break-penalty": ["paper-column-interface"],
+    "line-break-permission": ["paper-column-interface"],
+    "line-break-system-details": ["paper-column-interface"],
+    "line-count": ["staff-symbol-interface"],
+    "line-positions": ["staff-symbol-interface"],
+    "line-thickness": ["slur-interface", "tie-interface"],
+    "long-text": ["system-start-text-interface"],
+    "max-beam-connect": ["stem-interface"],
+    "max-stretch": ["axis-group-interface"],
+    "measure-count": ["multi-measure-rest-interface"],
+    "measure-length": ["spaceable-grob-interface"],
+    "merge-differently-dotted": ["note-collision-interface"],
+    "merge-differently-headed": ["note-collision-interface"],
+    "minimum-X-extent": ["grob-interface"],
+    "minimum-Y-extent": ["grob-interface"],
+    "minimum-distance": ["lyric-hyphen-interface", "rest-collision-interface", "rest-interface"],
+    "minimum-length": ["lyric-hyphen-interface", "multi-measure-rest-interface", "ottava-bracket-interface", "spanner-interface"],
+    "minimum-length-fraction": ["ledger-line-spanner-interface"],
+    "minimum-space": ["side-position-interface"],
+    "neutral-direction": ["beam-interface", "custos-interface", "melody-spanner-interface", "stem-interface", "tie-interface"],
+    "neutral-position": ["custos-interface"],
+    "next": ["lyric-extender-interface"],
+    "no-alignment": ["axis-group-interface"],
+    "no-ledgers": ["ledgered-interface"],
+    "no-stem-extend": ["stem-interface"],
+    "non-break-align-symbols": ["break-alignable-interface"],
+    "non-default": ["clef-interface"],
+    "non-musical": ["item-interface"],
+    "nonstaff-nonstaff-spacing": ["axis-group-interface"],
+    "nonstaff-relatedstaff-spacing": ["axis-group-interface"],
+    "nonstaff-unrelatedstaff-spacing": ["axis-group-interface"],
+    "normalized-endpoints": ["spanner-interface"],
+    "note-names": ["note-head-interface"],
+    "outside-staff-horizontal-padding": ["grob-interface"],
+    "outside-staff-padding": ["grob-interface"],
+    "outside-staff-priority": ["grob-interface"],
+    "packed-spacing": ["spacing-spanner-interface"],
+    "padding": ["accidental-placement-interface", "align-interface", "balloon-interface", "cluster-interface", "enclosing-bracket-interface", "figured-bass-continuation-interface", "key-signature-interface", "lyric-hyphen-interface", "parentheses-interface", "separation-item-interface", "side-position-interface", "tuplet-bracket-interface"],
+    "padding-pairs": ["key-signature-interface"],
+    "page-break-penalty": ["paper-column-interface"],
+    "page-break-permission": ["paper-column-interface"],
+    "page-turn-penalty": ["paper-column-interface"],
+    "page-turn-permission": ["paper-column-interface"],
+    "parenthesized": ["accidental-interface"],
+    "positioning-done": ["accidental-placement-interface", "align-interface", "break-alignment-interface", "dot-column-interface", "note-collision-interface", "rest-collision-interface", "script-interface", "semi-tie-column-interface", "stem-interface", "tie-column-interface"],
+    "positions": ["arpeggio-interface", "beam-interface", "cluster-beacon-interface", "slur-interface", "tuplet-bracket-interface"],
+    "prefer-dotted-right": ["note-collision-interface"],
+    "ratio": ["slur-interface"],
+    "remove-empty": ["hara-kiri-group-spanner-interface"],
+    "remove-first": ["hara-kiri-group-spanner-interface"],
+    "restore-first": ["accidental-interface"],
+    "rhythmic-location": ["paper-column-interface"],
+    "right-bound-info": ["line-spanner-interface"],
+    "right-padding": ["accidental-placement-interface", "dynamic-text-interface", "lyric-extender-interface"],
+    "rotation": ["grob-interface"],
+    "same-direction-correction": ["note-spacing-interface"],
+    "script-priority": ["accidental-placement-interface", "arpeggio-interface", "script-interface", "text-script-interface"],
+    "self-alignment-X": ["self-alignment-interface", "system-start-text-interface"],
+    "self-alignment-Y": ["self-alignment-interface", "system-start-text-interface"],
+    "shorten-pair": ["enclosing-bracket-interface", "horizontal-bracket-interface", "ottava-bracket-interface", "piano-pedal-bracket-interface", "tuplet-bracket-interface"],
+    "shortest-duration-space": ["spacing-options-interface", "spacing-spanner-interface"],
+    "shortest-playing-duration": ["paper-column-interface"],
+    "shortest-starter-duration": ["paper-column-interface"],
+    "side-axis": ["side-position-interface"],
+    "side-relative-direction": ["script-interface"],
+    "size": ["fret-diagram-interface", "instrument-specific-markup-interface"],
+    "skyline-horizontal-padding": ["system-interface"],
+    "skyline-vertical-padding": ["separation-item-interface"],
+    "slash-negative-kern": ["percent-repeat-interface", "percent-repeat-item-interface"],
+    "slope": ["percent-repeat-interface", "percent-repeat-item-interface", "stem-tremolo-interface"],
+    "slur-padding": ["script-interface", "side-position-interface"],
+    "space-alist": ["break-aligned-interface"],
+    "space-to-barline": ["note-spacing-interface"],
+    "spacing-increment": ["spacing-options-interface", "spacing-spanner-interface"],
+    "spacing-pair": ["multi-measure-rest-interface"],
+    "springs-and-rods": ["grob-interface"],
+    "stacking-dir": ["align-interface"],
+    "staff-affinity": ["axis-group-interface"],
+    "staff-padding": ["side-position-interface", "tuplet-bracket-interface"],
+    "staff-position": ["staff-symbol-referencer-interface", "tie-interface"],
+    "staff-space": ["staff-symbol-interface"],
+    "staff-staff-spacing": ["axis-group-interface", "staff-grouper-interface"],
+    "staffgroup-staff-spacing": ["staff-grouper-interface"],
+    "stem-attachment": ["note-head-interface"],
+    "stem-end-position": ["stem-interface"],
+    "stem-spacing-correction": ["note-spacing-interface", "staff-spacing-interface"],
+    "stemlet-length": ["stem-interface"],
+    "stencil": ["grob-interface"],
+    "stencils": ["parentheses-interface"],
+    "strict-grace-spacing": ["spacing-spanner-interface"],
+    "strict-note-spacing": ["spacing-spanner-interface"],
+    "stroke-style": ["stem-interface"],
+    "style": ["cluster-interface", "custos-interface", "dots-interface", "line-interface", "measure-grouping-interface", "note-head-interface", "rest-interface", "stem-tremolo-interface", "system-start-delimiter-interface", "time-signature-interface"],
+    "text": ["balloon-interface", "dynamic-text-spanner-interface", "system-start-text-interface", "text-interface"],
+    "text-direction": ["text-interface"],
+    "thick-thickness": ["bar-line-interface", "multi-measure-rest-interface"],
+    "thickness": ["ambitus-interface", "bend-after-interface", "enclosing-bracket-interface", "figured-bass-continuation-interface", "fret-diagram-interface", "grid-line-interface", "instrument-specific-markup-interface", "ledger-line-spanner-interface", "ligature-bracket-interface", "line-interface", "line-spanner-interface", "lyric-extender-interface", "lyric-hyphen-interface", "measure-grouping-interface", "mensural-ligature-interface", "percent-repeat-interface", "percent-repeat-item-interface", "semi-tie-interface", "slur-interface", "staff-symbol-interface", "stem-interface", "system-start-delimiter-interface", "tie-interface", "tuplet-bracket-interface", "vaticana-ligature-interface", "volta-bracket-interface"],
+    "thin-kern": ["bar-line-interface"],
+    "tie-configuration": ["semi-tie-column-interface", "tie-column-interface"],
+    "to-barline": ["line-spanner-interface", "spanner-interface"],
+    "toward-stem-shift": ["script-interface"],
+    "transparent": ["grob-interface"],
+    "uniform-stretching": ["spacing-spanner-interface"],
+    "used": ["paper-column-interface"],
+    "vertical-skylines": ["axis-group-interface"],
+    "when": ["paper-column-interface"],
+    "whiteout": ["grob-interface"],
+    "width": ["ligature-bracket-interface", "staff-symbol-interface"],
+    "word-space": ["text-interface"],
+    "zigzag-length": ["line-interface"],
+    "zigzag-width": ["line-interface"],
+}
+
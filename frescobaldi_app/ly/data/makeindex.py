@@ -0,0 +1,83 @@
+#!/usr/bin/python
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2011 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+"""
+Writes the _index.py module with lookup tables computed from _data.py.
+
+The query functions in ly.data then don't need to compute and sort these
+lists on every call. Run by the Makefile after _data.py has been generated:
+
+    python makeindex.py > _index.py
+
+This script needs not to be installed to be able to use the ly.data package.
+
+"""
+
+from __future__ import print_function
+
+import collections
+import sys
+
+import _data
+
+
+def indexes():
+    """Returns a list of (name, value) tuples to write to _index.py."""
+    grobproperties = dict(
+        (grob, sorted(set(prop
+            for iface in ifaces
+            for prop in _data.interfaces[iface])))
+        for grob, ifaces in _data.grobs.items())
+    
+    propertyinterfaces = collections.defaultdict(list)
+    for iface in sorted(_data.interfaces):
+        for prop in _data.interfaces[iface]:
+            propertyinterfaces[prop].append(iface)
+    
+    return [
+        ('grobnames', sorted(_data.grobs)),
+        ('allgrobproperties', sorted(propertyinterfaces)),
+        ('grobproperties', grobproperties),
+        ('propertyinterfaces', dict(propertyinterfaces)),
+    ]
+
+
+def format_list(l):
+    """Formats a list of strings as Python code on one line."""
+    return '[' + ', '.join('"{0}"'.format(s) for s in l) + ']'
+
+
+def write_index(output):
+    """Writes the _index.py module to the output file."""
+    output.write("#! python\n")
+    output.write("# generated by makeindex.py from _data.py "
+                 "(LilyPond {0})\n\n".format(_data.version))
+    for name, value in indexes():
+        if isinstance(value, dict):
+            output.write("{0} = {{\n".format(name))
+            for key in sorted(value):
+                output.write('    "{0}": {1},\n'.format(key, format_list(value[key])))
+            output.write("}\n\n")
+        else:
+            output.write("{0} = {1}\n\n".format(name, format_list(value)))
+
+
+if __name__ == "__main__":
+    write_index(sys.stdout)
@@ -813,6 +813,8 @@ class MainWindow(QMainWindow):
         t.addAction(ma.music_prev_page)
         t.addAction(ma.music_pager)
         t.addAction(ma.music_next_page)
+        t.addSeparator()
+        t.addAction(ma.music_search)
         
     def translateUI(self):
         self.toolbar_main.setWindowTitle(_("Main Toolbar"))
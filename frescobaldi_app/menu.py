@@ -115,6 +115,7 @@ def menu_file_export(mainwindow):
     ac = mainwindow.actionCollection
     
     m.addAction(ac.export_colored_html)
+    m.addAction(panelmanager.manager(mainwindow).musicview.actionCollection.music_export_images)
     return m
     
 
@@ -35,72 +35,85 @@ class Output(object):
     Inherit to implement the actual writing to MIDI ports.
     The midiplayer.Player calls midi_event and all_notes_off.
     
+    If the latency attribute is non-zero, the output supports timestamps:
+    events are then delivered latency msec after their timestamp, which is
+    a time in msec of the clock the player uses. A timestamp of 0 means now.
+    
     """
+    latency = 0
     
-    def midi_event(self, midi):
+    def midi_event(self, midi, timestamp=0):
         """Handles a list or dict of MIDI events from a Song (midisong.py)."""
-        if isinstance(midi, dict):
-            # dict mapping track to events?
-            midi = sum(map(midi.get, sorted(midi)), [])
-        self.send_events(midi)
+        self.send_events(event_list(midi), timestamp)
+    
+    def midi_events(self, batch):
+        """Handles a list of (timestamp, midi) tuples.
+        
+        This is used by the Player to send the MIDI events of a look-ahead
+        window in one go. By default midi_event() is called for every item.
+        
+        """
+        for timestamp, midi in batch:
+            self.midi_event(midi, timestamp)
     
-    def reset(self):
+    def reset(self, timestamp=0):
         """Restores the MIDI output to an initial state.
         
         Sets the program to 0, the volume to 90 and sends reset_controllers
         messages to all channels.
         
         """
-        self.reset_controllers()
-        self.set_main_volume(90)
-        self.set_program_change(0)
+        self.reset_controllers(timestamp=timestamp)
+        self.set_main_volume(90, timestamp=timestamp)
+        self.set_program_change(0, timestamp=timestamp)
     
-    def set_main_volume(self, volume, channel=-1):
+    def set_main_volume(self, volume, channel=-1, timestamp=0):
         channels = range(16) if channel == -1 else (channel,)
-        with self.sender() as send:
+        with self.sender(timestamp) as send:
             for c in channels:
                 send(event.ControllerEvent(c, event.MIDI_CTL_MSB_MAIN_VOLUME, volume))
     
-    def set_program_change(self, program, channel=-1):
+    def set_program_change(self, program, channel=-1, timestamp=0):
         channels = range(16) if channel == -1 else (channel,)
-        with self.sender() as send:
+        with self.sender(timestamp) as send:
             for c in channels:
                 send(event.ProgramChangeEvent(c, program))
         
-    def reset_controllers(self, channel=-1):
+    def reset_controllers(self, channel=-1, timestamp=0):
         """Sends an all_notes_off message to a channel.
         
         If the channel is -1 (the default), sends the message to all channels.
         
         """
         channels = range(16) if channel == -1 else (channel,)
-        with self.sender() as send:
+        with self.sender(timestamp) as send:
             for c in channels:
                 send(event.ControllerEvent(c, event.MIDI_CTL_RESET_CONTROLLERS, 0))
         
-    def all_sounds_off(self, channel=-1):
+    def all_sounds_off(self, channel=-1, timestamp=0):
         """Sends an all_notes_off message to a channel.
         
         If the channel is -1 (the default), sends the message to all channels.
         
         """
         channels = range(16) if channel == -1 else (channel,)
-        with self.sender() as send:
+        with self.sender(timestamp) as send:
             for c in channels:
                 send(event.ControllerEvent(c, event.MIDI_CTL_ALL_NOTES_OFF, 0))
                 send(event.ControllerEvent(c, event.MIDI_CTL_ALL_SOUNDS_OFF, 0))
         
-    def send_events(self, events):
+    def send_events(self, events, timestamp=0):
         """Writes the list of events to the output port.
         
         Each event is one of the event types in event.py
+        The timestamp is only used if the output has a latency.
         Implement to do the actual writing.
         
         """
         pass
     
     @contextlib.contextmanager
-    def sender(self):
+    def sender(self, timestamp=0):
         """Returns a context manager to call for each event to send.
         
         When the context manager exits, the events are sent using the
@@ -110,7 +123,7 @@ class Output(object):
         l = []
         yield l.append
         if l:
-            self.send_events(l)
+            self.send_events(l, timestamp)
 
 
 class PortMidiOutput(Output):
@@ -121,13 +134,27 @@ class PortMidiOutput(Output):
     """
     output = None
     
-    def send_events(self, events):
+    def send_events(self, events, timestamp=0):
         """Writes the list of events to the PortMIDI output port."""
         l = []
         for e in events:
             m = self.convert_event(e)
             if m:
-                l.append([m, 0])
+                l.append([m, timestamp])
+        self.write(l)
+    
+    def midi_events(self, batch):
+        """Writes the MIDI of a list of (timestamp, midi) tuples at once."""
+        l = []
+        for timestamp, midi in batch:
+            for e in event_list(midi):
+                m = self.convert_event(e)
+                if m:
+                    l.append([m, timestamp])
+        self.write(l)
+    
+    def write(self, l):
+        """Writes a list of [message, timestamp] lists to the PortMIDI output."""
         while len(l) > 1024:
             self.output.write(l[:1024])
             l = l[1024:]
@@ -159,4 +186,15 @@ class PortMidiOutput(Output):
         return [0xE0 + e.channel, e.value & 0x7F, e.value >> 7]
 
 
+def event_list(midi):
+    """Returns the MIDI events from a Song as a list.
+    
+    The midi may be a list or a dict mapping track numbers to lists.
+    
+    """
+    if isinstance(midi, dict):
+        # dict mapping track to events?
+        midi = sum(map(midi.get, sorted(midi)), [])
+    return midi
+
 
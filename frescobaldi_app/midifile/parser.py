@@ -28,14 +28,23 @@ A basic event factory returns the MIDI events as simple named tuples,
 but you can subclass the event factory for more sophisticated behaviour.
 
 Runs with Python 2.6, 2.7.
-For Python 3 you can remove the ord() calls.
+
+The parse_midi_columns() function returns the events of all tracks as
+a compact column store (using NumPy if available) instead of event objects.
 
 """
 
 from __future__ import unicode_literals
 
+import array
+import collections
 import struct
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import event
 
 unpack_midi_header = struct.Struct(b'>hhh').unpack
@@ -78,12 +87,17 @@ def parse_midi_data(s):
 def read_var_len(s, pos):
     """Reads variable-length integer from s starting on pos.
     
+    s may be a bytes string or a bytearray.
     Returns the value and the new position.
     
     """
+    if isinstance(s, bytes):
+        s = bytearray(s[pos:pos+4])
+        value, length = read_var_len(s, 0)
+        return value, pos + length
     value = 0
     while True:
-        i = ord(s[pos])
+        i = s[pos]
         pos += 1
         value = value * 128 + (i & 0x7F)
         if not i & 0x80:
@@ -103,15 +117,37 @@ def parse_midi_events(s, factory=None):
     """
     if factory is None:
         factory = event.EventFactory()
-        
+    
+    note_event = factory.note_event
+    meta_event = factory.meta_event
+    sysex_event = factory.sysex_event
+    pitchbend_event = factory.pitchbend_event
+    channelaftertouch_event = factory.channelaftertouch_event
+    controller_event = factory.controller_event
+    programchange_event = factory.programchange_event
+    
+    # the bytearray gives integers, the data of meta and sysex events
+    # is sliced from the bytes string
+    data = bytearray(s)
+    length = len(data)
     running_status = None
     
     pos = 0
-    while pos < len(s):
+    while pos < length:
         
-        delta, pos = read_var_len(s, pos)
+        # delta time, mostly a single byte
+        delta = data[pos]
+        pos += 1
+        if delta & 0x80:
+            delta &= 0x7F
+            while True:
+                i = data[pos]
+                pos += 1
+                delta = delta * 128 + (i & 0x7F)
+                if not i & 0x80:
+                    break
         
-        status = ord(s[pos])
+        status = data[pos]
         if status & 0x80:
             running_status = status
             pos += 1
@@ -125,49 +161,131 @@ def parse_midi_events(s, factory=None):
         
         if ev_type <= 0x0A:
             # note on, off or aftertouch
-            note = ord(s[pos])
-            value = ord(s[pos+1])
+            ev = note_event(ev_type, channel, data[pos], data[pos+1])
             pos += 2
-            ev = factory.note_event(ev_type, channel, note, value)
         elif ev_type >= 0x0F:
             running_status = None
             if status == 0xFF:
                 # meta event
-                meta_type = ord(s[pos])
-                meta_size, pos = read_var_len(s, pos+1)
-                meta_data = s[pos:pos+meta_size]
+                meta_type = data[pos]
+                meta_size, pos = read_var_len(data, pos+1)
+                ev = meta_event(meta_type, s[pos:pos+meta_size])
                 pos += meta_size
-                ev = factory.meta_event(meta_type, meta_data)
             else:
                 # some sort of sysex
-                sysex_size, pos = read_var_len(s, pos)
-                sysex_data = s[pos:pos+sysex_size]
+                sysex_size, pos = read_var_len(data, pos)
+                ev = sysex_event(status, s[pos:pos+sysex_size])
                 pos += sysex_size
-                ev = factory.sysex_event(status, sysex_data)
         elif ev_type == 0x0E:
             # Pitch Bend
-            value = ord(s[pos]) + ord(s[pos+1]) * 128
+            ev = pitchbend_event(channel, data[pos] + data[pos+1] * 128)
             pos += 2
-            ev = factory.pitchbend_event(channel, value)
         elif ev_type == 0xD:
             # Channel AfterTouch
-            value = ord(s[pos])
+            ev = channelaftertouch_event(channel, data[pos])
             pos += 1
-            ev = factory.channelaftertouch_event(channel, value)
         elif ev_type == 0xB:
             # Controller
-            number = ord(s[pos])
-            value = ord(s[pos+1])
+            ev = controller_event(channel, data[pos], data[pos+1])
             pos += 2
-            ev = factory.controller_event(channel, number, value)
         else: # ev_type == 0xC
             # Program Change
-            number = ord(s[pos])
+            ev = programchange_event(channel, data[pos])
             pos += 1
-            ev = factory.programchange_event(channel, number)
         yield delta, ev
 
 
+Columns = collections.namedtuple('Columns', 'time track status data1 data2 data')
+
+
+def parse_midi_columns(tracks):
+    """Parses the tracks (bytes strings) into a compact column store.
+    
+    Returns a Columns named tuple with the arrays time, track, status, data1
+    and data2, with one item per event, in the order of the tracks. If NumPy
+    is available, the arrays are NumPy arrays, otherwise array.array instances.
+    
+    For channel messages, data1 and data2 are the data bytes (data2 is 0 for
+    Program Change and Channel AfterTouch). For meta events (status 0xFF)
+    data1 is the meta type, and for sysex events it is 0. For those events
+    data2 is the index of the event's bytes string in the data list.
+    
+    This does not create a Python object for every event, and therefore is
+    much faster and uses far less memory than parse_midi_events().
+    
+    Raises ValueError or IndexError on invalid MIDI data.
+    
+    """
+    times = array.array(b'l')
+    track_nums = array.array(b'H')
+    statuses = array.array(b'B')
+    data1s = array.array(b'B')
+    data2s = array.array(b'I')
+    datas = []
+    add_time, add_status = times.append, statuses.append
+    add_data1, add_data2 = data1s.append, data2s.append
+    
+    for track, s in enumerate(tracks):
+        data = bytearray(s)
+        length = len(data)
+        running_status = None
+        time = 0
+        pos = 0
+        count = len(times)
+        while pos < length:
+            delta = data[pos]
+            pos += 1
+            if delta & 0x80:
+                delta &= 0x7F
+                while True:
+                    i = data[pos]
+                    pos += 1
+                    delta = delta * 128 + (i & 0x7F)
+                    if not i & 0x80:
+                        break
+            time += delta
+            
+            status = data[pos]
+            if status & 0x80:
+                running_status = status
+                pos += 1
+            elif not running_status:
+                raise ValueError("invalid running status")
+            else:
+                status = running_status
+            
+            if status < 0xC0 or 0xE0 <= status < 0xF0:
+                # notes, aftertouch, controllers, pitch bend: two data bytes
+                data1, data2 = data[pos], data[pos+1]
+                pos += 2
+            elif status < 0xE0:
+                # program change, channel aftertouch: one data byte
+                data1, data2 = data[pos], 0
+                pos += 1
+            else:
+                running_status = None
+                if status == 0xFF:
+                    data1 = data[pos]
+                    pos += 1
+                else:
+                    data1 = 0
+                size, pos = read_var_len(data, pos)
+                data2 = len(datas)
+                datas.append(s[pos:pos+size])
+                pos += size
+            add_time(time)
+            add_status(status)
+            add_data1(data1)
+            add_data2(data2)
+        track_nums.extend([track] * (len(times) - count))
+    
+    if numpy:
+        times, track_nums, statuses, data1s, data2s = (
+            numpy.frombuffer(a, a.typecode) if len(a) else numpy.array([], a.typecode)
+            for a in (times, track_nums, statuses, data1s, data2s))
+    return Columns(times, track_nums, statuses, data1s, data2s, datas)
+
+
 def time_events(track, time=0):
     """Yields two-tuples (time, event).
     
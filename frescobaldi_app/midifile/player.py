@@ -24,6 +24,7 @@ A MIDI Player.
 
 from __future__ import unicode_literals
 
+import bisect
 import collections
 import time
 import threading
@@ -38,6 +39,11 @@ class Player(object):
     You can override: timer_midi_time(), timer_start() and timer_stop()
     to use another timing source than the Python threading.Timer instances.
     
+    If a look-ahead window is set with set_lookahead() and the output supports
+    timestamps, the MIDI events are sent ahead of time in batches, stamped
+    with the time they should sound. In that case timer_midi_time() should
+    return the time of the clock the output uses.
+    
     """
     def __init__(self):
         self._song = None
@@ -49,6 +55,10 @@ class Player(object):
         self._tempo_factor = 1.0
         self._output = None
         self._last_exception = None
+        self._lookahead = 0
+        self._sent = 0
+        self._ahead_time = 0
+        self._jitter = Jitter()
     
     def set_output(self, output):
         """Sets an Output instance that handles the MIDI events.
@@ -70,7 +80,7 @@ class Player(object):
         """
         self.set_song(song.load(filename), time, beat)
     
-    def set_song(self, song, time=1000, beat=True):
+    def set_song(self, song, time=1000, beat=True, events=None):
         """Loads the specified Song (see song.py).
         
         If time is not None, it specifies at which interval (in msec) the
@@ -78,12 +88,19 @@ class Player(object):
         If beat is True (default), the beat() method will be called on every
         beat.
         
+        If events is given, it should be the list returned by
+        make_event_list(song, time, beat); it is then used instead of
+        building the event list again.
+        
         """
         playing = self._playing
         if playing:
             self.timer_stop_playing()
         self._song = song
-        self._events = make_event_list(song, time, beat)
+        self._ahead_time = 0
+        if events is None:
+            events = make_event_list(song, time, beat)
+        self._events = events
         self._position = 0
         self._offset = 0
         if playing:
@@ -139,19 +156,41 @@ class Player(object):
         """Returns the tempo factor (by default: 1.0)."""
         return self._tempo_factor
     
+    def set_lookahead(self, msec):
+        """Sets the look-ahead window in msec (default: 0).
+        
+        If non-zero, and the output has a latency (i.e. supports timestamps),
+        all the MIDI events in the window are sent at once, each stamped with
+        the time it should be played. The output then delivers them exactly
+        in time, regardless of the timing of the player's timer.
+        
+        """
+        self._lookahead = msec
+    
+    def lookahead(self):
+        """Returns the look-ahead window in msec (0 if not used)."""
+        return self._lookahead
+    
+    def jitter(self):
+        """Returns the Jitter instance with the timing statistics.
+        
+        It records how late (in msec) the MIDI events are actually played
+        compared to their scheduled time. When the events are sent ahead, the
+        output plays them at their timestamp plus its latency, so then it
+        records how late the events reached the output, measured with the
+        output's clock after writing them. Call its reset() method to start
+        measuring again.
+        
+        """
+        return self._jitter
+    
     def seek(self, time):
         """Goes to the specified time (in msec)."""
         pos = 0
         offset = 0
         if time:
-            # bisect our way in the events list.
-            end = len(self._events)
-            while pos < end:
-                mid = (pos + end) // 2
-                if time > self._events[mid][0]:
-                    pos = mid + 1
-                else:
-                    end = mid
+            # a one-tuple sorts before all the (time, event) tuples at time
+            pos = bisect.bisect_left(self._events, (time,))
             if pos < len(self._events):
                 offset = self._events[pos][0] - time
         self.set_position(pos, offset)
@@ -162,19 +201,11 @@ class Player(object):
         Returns whether the measure position could be found (True or False).        
         
         """
-        result = False
-        for i, (t, e) in enumerate(self._events):
-            if e.beat:
-                if e.beat[0] == measnum:
-                    position = i
-                    result = True
-                    if e.beat[1] >= beat:
-                        break
-                if e.beat[0] > measnum:
-                    break
-        if result:
-            self.set_position(position)
-            return True
+        if self._song:
+            b = self._song.measure(measnum, beat)
+            if b:
+                self.seek(b[0])
+                return True
         return False
         
     def set_position(self, position, offset=0):
@@ -184,11 +215,14 @@ class Player(object):
         
         """
         old, self._position = self._position, position
+        self._sent = position
         if old != self._position:
             self.position_event(old, self._position)
         if self._playing:
             self.timer_stop()
-            self.timer_schedule(offset, False)
+            # let MIDI that was sent ahead play out first
+            pending = self.timer_pending() * self._tempo_factor
+            self.timer_schedule(offset + pending, False)
         else:
             self._offset = offset
         
@@ -208,15 +242,58 @@ class Player(object):
         """
         if self.has_events():
             time, event = self._events[self._position]
+            lookahead = self.timer_lookahead()
+            if lookahead:
+                self.send_ahead(time, lookahead)
+            elif event.midi:
+                self._jitter.add(self.timer_midi_time() - self._sync_time)
             self.handle_event(time, event)
             self._position += 1
+            if lookahead:
+                # skip events that were sent ahead and need no handling,
+                # but not the last one, which finishes the song.
+                end = min(self._sent, len(self._events) - 1)
+                while self._position < end:
+                    e = self._events[self._position][1]
+                    if e.time or e.beat:
+                        break
+                    self._position += 1
             if self._position < len(self._events):
                 return self._events[self._position][0] - time
         return 0
     
+    def send_ahead(self, time, lookahead):
+        """(Private) Sends the MIDI events in the look-ahead window.
+        
+        time is the time of the current event, which is scheduled at the
+        sync time. Every event is stamped with the time it should be played.
+        
+        """
+        pos = max(self._sent, self._position)
+        end = time + lookahead * self._tempo_factor
+        batch = []
+        while pos < len(self._events):
+            t, e = self._events[pos]
+            if t > end:
+                break
+            if e.midi:
+                stamp = int(self._sync_time + (t - time) / self._tempo_factor)
+                batch.append((stamp, e.midi))
+            pos += 1
+        self._sent = pos
+        if batch:
+            latency = self._output.latency
+            self._ahead_time = batch[-1][0]
+            self.midi_events(batch)
+            # the output plays an event latency msec after its stamp, or
+            # immediately if it arrives later than that
+            written = self.timer_midi_time() - latency
+            for stamp, midi in batch:
+                self._jitter.add(max(0, written - stamp))
+    
     def handle_event(self, time, event):
         """(Private) Called for every event."""
-        if event.midi:
+        if event.midi and self._position >= self._sent:
             self.midi_event(event.midi)
         if event.time:
             self.time_event(time)
@@ -235,6 +312,14 @@ class Player(object):
             except BaseException as e:
                 self.exception_event(e)
     
+    def midi_events(self, batch):
+        """(Private) Plays a list of (timestamp, midi) tuples sent ahead."""
+        if self._output:
+            try:
+                self._output.midi_events(batch)
+            except BaseException as e:
+                self.exception_event(e)
+    
     def time_event(self, msec):
         """(Private) Called on every time update."""
     
@@ -247,7 +332,7 @@ class Player(object):
     def stop_event(self):
         """Called when playback is stopped by the user."""
         if self._output:
-            self._output.all_sounds_off()
+            self._output.all_sounds_off(timestamp=self._ahead_time)
         
     def finish_event(self):
         """Called when a song reaches the end by itself."""
@@ -264,7 +349,7 @@ class Player(object):
         
         """
         if self._playing and self._output:
-            self._output.all_sounds_off()
+            self._output.all_sounds_off(timestamp=self._ahead_time)
     
     def exception_event(self, exception):
         """Called when an exception occurs while writing to a MIDI output.
@@ -319,17 +404,35 @@ class Player(object):
         """
         return int((self._sync_time - self.timer_midi_time()) * self._tempo_factor)
     
+    def timer_lookahead(self):
+        """Returns the look-ahead window to use now, 0 if events are not sent ahead.
+        
+        MIDI events are only sent ahead if the output supports timestamps.
+        
+        """
+        if self._lookahead and self._output and self._output.latency:
+            return self._lookahead
+        return 0
+    
+    def timer_pending(self):
+        """Returns the time in msec until the MIDI sent ahead has been played."""
+        if self._ahead_time:
+            return max(0, self._ahead_time - self.timer_midi_time())
+        return 0
+    
     def timer_start_playing(self):
         """Starts playing by starting the timer for the first upcoming event."""
         reset = self.current_time() == 0
         self._playing = True
+        self._sent = self._position
         self.start_event()
         if reset and self._output:
             try:
-                self._output.reset()
+                self._output.reset(timestamp=self._ahead_time)
             except BaseException as e:
                 self.exception_event(e)
-        self.timer_schedule(self._offset, False)
+        pending = self.timer_pending() * self._tempo_factor
+        self.timer_schedule(self._offset + pending, False)
     
     def timer_timeout(self):
         """Called when the timer times out.
@@ -351,6 +454,7 @@ class Player(object):
         self._offset = self.timer_offset()
         self._playing = False
         self.stop_event()
+        self._ahead_time = 0
 
 
 class Event(object):
@@ -380,6 +484,43 @@ class Event(object):
         return '<Event ' + ', '.join(l) + '>'
 
 
+class Jitter(object):
+    """Statistics about the timing of the MIDI events played.
+    
+    Every value added is the difference in msec between the time a MIDI
+    event was actually played and the time it was scheduled for.
+    
+    count: the number of values
+    total: the sum of the absolute values
+    maximum: the largest absolute value
+    
+    """
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clears the statistics."""
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+    
+    def add(self, msec):
+        """Adds a value."""
+        msec = abs(msec)
+        self.count += 1
+        self.total += msec
+        if msec > self.maximum:
+            self.maximum = msec
+    
+    def mean(self):
+        """Returns the mean of the absolute values."""
+        return self.total / float(self.count) if self.count else 0.0
+    
+    def __repr__(self):
+        return '<Jitter count={0} mean={1:.1f} max={2}>'.format(
+            self.count, self.mean(), self.maximum)
+
+
 def make_event_list(song, time=None, beat=None):
     """Returns a list of all the events in Song.
     
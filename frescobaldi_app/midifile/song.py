@@ -24,6 +24,7 @@ midifile.song -- structures MIDI file data as a song.
 
 from __future__ import unicode_literals
 
+import bisect
 import collections
 
 from . import event
@@ -118,7 +119,12 @@ def iter_events_dict(evs):
 
 
 class TempoMap(object):
-    """Converts midi time to real time in microseconds."""
+    """Converts midi time to real time in microseconds.
+    
+    The real time at the start of every tempo change is computed beforehand,
+    so a conversion only needs to find the tempo change before the time.
+    
+    """
     def __init__(self, d, division):
         """Initialize our tempo map based on events d and division."""
         # are the events one list (single-track) or a dict (per-track)?
@@ -133,23 +139,42 @@ class TempoMap(object):
                         break
         if not times or times[0][0] != 0:
             times.insert(0, (0, 500000))
+        # midi time and (undivided) real time at the start of every tempo
+        self._midi_times = [midi_time for midi_time, tempo in times]
+        self._real_times = real_times = [0]
+        for (time, tempo), (next_time, next_tempo) in zip(times, times[1:]):
+            real_times.append(real_times[-1] + (next_time - time) * tempo)
         
     def real_time(self, midi_time):
         """Returns the real time in microseconds for the given MIDI time."""
-        real_time = 0
-        times = self.times
-        for i in range(1, len(times)):
-            if times[i][0] >= midi_time:
-                real_time += (midi_time - times[i-1][0]) * times[i-1][1]
-                break
-            real_time += (times[i][0] - times[i-1][0]) * times[i-1][1]
-        else:
-            real_time += (midi_time - times[-1][0]) * times[-1][1]
-        return real_time // self.division
+        i = max(0, bisect.bisect_right(self._midi_times, midi_time) - 1)
+        time, tempo = self.times[i]
+        return (self._real_times[i] + (midi_time - time) * tempo) // self.division
+    
+    def real_times(self, midi_times):
+        """Returns a list with the real time in microseconds for every MIDI time.
+        
+        The MIDI times must be sorted; they are converted in one pass.
+        
+        """
+        times, real_times, division = self.times, self._real_times, self.division
+        last = len(times) - 1
+        i = 0
+        result = []
+        for midi_time in midi_times:
+            while i < last and times[i+1][0] <= midi_time:
+                i += 1
+            time, tempo = times[i]
+            result.append((real_times[i] + (midi_time - time) * tempo) // division)
+        return result
     
     def msec(self, midi_time):
         """Returns the real time in milliseconds."""
         return self.real_time(midi_time) // 1000
+    
+    def msecs(self, midi_times):
+        """Returns a list with the real time in milliseconds for every (sorted) MIDI time."""
+        return [real_time // 1000 for real_time in self.real_times(midi_times)]
 
 
 def beats(d, division):
@@ -205,6 +230,9 @@ class Song(object):
             event).
     
     beats: a list of tuples(msec, measnum, beat, num, den) for every beat
+    beat_times: a list with the time in msec of every beat, for bisecting
+    measures: a list with the index in beats of the first beat of every
+            measure (measure 1 is at index 0)
     music: a list of tuples(msec, d) where d is a dict mapping tracknr to events
     
     """
@@ -217,28 +245,46 @@ class Song(object):
         self.length = t.msec(max(self.events))
 
         self.beats = b = []
+        self.measures = m = []
         measnum = 0
-        for midi_time, beat, num, den in beats(self.events, division):
+        beat_list = list(beats(self.events, division))
+        msecs = t.msecs([midi_time for midi_time, beat, num, den in beat_list])
+        for msec, (midi_time, beat, num, den) in zip(msecs, beat_list):
             if beat == 1:
                 measnum += 1
-            b.append((t.msec(midi_time), measnum, beat, num, den))
-        self.music = [(t.msec(midi_time), evs)
-                      for midi_time, evs in sorted(self.events.items())]
+                m.append(len(b))
+            b.append((msec, measnum, beat, num, den))
+        self.beat_times = msecs
+        music = sorted(self.events.items())
+        msecs = t.msecs([midi_time for midi_time, evs in music])
+        self.music = [(msec, evs) for msec, (midi_time, evs) in zip(msecs, music)]
 
     def beat(self, time):
         """Returns (time, measnum, beat, num, den) for the beat at time."""
         if not self.beats:
             return (0, 0, 0, 4, 2)
-        pos = 0
-        if time:
-            # bisect our way in the beats list.
-            end = len(self.beats)
-            while pos < end:
-                mid = (pos + end) // 2
-                if time > self.beats[mid][0]:
-                    pos = mid + 1
-                else:
-                    end = mid
+        pos = bisect.bisect_left(self.beat_times, time)
         return self.beats[min(pos, len(self.beats) - 1)]
 
+    def measure(self, measnum, beat=1):
+        """Returns (time, measnum, beat, num, den) for the beat in the measure.
+        
+        If the measure has less beats, the last beat of the measure is
+        returned. Returns None if there is no such measure.
+        
+        """
+        if not 0 < measnum <= len(self.measures):
+            return None
+        start = self.measures[measnum - 1]
+        if measnum < len(self.measures):
+            end = self.measures[measnum]
+        else:
+            end = len(self.beats)
+        pos = min(start + max(beat, 1) - 1, end - 1)
+        return self.beats[pos]
+
+    def measure_times(self):
+        """Returns a list with the time in msec of the start of every measure."""
+        return [self.beat_times[i] for i in self.measures]
+
 
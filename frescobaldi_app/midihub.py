@@ -90,12 +90,17 @@ def default_output():
                     return i.name
     return names[0] if names else ""
 
-def output_by_name(name):
-    """Returns a portmidi.Output instance for name."""
+def output_by_name(name, latency=0):
+    """Returns a portmidi.Output instance for name.
+    
+    If latency is non-zero, the output delivers timestamped events that many
+    msec after their timestamp.
+    
+    """
     for n in range(get_count()):
         i = portmidi.get_device_info(n)
         if i.isoutput and i.name.startswith(name) and not i.isopen:
-            return portmidi.Output(n)
+            return portmidi.Output(n, latency)
 
 # allow the MIDI player to run on python time if portmidi is not available:
 if available():
@@ -23,9 +23,10 @@ Handles MIDI files.
 
 from __future__ import unicode_literals
 
+import collections
 import os
 
-from PyQt4.QtCore import Qt
+from PyQt4.QtCore import Qt, QThread, pyqtSignal
 
 import icons
 import plugin
@@ -34,6 +35,125 @@ import jobmanager
 import resultfiles
 import listmodel
 import midifile.song
+import midifile.player
+
+
+# parsed songs and their event lists, keyed by (filename, mtime, size)
+_cache = collections.OrderedDict()
+_cache_size = 8
+
+# running Loader threads
+_loaders = set()
+
+
+def cachekey(filename):
+    """Returns the key under which the parsed filename is cached.
+    
+    The key consists of the filename, modification time and size, so that
+    an updated file is parsed again. Returns None if the file can't be read.
+    
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return filename, stat.st_mtime, stat.st_size
+
+
+def cached(filename):
+    """Returns a (song, events) tuple if filename has been loaded before.
+    
+    Returns None if the file was not loaded or has changed since.
+    
+    """
+    key = cachekey(filename)
+    try:
+        result = _cache.pop(key)
+    except KeyError:
+        return None
+    _cache[key] = result
+    return result
+
+
+def store(key, song, events):
+    """Stores a parsed song and its event list under the given key."""
+    if key is None:
+        return
+    _cache.pop(key, None)
+    _cache[key] = song, events
+    while len(_cache) > _cache_size:
+        _cache.popitem(False)
+
+
+def parse(filename):
+    """Parses the MIDI file, returning a (song, events) tuple.
+    
+    The event list is built the way the MIDI tool's player needs it.
+    May raise IOError, ValueError or IndexError.
+    
+    """
+    song = midifile.song.load(filename)
+    events = midifile.player.make_event_list(song, 1000, True)
+    return song, events
+
+
+def load(filename):
+    """Returns a (song, events) tuple, using the cache when possible."""
+    result = cached(filename)
+    if result is None:
+        key = cachekey(filename)
+        result = parse(filename)
+        store(key, *result)
+    return result
+
+
+def loadAsync(filename, callback):
+    """Loads the filename in a background thread.
+    
+    When done, callback is called in the main thread with the filename, the
+    song and the event list (both None if the file could not be parsed).
+    Returns the Loader thread, which is kept alive until it has finished.
+    
+    """
+    loader = Loader(filename)
+    loader.loaded.connect(callback)
+    _loaders.add(loader)
+    loader.start()
+    return loader
+
+
+class Loader(QThread):
+    """Parses a MIDI file and builds its event list in a background thread.
+    
+    The result is put in the cache and the loaded signal is emitted with the
+    filename, the song and the event list.
+    
+    """
+    loaded = pyqtSignal(object, object, object)
+    
+    def __init__(self, filename):
+        super(Loader, self).__init__()
+        self.filename = filename
+        self._key = None
+        self._result = None, None
+        self.finished.connect(self.slotFinished)
+    
+    def run(self):
+        """Main method of this thread, called by Qt on start()."""
+        self._key = cachekey(self.filename)
+        try:
+            self._result = parse(self.filename)
+        except (IOError, ValueError, IndexError):
+            self._key = None
+    
+    def slotFinished(self):
+        """Called in the main thread when parsing has finished."""
+        _loaders.discard(self)
+        song, events = self._result
+        if song:
+            store(self._key, song, events)
+        self.loaded.emit(self.filename, song, events)
+        self._result = None, None
 
 
 class MidiFiles(plugin.DocumentPlugin):
@@ -49,7 +169,6 @@ class MidiFiles(plugin.DocumentPlugin):
     def update(self):
         files = resultfiles.results(self.document()).files('.mid*')
         self._files = files
-        self._songs = [None] * len(files)
         if files and self.current >= len(files):
             self.current = len(files) - 1
         return bool(files)
@@ -57,13 +176,15 @@ class MidiFiles(plugin.DocumentPlugin):
     def __nonzero__(self):
         return bool(self._files)
     
-    def song(self, index):
+    def filename(self, index):
+        """Returns the filename of the MIDI file at index."""
         if self._files is None:
             self.update()
-        song = self._songs[index]
-        if not song:
-            song = self._songs[index] = midifile.song.load(self._files[index])
-        return song
+        return self._files[index]
+    
+    def song(self, index):
+        """Returns the Song at index, parsing it if it is not cached."""
+        return load(self.filename(index))[0]
     
     def model(self):
         """Returns a model for a combobox."""
@@ -27,10 +27,23 @@ from __future__ import unicode_literals
 import midifile.output
 
 
+# msec between the timestamp of an event and its delivery, when sending ahead
+latency = 50
+
+# msec of MIDI events the player sends ahead at once
+lookahead = 250
+
+
 class Output(midifile.output.PortMidiOutput):
-    """Handles the output, e.g. for a MIDI player."""
-    def __init__(self, output):
+    """Handles the output, e.g. for a MIDI player.
+    
+    The latency must be the same as the one the PortMIDI output was opened
+    with.
+    
+    """
+    def __init__(self, output, latency=0):
         self.output = output
+        self.latency = latency
 
 
 
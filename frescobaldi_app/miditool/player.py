@@ -44,11 +44,13 @@ class Player(qmidi.player.Player):
         output = self.output()
         if not output:
             return
+        # place the events after the MIDI that was sent ahead
+        timestamp = self._ahead_time
         if new > old:
             evs = self._events[old:new]
         else:
             evs = self._events[:new]
-            output.reset()
+            output.reset(timestamp)
         for time, e in evs:
             if e.midi:
                 if isinstance(e.midi, dict):
@@ -59,6 +61,6 @@ class Player(qmidi.player.Player):
                 # no note events of course
                 midi = [mev for mev in midi if event_filter(mev)]
                 if midi:
-                    output.send_events(midi)
+                    output.send_events(midi, timestamp)
 
 
@@ -41,6 +41,8 @@ class Widget(QWidget):
     def __init__(self, dockwidget):
         super(Widget, self).__init__(dockwidget)
         self._document = None
+        self._loadingFile = None
+        self._playWhenLoaded = False
         self._fileSelector = QComboBox(editable=True, insertPolicy=QComboBox.NoInsert)
         widgets.drag.ComboDrag(self._fileSelector).role = Qt.UserRole
         self._fileSelector.lineEdit().setReadOnly(True)
@@ -114,16 +116,21 @@ class Widget(QWidget):
         
     def readMidiSettings(self):
         """Called after clearMidiSettings(), and on first init."""
-        pass
+        s = QSettings()
+        if s.value("midi/player/lookahead", False) in (True, 'true'):
+            self._player.set_lookahead(output.lookahead)
+        else:
+            self._player.set_lookahead(0)
             
     def openOutput(self):
         """Called when playing starts. Ensures an output port is opened."""
         self._outputCloseTimer.stop()
         if not self._player.output():
             p = QSettings().value("midi/player/output_port", midihub.default_output())
-            o = midihub.output_by_name(p)
+            latency = output.latency if self._player.lookahead() else 0
+            o = midihub.output_by_name(p, latency)
             if o:
-                self._player.set_output(output.Output(o))
+                self._player.set_output(output.Output(o, latency))
     
     def closeOutput(self):
         """Called when the output close timer fires. Closes the output."""
@@ -152,6 +159,10 @@ class Widget(QWidget):
         """Starts the MIDI player, opening an output if necessary."""
         if not self._player.is_playing() and not self._player.has_events():
             self.restart()
+        if self._loadingFile:
+            # start playing as soon as the song is loaded
+            self._playWhenLoaded = True
+            return
         self.openOutput()
         if not self._player.output():
             self._display.statusMessage(_("No output found!"))
@@ -159,6 +170,7 @@ class Widget(QWidget):
     
     def stop(self):
         """Stops the MIDI player."""
+        self._playWhenLoaded = False
         self._player.stop()
     
     def restart(self):
@@ -174,8 +186,10 @@ class Widget(QWidget):
         if self._document:
             files = midifiles.MidiFiles.instance(self._document)
             index = self._fileSelector.currentIndex()
-            if files and (files.song(index) is not self._player.song()):
-                self.loadSong(index)
+            if files:
+                result = midifiles.cached(files.filename(index))
+                if not result or result[0] is not self._player.song():
+                    self.loadSong(index)
         
     def slotTempoChanged(self, value):
         """Called when the user drags the tempo."""
@@ -224,8 +238,39 @@ class Widget(QWidget):
                 self.loadSong(files.current)
     
     def loadSong(self, index):
+        """Loads the MIDI file at index, in the background if not cached."""
         files = midifiles.MidiFiles.instance(self._document)
-        self._player.set_song(files.song(index))
+        filename = files.filename(index)
+        result = midifiles.cached(filename)
+        if result:
+            self._loadingFile = None
+            self.setSong(*result)
+        elif filename != self._loadingFile:
+            self._loadingFile = filename
+            self._player.clear()
+            self.updateTimeSlider()
+            self._display.reset()
+            self._display.statusMessage(
+                _("midi lcd screen", "LOADING"), self._fileSelector.currentText())
+            midifiles.loadAsync(filename, self.slotSongLoaded)
+    
+    def slotSongLoaded(self, filename, song, events):
+        """Called when a MIDI file has been loaded in the background."""
+        if filename != self._loadingFile:
+            return # another file has been selected in the meantime
+        self._loadingFile = None
+        play, self._playWhenLoaded = self._playWhenLoaded, False
+        if not song:
+            self._display.statusMessage(
+                _("midi lcd screen", "ERROR"), self._fileSelector.currentText())
+            return
+        self.setSong(song, events)
+        if play:
+            self.play()
+    
+    def setSong(self, song, events):
+        """Sets the song and its prebuilt event list in the player."""
+        self._player.set_song(song, events=events)
         m, s = divmod(self._player.total_time() / 1000, 60)
         name = self._fileSelector.currentText()
         self.updateTimeSlider()
@@ -245,6 +290,8 @@ class Widget(QWidget):
     def slotDocumentClosed(self, document):
         if document == self._document:
             self._document = None
+            self._loadingFile = None
+            self._playWhenLoaded = False
             self._fileSelector.clear()
             self._player.stop()
             self._player.clear()
@@ -40,7 +40,7 @@ import weakref
 
 from PyQt4.QtCore import QSettings, QTimer, Qt, pyqtSignal
 from PyQt4.QtGui import (
-    QAction, QComboBox, QLabel, QKeySequence, QSpinBox, QWidgetAction)
+    QAction, QComboBox, QLabel, QKeySequence, QLineEdit, QSpinBox, QWidgetAction)
 
 import app
 import actioncollection
@@ -62,6 +62,12 @@ _zoomvalues = [50, 75, 100, 125, 150, 175, 200, 250, 300]
 from qpopplerview import FixedScale, FitWidth, FitHeight, FitBoth
 
 
+@app.aboutToQuit.connect
+def _log_cache_statistics():
+    from . import cachestats
+    cachestats.log()
+
+
 def activate(func):
     """Decorator for MusicViewPanel methods/slots.
     
@@ -101,10 +107,12 @@ class MusicViewPanel(panel.Panel):
         ac.music_jump_to_cursor.triggered.connect(self.jumpToCursor)
         ac.music_sync_cursor.triggered.connect(self.toggleSyncCursor)
         ac.music_copy_image.triggered.connect(self.copyImage)
+        ac.music_export_images.triggered.connect(self.exportImages)
         ac.music_document_select.documentsChanged.connect(self.updateActions)
         ac.music_copy_image.setEnabled(False)
         ac.music_next_page.triggered.connect(self.slotNextPage)
         ac.music_prev_page.triggered.connect(self.slotPreviousPage)
+        ac.music_cache_statistics.triggered.connect(self.showCacheStatistics)
         self.slotPageCountChanged(0)
         ac.music_next_page.setEnabled(False)
         ac.music_prev_page.setEnabled(False)
@@ -170,6 +178,7 @@ class MusicViewPanel(panel.Panel):
     def updateActions(self):
         ac = self.actionCollection
         ac.music_print.setEnabled(bool(ac.music_document_select.documents()))
+        ac.music_export_images.setEnabled(bool(ac.music_document_select.documents()))
         
     def printMusic(self):
         doc = self.actionCollection.music_document_select.currentDocument()
@@ -212,6 +221,21 @@ class MusicViewPanel(panel.Panel):
     def copyImage(self):
         from . import image
         image.copy(self)
+    
+    def search(self, text):
+        self.widget().search(text)
+    
+    @activate
+    def findNext(self):
+        self.widget().findNext()
+    
+    def exportImages(self):
+        from . import image
+        image.export(self)
+    
+    def showCacheStatistics(self):
+        from . import cachestats
+        cachestats.show(self)
         
     def slotZoomChanged(self, mode, scale):
         """Called when the combobox is changed, changes view zoom."""
@@ -246,9 +270,12 @@ class Actions(actioncollection.ActionCollection):
         self.music_jump_to_cursor = QAction(panel)
         self.music_sync_cursor = QAction(panel, checkable=True)
         self.music_copy_image = QAction(panel)
+        self.music_export_images = QAction(panel)
         self.music_pager = PagerAction(panel)
         self.music_next_page = QAction(panel)
         self.music_prev_page = QAction(panel)
+        self.music_cache_statistics = QAction(panel)
+        self.music_search = SearchAction(panel)
 
         self.music_print.setIcon(icons.get('document-print'))
         self.music_zoom_in.setIcon(icons.get('zoom-in'))
@@ -284,10 +311,13 @@ class Actions(actioncollection.ActionCollection):
         self.music_jump_to_cursor.setText(_("&Jump to Cursor Position"))
         self.music_sync_cursor.setText(_("S&ynchronize with Cursor Position"))
         self.music_copy_image.setText(_("Copy to &Image..."))
+        self.music_export_images.setText(_("Music as &Images..."))
         self.music_next_page.setText(_("Next Page"))
         self.music_next_page.setIconText(_("Next"))
         self.music_prev_page.setText(_("Previous Page"))
         self.music_prev_page.setIconText(_("Previous"))
+        self.music_cache_statistics.setText(_("Cache &Statistics..."))
+        self.music_search.setText(_("Search Music"))
 
 
 class ComboBoxAction(QWidgetAction):
@@ -530,3 +560,25 @@ class PagerAction(QWidgetAction):
         self.parent().setCurrentPage(num)
 
 
+class SearchAction(QWidgetAction):
+    """A line edit to search text in the music."""
+    def __init__(self, panel):
+        super(SearchAction, self).__init__(panel)
+    
+    def createWidget(self, parent):
+        w = SearchEntry(parent)
+        w.textChanged.connect(self.parent().search)
+        w.returnPressed.connect(self.parent().findNext)
+        return w
+
+
+class SearchEntry(QLineEdit):
+    def __init__(self, parent):
+        super(SearchEntry, self).__init__(parent)
+        app.translateUI(self)
+    
+    def translateUI(self):
+        self.setPlaceholderText(_("Search..."))
+        self.setToolTip(_("Search text in the music."))
+
+
@@ -0,0 +1,102 @@
+# This file is part of the Frescobaldi project, http://www.frescobaldi.org/
+#
+# Copyright (c) 2008 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+"""
+Dialog showing the statistics of the cache of rendered pages.
+"""
+
+from __future__ import unicode_literals
+
+import sys
+
+from PyQt4.QtCore import QSettings, QSize, QTimer
+from PyQt4.QtGui import (
+    QCheckBox, QDialog, QDialogButtonBox, QFont, QPlainTextEdit, QVBoxLayout)
+
+import app
+import qutil
+import widgets
+import qpopplerview
+
+
+def show(musicviewpanel):
+    """Shows the dialog."""
+    dlg = Dialog(musicviewpanel)
+    dlg.show()
+    dlg.finished.connect(dlg.deleteLater)
+
+
+def logOnExit():
+    """Returns True if the statistics should be written to the log on exit."""
+    return QSettings().value("musicview/log_cache_statistics", False) in (True, "true")
+
+
+def log():
+    """Writes the statistics to the log (standard error) if desired.
+    
+    This is called when the application quits.
+    
+    """
+    if logOnExit():
+        sys.stderr.write("Music View cache statistics:\n")
+        sys.stderr.write(qpopplerview.cache.statistics().report() + "\n")
+
+
+class Dialog(QDialog):
+    def __init__(self, parent=None):
+        super(Dialog, self).__init__(parent)
+        self.text = QPlainTextEdit(readOnly=True)
+        self.text.setFont(QFont("monospace"))
+        self.logCheck = QCheckBox(checked=logOnExit())
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.resetButton = self.buttons.addButton('', QDialogButtonBox.ResetRole)
+        
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        layout.addWidget(self.text)
+        layout.addWidget(self.logCheck)
+        layout.addWidget(widgets.Separator())
+        layout.addWidget(self.buttons)
+        
+        app.translateUI(self)
+        self.buttons.rejected.connect(self.reject)
+        self.resetButton.clicked.connect(self.reset)
+        self.logCheck.toggled.connect(self.setLogOnExit)
+        self._timer = QTimer(interval=1000, timeout=self.updateText)
+        self._timer.start()
+        self.updateText()
+        qutil.saveDialogSize(self, "musicview/cache_statistics/dialog/size", QSize(400, 300))
+    
+    def translateUI(self):
+        self.setWindowTitle(app.caption(_("Music View Cache Statistics")))
+        self.logCheck.setText(_("Write the statistics to the log on exit"))
+        self.resetButton.setText(_("&Reset"))
+    
+    def updateText(self):
+        """Displays the current statistics."""
+        self.text.setPlainText(qpopplerview.cache.statistics().report())
+    
+    def reset(self):
+        """Sets all counters to zero."""
+        qpopplerview.cache.statistics().reset()
+        self.updateText()
+    
+    def setLogOnExit(self, enabled):
+        QSettings().setValue("musicview/log_cache_statistics", enabled)
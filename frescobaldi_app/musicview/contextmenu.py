@@ -73,6 +73,7 @@ def show(position, panel, link, cursor):
     
     # help
     m.addSeparator()
+    m.addAction(panel.actionCollection.music_cache_statistics)
     a = m.addAction(icons.get("help-contents"), _("Help"))
     @a.triggered.connect
     def help():
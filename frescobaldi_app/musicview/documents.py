@@ -24,6 +24,7 @@ Code to load and manage PDF documents to view.
 from __future__ import unicode_literals
 
 
+import hashlib
 import os
 import weakref
 
@@ -42,6 +43,7 @@ import popplertools
 
 
 _cache = weakref.WeakValueDictionary()
+_loaded = weakref.WeakKeyDictionary() # maps document to (filename, mtime) it was loaded from
 
 
 # This signal gets emitted when a finished Job has created new PDF document(s).
@@ -64,26 +66,87 @@ def load(filename):
     
     Returns None if the document failed to load.
     
+    The document is cached using the real path of the file, so all DocumentGroups
+    referring to the same file share the same Poppler.Document. The filename()
+    of the document remains the filename it was first loaded with.
+    
     """
     mtime = os.path.getmtime(filename)
-    key = (mtime, filename)
+    key = (mtime, os.path.realpath(filename))
     
     try:
         return _cache[key]
     except KeyError:
-        with open(filename, 'rb') as f:
-            data = QByteArray(f.read())
-        doc = popplerqt4.Poppler.Document.loadFromData(data)
+        import qpopplerview
+        import qpopplerview.textindex
+        # The file is loaded from memory and not kept open (a new engrave may
+        # overwrite it while the old document is still displayed).
+        sha1 = hashlib.sha1() if qpopplerview.cache.diskcache() else None
+        doc = popplerqt4.Poppler.Document.loadFromData(_read(filename, sha1))
         if doc:
+            if sha1:
+                # lets rendered pages be found in the disk cache
+                qpopplerview.cache.setdocumentkey(doc, sha1.hexdigest())
+            # reuse the rendered images and text of pages that did not change
+            for (oldmtime, oldfilename), olddoc in _cache.items():
+                if oldfilename == key[1]:
+                    qpopplerview.cache.reuse(olddoc, doc)
+                    qpopplerview.textindex.reuse(olddoc, doc)
+                    break
+            else:
+                qpopplerview.textindex.index(doc)
             _cache[key] = doc
+            _loaded[doc] = (filename, mtime)
         return doc or None
 
 
 def filename(poppler_document):
     """Returns the filename for the document if it was loaded via our cache."""
-    for (mtime, filename), doc in _cache.items():
-        if doc == poppler_document:
-            return filename
+    try:
+        return _loaded[poppler_document][0]
+    except KeyError:
+        pass
+
+
+def data(poppler_document):
+    """Returns a QByteArray with the PDF data of the document, read again.
+    
+    Returns None if the document was not loaded via our cache or if the file
+    has changed since, so a new Poppler.Document loaded from the data is
+    always the same as the given one.
+    
+    """
+    try:
+        filename, mtime = _loaded[poppler_document]
+    except KeyError:
+        return
+    try:
+        if os.path.getmtime(filename) == mtime:
+            data = _read(filename)
+            if os.path.getmtime(filename) == mtime:
+                return data
+    except (IOError, OSError):
+        pass
+
+
+def _read(filename, sha1=None):
+    """Returns a QByteArray with the contents of the file.
+    
+    The file is read in chunks, so it is only held once in memory. If sha1 is
+    given, it is updated with the contents on the way.
+    
+    """
+    data = QByteArray()
+    data.reserve(os.path.getsize(filename))
+    with open(filename, 'rb') as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            if sha1:
+                sha1.update(chunk)
+            data.append(chunk)
+    return data
 
 
 class Document(popplertools.Document):
@@ -18,14 +18,18 @@
 # See http://www.gnu.org/licenses/ for more information.
 
 """
-Dialog to copy contents from PDF to a raster image.
+Dialog to copy contents from PDF to a raster image,
+and to export all pages of PDF documents as images.
 """
 
 from __future__ import unicode_literals
 
 import collections
 import os
+import Queue
+import struct
 import tempfile
+import threading
 
 from PyQt4.QtCore import *
 from PyQt4.QtGui import *
@@ -38,6 +42,7 @@ import qpopplerview
 import widgets.imageviewer
 import widgets.colorbutton
 import widgets.drag
+import widgets.urlrequester
 
 try:
     import popplerqt4
@@ -242,6 +247,252 @@ class FileDragger(widgets.drag.FileDragger):
         return filename
 
 
+def export(musicviewpanel):
+    """Shows the dialog to export the pages of the PDF documents as images."""
+    docs = musicviewpanel.actionCollection.music_document_select.documents()
+    filenames = [doc.filename() for doc in docs if doc.document()]
+    if not filenames:
+        return
+    dlg = ExportDialog(musicviewpanel)
+    dlg.setFilenames(filenames)
+    if dlg.exec_():
+        dlg.export()
+    dlg.deleteLater()
+
+
+class ExportDialog(QDialog):
+    """Dialog to export all pages of some PDF documents as PNG images."""
+    def __init__(self, parent=None):
+        super(ExportDialog, self).__init__(parent)
+        self.documentsLabel = QLabel()
+        self.documentsList = QListWidget()
+        self.directoryLabel = QLabel()
+        self.directory = widgets.urlrequester.UrlRequester()
+        self.dpiLabel = QLabel()
+        self.dpiCombo = QComboBox(insertPolicy=QComboBox.NoInsert, editable=True)
+        self.dpiCombo.lineEdit().setCompleter(None)
+        self.dpiCombo.setValidator(QDoubleValidator(10.0, 1200.0, 4, self.dpiCombo))
+        self.dpiCombo.addItems([format(i) for i in 72, 100, 200, 300, 600, 1200])
+        self.colorButton = widgets.colorbutton.ColorButton()
+        self.crop = QCheckBox()
+        self.antialias = QCheckBox()
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        layout.addWidget(self.documentsLabel)
+        layout.addWidget(self.documentsList)
+        
+        grid = QGridLayout()
+        layout.addLayout(grid)
+        grid.addWidget(self.directoryLabel, 0, 0)
+        grid.addWidget(self.directory, 0, 1)
+        grid.addWidget(self.dpiLabel, 1, 0)
+        
+        controls = QHBoxLayout()
+        grid.addLayout(controls, 1, 1)
+        controls.addWidget(self.dpiCombo)
+        controls.addWidget(self.colorButton)
+        controls.addWidget(self.crop)
+        controls.addWidget(self.antialias)
+        controls.addStretch()
+        
+        layout.addWidget(widgets.Separator())
+        layout.addWidget(self.buttons)
+        
+        app.translateUI(self)
+        self.readSettings()
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        qutil.saveDialogSize(self, "export_images/dialog/size", QSize(480, 320))
+    
+    def translateUI(self):
+        self.setWindowTitle(app.caption(_("Export Music as Images")))
+        self.documentsLabel.setText(_("Export all pages of the following documents:"))
+        self.directoryLabel.setText(_("Directory:"))
+        self.dpiLabel.setText(_("DPI:"))
+        self.colorButton.setToolTip(_("Paper Color"))
+        self.crop.setText(_("Auto-crop"))
+        self.antialias.setText(_("Antialias"))
+    
+    def readSettings(self):
+        s = QSettings()
+        s.beginGroup('export_images')
+        self.dpiCombo.setEditText(s.value("dpi", "600"))
+        self.colorButton.setColor(s.value("papercolor", QColor(Qt.white)))
+        self.crop.setChecked(s.value("autocrop", True) in (True, "true"))
+        self.antialias.setChecked(s.value("antialias", True) not in (False, "false"))
+    
+    def writeSettings(self):
+        s = QSettings()
+        s.beginGroup('export_images')
+        s.setValue("dpi", self.dpiCombo.currentText())
+        s.setValue("papercolor", self.colorButton.color())
+        s.setValue("autocrop", self.crop.isChecked())
+        s.setValue("antialias", self.antialias.isChecked())
+    
+    def setFilenames(self, filenames):
+        """Sets the PDF files to choose from, all are checked."""
+        self.documentsList.clear()
+        for filename in filenames:
+            item = QListWidgetItem(os.path.basename(filename), self.documentsList)
+            item.setData(Qt.UserRole, filename)
+            item.setToolTip(filename)
+            item.setCheckState(Qt.Checked)
+        self.directory.setPath(os.path.dirname(filenames[0]))
+    
+    def filenames(self):
+        """Returns the checked PDF files."""
+        items = (self.documentsList.item(i) for i in range(self.documentsList.count()))
+        return [item.data(Qt.UserRole) for item in items if item.checkState() == Qt.Checked]
+    
+    def export(self):
+        """Writes the settings and starts exporting in the background."""
+        self.writeSettings()
+        filenames = self.filenames()
+        directory = self.directory.path()
+        if not filenames or not directory:
+            return
+        dpi = float(self.dpiCombo.currentText() or '600')
+        dpi = max(dpi, self.dpiCombo.validator().bottom())
+        dpi = min(dpi, self.dpiCombo.validator().top())
+        options = qpopplerview.RenderOptions()
+        options.setPaperColor(self.colorButton.color())
+        if self.antialias.isChecked():
+            if popplerqt4:
+                options.setRenderHint(
+                    popplerqt4.Poppler.Document.Antialiasing |
+                    popplerqt4.Poppler.Document.TextAntialiasing)
+        else:
+            options.setRenderHint(0)
+        
+        e = Exporter(filenames, directory, dpi, options, self.crop.isChecked())
+        parent = self.parent()
+        d = QProgressDialog(parent)
+        d.setModal(True)
+        d.setMinimumDuration(0)
+        d.setRange(0, 0)
+        d.setLabelText(_("Exporting images..."))
+        d.canceled.connect(e.abort)
+        
+        def progress(num, total):
+            d.setRange(0, total)
+            d.setValue(num)
+            d.setLabelText(_("Exporting page {num} of {total}...").format(
+                num=num, total=total))
+        
+        def finished():
+            e.deleteLater()
+            d.deleteLater()
+            d.hide()
+            if e.errors and not e.aborted():
+                QMessageBox.warning(parent, _("Error"), _(
+                    "Could not save the following images:\n\n{files}").format(
+                    files="\n".join(e.errors[:10])))
+        
+        e.progress.connect(progress)
+        e.finished.connect(finished)
+        e.start()
+
+
+class Exporter(QThread):
+    """Exports the pages of PDF documents as PNG images in the background.
+    
+    The pages are rendered, cropped and saved by a number of worker threads,
+    each using its own Poppler.Document instances. Images are saved as soon as
+    they are ready, so only one image per worker is held in memory.
+    
+    """
+    progress = pyqtSignal(int, int)
+    
+    def __init__(self, filenames, directory, dpi, options, autocrop, parent=None):
+        super(Exporter, self).__init__(parent)
+        self.filenames = filenames
+        self.directory = directory
+        self.dpi = dpi
+        self.options = options
+        self.autocrop = autocrop
+        self.errors = []
+        self._stop = False
+        self._count = 0
+        self._lock = threading.Lock()
+    
+    def abort(self):
+        """Cancels exporting."""
+        self._stop = True
+    
+    def aborted(self):
+        """Returns whether abort() was called."""
+        return self._stop
+    
+    def run(self):
+        jobs = Queue.Queue()
+        basenames = [os.path.splitext(os.path.basename(filename))[0]
+                     for filename in self.filenames]
+        for index, (filename, basename) in enumerate(zip(self.filenames, basenames), 1):
+            doc = popplerqt4.Poppler.Document.load(filename)
+            if not doc:
+                self.errors.append(filename)
+                continue
+            count = doc.numPages()
+            if basenames.count(basename) > 1:
+                # PDF files with the same name in different directories
+                basename = "{0}-{1}".format(basename, index)
+            base = os.path.join(self.directory, basename)
+            for num in range(count):
+                name = "{0}-{1:0{2}}.png".format(base, num + 1, len(format(count)))
+                jobs.put((filename, num, name))
+        total = jobs.qsize()
+        workers = [threading.Thread(target=self.work, args=(jobs, total))
+                   for i in range(min(max(1, QThread.idealThreadCount()), total))]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+    
+    def work(self, jobs, total):
+        """Renders and saves images until there are no more jobs (in a worker thread)."""
+        docs = {}
+        while not self._stop:
+            try:
+                filename, num, name = jobs.get_nowait()
+            except Queue.Empty:
+                return
+            try:
+                self.save(docs, filename, num, name)
+            except Exception:
+                # a page that can't be loaded or rendered should not stop the others
+                self.errors.append(name)
+            with self._lock:
+                self._count += 1
+                self.progress.emit(self._count, total)
+    
+    def save(self, docs, filename, num, name):
+        """Renders page num of the PDF filename and saves it (in a worker thread).
+        
+        docs is the worker's dictionary of loaded Poppler documents.
+        Records the name in the errors list if the image could not be made.
+        
+        """
+        try:
+            doc = docs[filename]
+        except KeyError:
+            doc = docs[filename] = popplerqt4.Poppler.Document.load(filename)
+        if not doc:
+            self.errors.append(name)
+            return
+        page = qpopplerview.Page(doc, num)
+        page.computeSize()
+        image = page.image(page.rect(), self.dpi, self.dpi, self.options)
+        if image is None or image.isNull():
+            self.errors.append(name)
+            return
+        if self.autocrop:
+            image = image.copy(autoCropRect(image))
+        if not image.save(name):
+            self.errors.append(name)
+
+
 def autoCropRect(image):
     """Returns a QRect specifying the contents of the QImage.
     
@@ -254,8 +505,48 @@ def autoCropRect(image):
     for x, y in (0, 0), (w - 1, 0), (w - 1, h - 1), (0, h - 1):
         colors[image.pixel(x, y)] += 1
     most = max(colors, key=colors.get)
-    # let Qt do the masking work
-    mask = image.createMaskFromColor(most)
-    return QRegion(QBitmap.fromImage(mask)).boundingRect()
+    # compare the scanlines with a line of background pixels, so that the
+    # comparisons are done on strings instead of pixel by pixel; only one
+    # scanline at a time is copied
+    if image.format() in (QImage.Format_RGB32, QImage.Format_ARGB32):
+        def line(y):
+            return image.constScanLine(y).asstring(w * 4)
+    else:
+        def line(y):
+            l = image.copy(0, y, w, 1).convertToFormat(QImage.Format_ARGB32)
+            return l.constScanLine(0).asstring(w * 4)
+    empty = struct.pack(b'=I', most) * w
+    top = 0
+    while top < h and line(top) == empty:
+        top += 1
+    if top == h:
+        return QRect()
+    bottom = h - 1
+    while line(bottom) == empty:
+        bottom -= 1
+    left, right = w, 0
+    for y in range(top, bottom + 1):
+        l = line(y)
+        if l[:left * 4] != empty[:left * 4]:
+            # find the first pixel that differs, by bisecting
+            lo, hi = 0, left
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if l[:(mid + 1) * 4] == empty[:(mid + 1) * 4]:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            left = lo
+        if l[right * 4:] != empty[right * 4:]:
+            # find the last pixel that differs, by bisecting
+            lo, hi = right, w
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if l[mid * 4:] == empty[mid * 4:]:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            right = lo
+    return QRect(left, top, right - left, bottom - top + 1)
 
 
@@ -26,9 +26,13 @@ from __future__ import unicode_literals
 import re
 import os
 import sys
+import array
+import bisect
+import operator
+import threading
 import weakref
 
-from PyQt4.QtCore import QUrl
+from PyQt4.QtCore import pyqtSignal, QThread, QUrl
 from PyQt4.QtGui import QTextCursor
 
 import qpopplerview
@@ -81,31 +85,66 @@ class Links(object):
     
     Only textedit:// urls are stored.
     
+    The links are harvested page by page in a background thread, and become
+    available incrementally. Use prioritize() to have some pages (e.g. the
+    visible ones) handled first.
+    
     """
     def __init__(self, document):
         self._links = {}
         self._docs = {}
-        
-        import popplerqt4
-        with qpopplerview.lock(document):
-            for num in range(document.numPages()):
-                page = document.page(num)
-                for link in page.links():
-                    if isinstance(link, popplerqt4.Poppler.LinkBrowse):
-                        m = textedit_match(link.url())
-                        if m:
-                            filename, line, col = readurl(m)
-                            l = self._links.setdefault(filename, {})
-                            l.setdefault((line, col), []).append((num, link.linkArea()))
-
-        for filename in self._links:
-            for d in app.documents:
-                s = scratchdir.scratchdir(d)
-                if (s.directory() and util.equal_paths(filename, s.path())
-                    or d.url().toLocalFile() == filename):
-                    self.bind(filename, d)
+        self._harvester = Harvester(document)
+        self._harvester.found.connect(self.slotFound)
+        self._harvester.finished.connect(self.slotFinished)
         app.documentLoaded.connect(self.slotDocumentLoaded)
         app.documentClosed.connect(self.slotDocumentClosed)
+        self._harvester.start()
+    
+    def prioritize(self, pageNumbers):
+        """Harvests the links of the given pages first.
+        
+        The other pages are then handled in order of their distance to these pages.
+        
+        """
+        if self._harvester:
+            self._harvester.prioritize(pageNumbers)
+    
+    def isComplete(self):
+        """Returns True if the links of all pages have been harvested."""
+        return self._harvester is None
+    
+    def slotFound(self, num, links):
+        """Called in the main thread when the links of a page have been harvested."""
+        new = {}
+        for filename, line, col, area in links:
+            try:
+                l = self._links[filename]
+            except KeyError:
+                l = self._links[filename] = {}
+                self.bindDocument(filename)
+            try:
+                l[(line, col)].append((num, area))
+            except KeyError:
+                dest = l[(line, col)] = [(num, area)]
+                new.setdefault(filename, []).append((line, col, dest))
+        # add the new links of the page to the bound documents at once
+        for filename, added in new.items():
+            bound = self._docs.get(filename)
+            if bound:
+                bound.addLinks(added)
+    
+    def slotFinished(self):
+        """Called when all the links have been harvested."""
+        self._harvester = None
+    
+    def bindDocument(self, filename):
+        """Binds the filename to an open document, if there is one."""
+        for d in app.documents:
+            s = scratchdir.scratchdir(d)
+            if (s.directory() and util.equal_paths(filename, s.path())
+                or d.url().toLocalFile() == filename):
+                self.bind(filename, d)
+                return
     
     def bind(self, filename, doc):
         """Binds the given filename to the given document.
@@ -164,39 +203,127 @@ class Links(object):
 
 
 class BoundLinks(object):
-    """Stores links as QTextCursors for a document."""
+    """Stores the text positions of the links in a document.
+    
+    The positions are kept in a sorted array, which is adjusted when the
+    document changes, so they keep pointing to the same text. A QTextCursor
+    is only created when a link is actually followed.
+    
+    Links that are added later are collected, and merged into the sorted
+    array at once when the positions are needed.
+    
+    """
     def __init__(self, doc, links):
-        """Creates QTextCursor instances for every link, keeps a reference to the document."""
+        """Stores the position of every link, keeps a reference to the document."""
         self.document = doc
-        # make a sorted list of cursors with their [(pageNum, linkArea) ...] destinations list
-        self._cursor_dict = d = {}              # mapping from (line, col) to QTextCursor
-        self._cursors = cursors = []            # sorted list of the cursors
+        # make a sorted array of positions with their [(pageNum, linkArea) ...] destinations list
+        self._positions = positions = array.array(b'i')  # sorted text positions
+        self._keys = keys = []                  # corresponding list of (line, col) tuples
         self._destinations = destinations = []  # corresponding list of destinations
+        self._index = None                      # mapping from (line, col) to index, built on demand
+        self._pending = []                      # added (position, key, destination) tuples
         for pos, dest in sorted(links.items()):
             line, column = pos
             b = doc.findBlockByNumber(line - 1)
             if b.isValid():
-                c = d[pos] = QTextCursor(doc)
-                c.setPosition(b.position() + column)
-                cursors.append(c)
+                positions.append(b.position() + column)
+                keys.append(pos)
                 destinations.append(dest)
+        doc.contentsChange.connect(self.slotContentsChange)
+    
+    def slotContentsChange(self, position, removed, added):
+        """Called when the document changes, adjusts the positions after the change.
         
-    def cursor(self, line, column):
-        """Returns the QTextCursor for the give line/col."""
-        return self._cursor_dict.get((line, column))
+        A syntax highlighter reports a change of formats only as a change with
+        the same number of characters removed and added, so only the part of
+        the change that really changes the length of the text is used.
+        
+        """
+        common = min(removed, added)
+        position += common
+        removed -= common
+        added -= common
+        if not removed and not added:
+            return
+        self._merge()
+        positions = self._positions
+        start = bisect.bisect_left(positions, position)
+        end = bisect.bisect_left(positions, position + removed)
+        if start < end:
+            # links in removed text move to the start of the change
+            positions[start:end] = array.array(b'i', [position]) * (end - start)
+        delta = added - removed
+        if delta and end < len(positions):
+            positions[end:] = array.array(b'i', [pos + delta for pos in positions[end:]])
+    
+    def add(self, line, column, destination):
+        """Adds a link that was harvested after we were created."""
+        self.addLinks([(line, column, destination)])
     
-    def cursors(self):
-        """Returns the list of cursors, sorted on cursor position."""
-        return self._cursors
+    def addLinks(self, links):
+        """Adds links that were harvested after we were created.
+        
+        links is a list of (line, column, destination) tuples.
         
+        """
+        block = self.document.findBlockByNumber
+        for line, column, destination in links:
+            b = block(line - 1)
+            if b.isValid():
+                self._pending.append((b.position() + column, (line, column), destination))
+    
+    def _merge(self):
+        """(Internal) Merges the added links into the sorted positions."""
+        if not self._pending:
+            return
+        new, self._pending = self._pending, []
+        new.sort(key=operator.itemgetter(0))
+        # copy each run of existing links between two new links at once
+        positions, keys, destinations = self._positions, self._keys, self._destinations
+        mergedPositions, mergedKeys, mergedDestinations = array.array(b'i'), [], []
+        start = 0
+        for pos, key, destination in new:
+            end = bisect.bisect_right(positions, pos, start)
+            mergedPositions.extend(positions[start:end])
+            mergedPositions.append(pos)
+            mergedKeys.extend(keys[start:end])
+            mergedKeys.append(key)
+            mergedDestinations.extend(destinations[start:end])
+            mergedDestinations.append(destination)
+            start = end
+        mergedPositions.extend(positions[start:])
+        mergedKeys.extend(keys[start:])
+        mergedDestinations.extend(destinations[start:])
+        positions[:] = mergedPositions
+        keys[:] = mergedKeys
+        destinations[:] = mergedDestinations
+        self._index = None
+    
+    def cursor(self, line, column):
+        """Returns a QTextCursor for the give line/col, or None."""
+        self._merge()
+        if self._index is None:
+            self._index = dict((key, i) for i, key in enumerate(self._keys))
+        index = self._index.get((line, column))
+        if index is not None:
+            c = QTextCursor(self.document)
+            c.setPosition(min(self._positions[index], self.document.characterCount() - 1))
+            return c
+    
+    def positions(self):
+        """Returns the array of text positions of the links, in sorted order."""
+        self._merge()
+        return self._positions
+    
     def destinations(self):
         """Returns the list of destinations.
         
-        Each destination corresponds with the cursor at the same index in the cursors() list.
+        Each destination corresponds with the position at the same index in the positions() array.
         Each destination is a list of (pageNum, QRectF) pairs, because many point-and-click
         objects can point to the same place in the text document.
         
         """
+        self._merge()
         return self._destinations
     
     def indices(self, cursor):
@@ -212,14 +339,16 @@ class BoundLinks(object):
         points to the _ending_ point of a slur, beam or phrasing slur.
         
         """
-        cursors = self._cursors
+        self._merge()
+        positions = self._positions
+        block = self.document.findBlock
         
         def findlink(pos):
-            # binary search in list of cursors
-            lo, hi = 0, len(cursors)
+            # binary search in array of positions
+            lo, hi = 0, len(positions)
             while lo < hi:
                 mid = (lo + hi) // 2
-                if pos < cursors[mid].position():
+                if pos < positions[mid]:
                     hi = mid
                 else:
                     lo = mid + 1
@@ -229,7 +358,7 @@ class BoundLinks(object):
             end = findlink(cursor.selectionEnd() - 1)
             if end >= 0:
                 start = findlink(cursor.selectionStart())
-                if start < 0 or cursors[start].position() < cursor.selectionStart():
+                if start < 0 or positions[start] < cursor.selectionStart():
                     start += 1
                 if start <= end:
                     return slice(start, end+1)
@@ -239,12 +368,12 @@ class BoundLinks(object):
         if index < 0:
             return # before all other links
         
-        cur2 = cursors[index]
-        if cur2.position() < cursor.position():
+        pos2 = positions[index]
+        if pos2 < cursor.position():
             # is the cursor at an ending token like a slur end?
             prevcol = -1
-            if cur2.block() == cursor.block():
-                prevcol = cur2.position() - cur2.block().position()
+            if block(pos2) == cursor.block():
+                prevcol = pos2 - cursor.block().position()
             col = cursor.position() - cursor.block().position()
             found = False
             tokens = tokeniter.Runner(cursor.block(), True)
@@ -268,11 +397,75 @@ class BoundLinks(object):
                         break
             if found:
                 index = findlink(tokens.block.position() + token.pos)
-                if index < 0 or cursors[index].block() != tokens.block:
+                if index < 0 or block(positions[index]) != tokens.block:
                     return
-            elif cur2.block() != cursor.block():
+            elif block(pos2) != cursor.block():
                 return False
         # highlight it!
         return slice(index, index+1)
 
 
+
+
+class Harvester(QThread):
+    """Collects the textedit links of a Poppler document page by page.
+    
+    For every page, the found signal is emitted with the page number and a
+    list of (filename, line, column, linkArea) tuples.
+    
+    """
+    found = pyqtSignal(int, object)
+    
+    def __init__(self, document):
+        super(Harvester, self).__init__()
+        self.document = document
+        self._lock = threading.Lock()
+        self._remaining = set(range(document.numPages()))
+        self._priority = []
+        self.finished.connect(self.slotFinished)
+    
+    def prioritize(self, pageNumbers):
+        """Handles the given pages first, and then the pages around them."""
+        with self._lock:
+            self._priority = list(pageNumbers)
+    
+    def nextPageNumber(self):
+        """Returns the number of the page to harvest next, or None if ready."""
+        with self._lock:
+            if not self._remaining:
+                return
+            for num in self._priority:
+                if num in self._remaining:
+                    break
+            else:
+                if self._priority:
+                    start = self._priority[0]
+                    num = min(self._remaining, key=lambda n: abs(n - start))
+                else:
+                    num = min(self._remaining)
+            self._remaining.remove(num)
+            return num
+    
+    def run(self):
+        """Main method of this thread, called by Qt on start()."""
+        import popplerqt4
+        num = self.nextPageNumber()
+        while num is not None:
+            links = []
+            with qpopplerview.lock(self.document):
+                page = self.document.page(num)
+                for link in page.links():
+                    if isinstance(link, popplerqt4.Poppler.LinkBrowse):
+                        m = textedit_match(link.url())
+                        if m:
+                            filename, line, col = readurl(m)
+                            links.append((filename, line, col, link.linkArea()))
+            if links:
+                self.found.emit(num, links)
+            num = self.nextPageNumber()
+    
+    def slotFinished(self):
+        """Called when the thread has completed."""
+        self.document = None
+
+
@@ -68,6 +68,12 @@ class MusicView(QWidget):
         self._highlightRange = None
         self._highlightTimer = QTimer(singleShot=True, interval= 250, timeout=self.updateHighlighting)
         self._highlightRemoveTimer = QTimer(singleShot=True, timeout=self.clearHighlighting)
+        self._textIndex = None
+        self._searchText = ""
+        self._searchResults = []
+        self._searchIndex = -1
+        self._searchHighlighter = Highlighter()
+        self._searchTimer = QTimer(singleShot=True, interval=250, timeout=self.updateSearch)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -84,6 +90,8 @@ class MusicView(QWidget):
         self.view.surface().setShowUrlTips(False)
         self.view.surface().linkHelpRequested.connect(self.slotLinkHelpRequested)
         
+        self.view.verticalScrollBar().valueChanged.connect(self.prioritizeLinks)
+        self.view.horizontalScrollBar().valueChanged.connect(self.prioritizeLinks)
         self.view.viewModeChanged.connect(self.updateZoomInfo)
         self.view.surface().pageLayout().scaleChanged.connect(self.updateZoomInfo)
         self.view.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -110,9 +118,18 @@ class MusicView(QWidget):
         document = doc.document()
         if document:
             self._links = pointandclick.links(document)
+            import qpopplerview.textindex
+            self._textIndex = qpopplerview.textindex.index(document)
+            self._textIndex.changed.connect(self._searchTimer.start)
             self.view.load(document)
             position = self._positions.get(doc, (0, 0, 0))
             self.view.setPosition(position, True)
+            self.prioritizeLinks()
+
+    def prioritizeLinks(self):
+        """Lets the links of the visible pages be harvested first."""
+        if self._links and not self._links.isComplete():
+            self._links.prioritize(page.pageNumber() for page in self.view.visiblePages())
 
     def clear(self):
         """Empties the view."""
@@ -121,8 +138,15 @@ class MusicView(QWidget):
             self._positions[cur] = self.view.position()
         self._currentDocument = None
         self._links = None
+        if self._textIndex:
+            self._textIndex.changed.disconnect(self._searchTimer.start)
+            self._textIndex = None
+        self._searchTimer.stop()
+        self._searchResults = []
+        self._searchIndex = -1
         self._highlightRange = None
         self._highlightTimer.stop()
+        self.view.surface().clearHighlight(self._searchHighlighter)
         self.view.clear()
         
     def readSettings(self):
@@ -130,6 +154,7 @@ class MusicView(QWidget):
         # background and highlight colors of music view
         colors = textformats.formatData('editor').baseColors
         self._highlightMusicFormat.setColor(colors['musichighlight'])
+        self._searchHighlighter.setColor(colors['search'].darker(150))
         color = colors['selectionbackground']
         color.setAlpha(128)
         self._highlightFormat.setBackground(color)
@@ -331,6 +356,39 @@ class MusicView(QWidget):
         self.view.center(self.destinationsRect(links.destinations()[s]).center())
         self.highlight(links.destinations(), s, 10000)
     
+    def search(self, text):
+        """Highlights all occurrences of the text in the PDF document.
+        
+        The search is performed in the background text index of the document,
+        and updated when more pages have been indexed.
+        
+        """
+        self._searchText = text
+        self._searchIndex = -1
+        self.updateSearch()
+        if self._searchResults:
+            self.findNext()
+    
+    def updateSearch(self):
+        """Highlights the occurrences of the current search text."""
+        surface = self.view.surface()
+        if not self._searchText or not self._textIndex:
+            self._searchResults = []
+            surface.clearHighlight(self._searchHighlighter)
+            return
+        self._searchResults = results = self._textIndex.search(self._searchText)
+        layout = surface.pageLayout()
+        areas = [(layout[pageNum], rect) for pageNum, rect in results]
+        surface.highlight(self._searchHighlighter, areas)
+    
+    def findNext(self):
+        """Scrolls to the next occurrence of the current search text."""
+        if self._searchResults:
+            self._searchIndex = (self._searchIndex + 1) % len(self._searchResults)
+            pageNum, rect = self._searchResults[self._searchIndex]
+            r = self.view.surface().pageLayout()[pageNum].linkRect(rect)
+            self.view.ensureVisible(r.center().x(), r.center().y(), 50+r.width()/2, 50+r.height()/2)
+    
     def destinationsRect(self, destinations):
         """Return the rectangle containing all destinations."""
         layout = self.view.surface().pageLayout()
@@ -57,7 +57,7 @@ def print_(doc, filename=None, widget=None):
         "Do you want to continue?").format(resolution=300),
         QMessageBox.Yes | QMessageBox.No) != QMessageBox.Yes:
         return # cancelled
-        
+    
     filename = os.path.basename(filename) if filename else _("PDF Document")
     
     printer = QPrinter()
@@ -94,6 +94,13 @@ def print_(doc, filename=None, widget=None):
         
         p = Printer()
         p.setDocument(doc)
+        import musicview.documents
+        data = musicview.documents.data(doc)
+        if data is not None:
+            # let every rendering thread use its own copy of the document,
+            # loaded from the same PDF data as the displayed one
+            import popplerqt4
+            p.setDocumentLoader(lambda: popplerqt4.Poppler.Document.loadFromData(data))
         p.setPrinter(printer)
         p.setResolution(300)
         
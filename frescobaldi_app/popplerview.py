@@ -26,7 +26,10 @@ This is used throughout Frescobaldi, to obey color settings etc.
 
 from __future__ import unicode_literals
 
+import os
+
 from PyQt4.QtCore import QSettings
+from PyQt4.QtGui import QDesktopServices
 
 import app
 import textformats
@@ -42,6 +45,7 @@ app.settingsChanged.connect(_setbackground, -1)
 _setbackground()
 
 
+
 class View(qpopplerview.View):
     def __init__(self, parent=None):
         super(View, self).__init__(parent)
@@ -103,8 +107,72 @@ class MagnifierSettings(object):
         s.setValue("scale", self.scale)
 
 
+class DiskCacheSettings(object):
+    """Manages settings for the on-disk cache of rendered pages."""
+    sizeRange = (10, 10000)
+    
+    def __init__(self, enabled=False, size=200):
+        self.enabled = enabled
+        self.size = size
+    
+    @classmethod
+    def load(cls):
+        """Returns a loaded DiskCache settings instance."""
+        self = cls()
+        s = QSettings()
+        s.beginGroup("musicview/disk_cache")
+        self.enabled = s.value("enabled", self.enabled) in (True, "true")
+        try:
+            self.size = int(s.value("size", self.size))
+        except ValueError:
+            pass
+        self.size = bound(self.size, *cls.sizeRange)
+        return self
+    
+    def save(self):
+        """Stores the settings."""
+        s = QSettings()
+        s.beginGroup("musicview/disk_cache")
+        s.setValue("enabled", self.enabled)
+        s.setValue("size", self.size)
+
+
 def bound(value, start, end):
     """Clips value so it falls in the int range defined by start and end."""
     return max(start, min(end, value))
 
 
+# global setup of the disk cache for rendered pages
+def _setdiskcache():
+    s = DiskCacheSettings.load()
+    cache = qpopplerview.cache.diskcache()
+    if not s.enabled:
+        qpopplerview.cache.setdiskcache(None)
+    elif cache:
+        cache.setmaxsize(s.size)
+    else:
+        import qpopplerview.diskcache
+        directory = os.path.join(QDesktopServices.storageLocation(
+            QDesktopServices.CacheLocation), "pages")
+        qpopplerview.cache.setdiskcache(qpopplerview.diskcache.DiskCache(directory, s.size))
+app.settingsChanged.connect(_setdiskcache, -1)
+_setdiskcache()
+
+
+# the range of the preview resolution setting (0 = off)
+previewResolutionRange = (0, 72)
+
+def previewResolution():
+    """Returns the resolution setting for the quick preview of pages (0 = off)."""
+    try:
+        dpi = int(QSettings().value("musicview/preview_resolution", 24))
+    except ValueError:
+        dpi = 24
+    return bound(dpi, *previewResolutionRange)
+
+
+# global setup of the resolution of the quick preview of pages
+def _setpreviewresolution():
+    qpopplerview.cache.setpreviewresolution(previewResolution())
+app.settingsChanged.connect(_setpreviewresolution, -1)
+_setpreviewresolution()
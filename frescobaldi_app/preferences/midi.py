@@ -123,11 +123,13 @@ class Prefs(preferences.Group):
         super(Prefs, self).__init__(page)
         
         self._closeOutputs = QCheckBox(clicked=self.changed)
+        self._lookahead = QCheckBox(clicked=self.changed)
         
         layout = QVBoxLayout()
         self.setLayout(layout)
         
         layout.addWidget(self._closeOutputs)
+        layout.addWidget(self._lookahead)
         app.translateUI(self)
     
     def translateUI(self):
@@ -145,13 +147,29 @@ class Prefs(preferences.Group):
             "the instruments are reset to the default piano (instrument 0). "
             "In that case, playing the file from the beginning sets up the "
             "instruments again.</p>\n"))
+        self._lookahead.setText(_("Send MIDI events ahead of time"))
+        self._lookahead.setToolTip(_(
+            "Sends MIDI events in batches with timestamps, for steadier timing. "
+            "See \"What's This\" for more information."))
+        self._lookahead.setWhatsThis(_(
+            "<p>If checked, the MIDI player sends the events of the coming "
+            "fraction of a second at once, each with the time it should be "
+            "played, and the MIDI output plays them exactly in time.</p>\n"
+            "<p>This avoids uneven timing in dense passages when the computer "
+            "is busy, at the cost of a small delay between the player and "
+            "the sound.</p>\n"))
 
     def loadSettings(self):
+        s = QSettings()
         self._closeOutputs.setChecked(
-            QSettings().value("midi/close_outputs", False) in (True, 'true'))
+            s.value("midi/close_outputs", False) in (True, 'true'))
+        self._lookahead.setChecked(
+            s.value("midi/player/lookahead", False) in (True, 'true'))
     
     def saveSettings(self):
-        QSettings().setValue("midi/close_outputs", self._closeOutputs.isChecked())
+        s = QSettings()
+        s.setValue("midi/close_outputs", self._closeOutputs.isChecked())
+        s.setValue("midi/player/lookahead", self._lookahead.isChecked())
 
 
 
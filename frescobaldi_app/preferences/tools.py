@@ -139,6 +139,19 @@ class MusicView(preferences.Group):
         layout.addWidget(self.enableKineticScrolling)
         self.showScrollbars = QCheckBox(toggled=self.changed)
         layout.addWidget(self.showScrollbars)
+        
+        self.diskCache = QCheckBox(toggled=self.changed)
+        self.diskCacheSize = QSpinBox(valueChanged=self.changed)
+        self.diskCacheSize.setRange(*popplerview.DiskCacheSettings.sizeRange)
+        self.diskCache.toggled.connect(self.diskCacheSize.setEnabled)
+        layout.addWidget(self.diskCache, 4, 0, 1, 2)
+        layout.addWidget(self.diskCacheSize, 4, 2)
+        
+        self.previewResolutionLabel = QLabel()
+        self.previewResolution = QSpinBox(valueChanged=self.changed)
+        self.previewResolution.setRange(*popplerview.previewResolutionRange)
+        layout.addWidget(self.previewResolutionLabel, 5, 0, 1, 2)
+        layout.addWidget(self.previewResolution, 5, 2)
         app.translateUI(self)
         
     def translateUI(self):
@@ -155,6 +168,18 @@ class MusicView(preferences.Group):
         # L10N: "Kinetic Scrolling" is a checkbox label, as in "Enable Kinetic Scrolling"
         self.enableKineticScrolling.setText(_("Kinetic Scrolling"))
         self.showScrollbars.setText(_("Show Scrollbars"))
+        self.diskCache.setText(_("Keep rendered pages on disk"))
+        self.diskCache.setToolTip(_(
+            "If checked, rendered pages are stored on disk, so they don't need "
+            "to be rendered again after restarting or reopening a PDF document."))
+        # L10N: as in "200 MB", appended after number in spinbox, note the leading space
+        self.diskCacheSize.setSuffix(_(" MB"))
+        self.previewResolutionLabel.setText(_("Preview Resolution:"))
+        self.previewResolutionLabel.setToolTip(_(
+            "The resolution of the quick, rough rendering of a page that is "
+            "displayed until the page has been rendered in full quality."))
+        self.previewResolution.setSuffix(_(" DPI"))
+        self.previewResolution.setSpecialValueText(_("Off"))
             
     def loadSettings(self):
         s = popplerview.MagnifierSettings.load()
@@ -166,6 +191,12 @@ class MusicView(preferences.Group):
         self.enableKineticScrolling.setChecked(kineticScrollingActive)
         showScrollbars = ks.value("musicview/show_scrollbars", True) not in (False, "false")
         self.showScrollbars.setChecked(showScrollbars)
+        
+        s = popplerview.DiskCacheSettings.load()
+        self.diskCache.setChecked(s.enabled)
+        self.diskCacheSize.setValue(s.size)
+        self.diskCacheSize.setEnabled(s.enabled)
+        self.previewResolution.setValue(popplerview.previewResolution())
     
     def saveSettings(self):
         s = popplerview.MagnifierSettings()
@@ -176,6 +207,12 @@ class MusicView(preferences.Group):
         ks = QSettings()
         ks.setValue("musicview/kinetic_scrolling", self.enableKineticScrolling.isChecked())
         ks.setValue("musicview/show_scrollbars", self.showScrollbars.isChecked())
+        
+        s = popplerview.DiskCacheSettings()
+        s.enabled = self.diskCache.isChecked()
+        s.size = self.diskCacheSize.value()
+        s.save()
+        ks.setValue("musicview/preview_resolution", self.previewResolution.value())
 
 class CharMap(preferences.Group):
     def __init__(self, page):
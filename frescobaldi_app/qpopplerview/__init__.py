@@ -67,8 +67,13 @@ sets the view mode to FixedScale.  View emits viewModeChanged(mode) on mode chan
 View, Surface, (Abstract)Layout and Page can all be inherited from to build
 more specialized Poppler viewers.
 
-The cache module implements in-memory caching for drawed Page images.
-The images are rendered in a background thread.
+The cache module implements in-memory caching for drawed Page images, which are
+rendered in tiles, so only the visible parts of a Page need to be rendered.
+The images are rendered in a background thread.  Optionally, a
+diskcache.DiskCache can be set to keep rendered images persistently on disk.
+
+The textindex module extracts the text of all pages of a document in a
+background thread, so it can be searched quickly.
 
 Furthermore, there is a printer module containing functions to create a PostScript
 file of a Poppler.Document and a class to print a Poppler.Document to a QPrinter
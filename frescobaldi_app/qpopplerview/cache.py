@@ -20,8 +20,16 @@
 
 """
 Caching of generated images.
+
+Pages are rendered in tiles of at most tilesize x tilesize pixels, so that
+only the visible parts of a page need to be rendered, and so that parts of
+a page can be evicted from the cache independently.
 """
 
+import collections
+import hashlib
+import heapq
+import itertools
 import time
 import weakref
 
@@ -30,19 +38,29 @@ try:
 except ImportError:
     from . import popplerqt4_dummy as popplerqt4
 
-from PyQt4.QtCore import QThread
+from PyQt4.QtCore import QThread, pyqtSignal
 
 from . import render
 from . import rectangles
 from .locking import lock
 
-__all__ = ['maxsize', 'setmaxsize', 'image', 'generate', 'clear', 'links', 'options']
+__all__ = [
+    'maxsize', 'setmaxsize', 'tiles', 'image', 'closest', 'scaled', 'generate',
+    'prefetch', 'cancel', 'cancelprefetch', 'queuelength', 'waittime',
+    'clear', 'links', 'options', 'setdiskcache', 'diskcache', 'setdocumentkey',
+    'fingerprint', 'reuse', 'reuser', 'statistics', 'preview', 'generatepreview',
+    'previewresolution', 'setpreviewresolution',
+]
 
 
 _cache = weakref.WeakKeyDictionary()
 _schedulers = weakref.WeakKeyDictionary()
 _options = weakref.WeakKeyDictionary()
 _links = weakref.WeakKeyDictionary()
+_documentkeys = weakref.WeakKeyDictionary()
+_fingerprints = weakref.WeakKeyDictionary()
+_previews = weakref.WeakKeyDictionary()
+_reusers = weakref.WeakKeyDictionary()
 
 
 # cache size
@@ -51,6 +69,22 @@ _currentsize = 0
 
 _globaloptions = None
 
+# second-level cache on disk
+_diskcache = None
+
+# prefetching stops when the cache is filled above this fraction of its size
+_prefetchlimit = 0.75
+
+# resolution of the quick preview shown while the tiles are rendered
+_previewresolution = 24.0
+
+# the width and height of a rendered tile
+tilesize = 512
+
+
+# A Tile is a rectangular part of a rendered page, in pixels.
+Tile = collections.namedtuple('Tile', 'x y w h')
+
 
 def setmaxsize(maxsize):
     """Sets the maximum cache size in Megabytes."""
@@ -67,66 +101,237 @@ def maxsize():
 def clear(document=None):
     """Clears the whole cache or the cache for the given Poppler.Document."""
     if document:
-        try:
-            del _cache[document]
-        except KeyError:
-            pass
+        for d in _cache, _previews:
+            try:
+                del d[document]
+            except KeyError:
+                pass
     else:
         _cache.clear()
+        _previews.clear()
         global _currentsize
         _currentsize = 0
 
 
-def image(page, exact=True):
-    """Returns a rendered image for given Page if in cache.
+def setdiskcache(diskcache):
+    """Sets a diskcache.DiskCache to store rendered tiles persistently.
     
-    If exact is True (default), the function returns None if the exact size was
-    not in the cache. If exact is False, the function may return a temporary
-    rendering of the page scaled from a different size, if that was available.
+    Use None to disable the disk cache. Tiles are only stored for documents
+    that have a key set using setdocumentkey().
+    
+    """
+    global _diskcache
+    _diskcache = diskcache
+
+
+def diskcache():
+    """Returns the diskcache.DiskCache that is used, if any."""
+    return _diskcache
+
+
+def setdocumentkey(document, key):
+    """Sets a string uniquely identifying the contents of the Poppler.Document.
+    
+    This is e.g. a hash of the PDF file. It is used to find tiles of the
+    document in the disk cache, even after the document was reloaded.
+    
+    """
+    _documentkeys[document] = key
+
+
+def tiles(width, height, rect=None):
+    """Returns the list of Tiles of a page rendered at the given width and height.
+    
+    If a QRect is given, only the tiles intersecting the rectangle are returned.
+    
+    """
+    width, height = int(round(width)), int(round(height))
+    if rect is None:
+        left, top, right, bottom = 0, 0, width, height
+    else:
+        left, top = max(0, rect.x()), max(0, rect.y())
+        right = min(width, rect.x() + rect.width())
+        bottom = min(height, rect.y() + rect.height())
+    result = []
+    for y in range(top - top % tilesize, bottom, tilesize):
+        for x in range(left - left % tilesize, right, tilesize):
+            result.append(Tile(x, y, min(tilesize, width - x), min(tilesize, height - y)))
+    return result
+
+
+def image(page, tile):
+    """Returns the rendered image for the Tile of the given Page if in cache.
+    
+    Returns None if the tile was not rendered at the current size of the page.
     
     """
     document = page.document()
     pageKey = (page.pageNumber(), page.rotation())
     sizeKey = (page.width(), page.height())
+    try:
+        entry = _cache[document][pageKey][sizeKey][tile]
+    except KeyError:
+        _statistics.misses += 1
+        return
+    entry[1] = time.time()
+    _statistics.hits += 1
+    return entry[0]
+
+
+def closest(page):
+    """Returns the size of a different rendering of the Page in the cache, if available.
     
-    if exact:
-        try:
-            entry = _cache[document][pageKey][sizeKey]
-        except KeyError:
-            return
-        else:
-            entry[1] = time.time()
-            return entry[0]
+    The returned two-tuple (width, height) can be used to find tiles that can
+    be scaled and drawn temporarily while the real tiles are being rendered.
+    Returns None if there are no tiles of the page in the cache at all.
+    
+    """
     try:
-        sizes = _cache[document][pageKey].keys()
+        sizes = [size for size, tiles in _cache[page.document()][(page.pageNumber(), page.rotation())].items()
+                 if tiles]
     except KeyError:
         return
     # find the closest size (assuming aspect ratio has not changed)
     if sizes:
-        sizes.sort(key=lambda s: abs(1 - s[0] / float(page.width())))
-        return _cache[document][pageKey][sizes[0]][0]
+        return min(sizes, key=lambda s: abs(1 - s[0] / float(page.width())))
 
 
-def generate(page):
-    """Schedule an image to be generated for the cache."""
+def scaled(page, size, tile):
+    """Returns the cached image for the tile of the Page rendered at a different size, if available."""
+    pageKey = (page.pageNumber(), page.rotation())
+    try:
+        return _cache[page.document()][pageKey][size][tile][0]
+    except KeyError:
+        return
+
+
+def setpreviewresolution(dpi):
+    """Sets the resolution of the quick preview rendering of a page.
+    
+    While the tiles of a page are rendered, and no rendering at another size
+    is available, a preview of the whole page, rendered at this resolution
+    without antialiasing, is displayed. Use 0 to disable the preview.
+    
+    """
+    global _previewresolution
+    _previewresolution = dpi
+    if not dpi:
+        _previews.clear()
+
+
+def previewresolution():
+    """Returns the resolution of the quick preview rendering of a page (0 if disabled)."""
+    return _previewresolution
+
+
+def preview(page):
+    """Returns the preview image of the page if available."""
+    try:
+        return _previews[page.document()][(page.pageNumber(), page.rotation())]
+    except KeyError:
+        return
+
+
+def generatepreview(page):
+    """Schedules the preview image of the page to be generated.
+    
+    The preview is rendered before the tiles the page is waiting for, and it
+    is dropped again when the page has received all its tiles.
+    
+    """
+    if _previewresolution:
+        scheduler(page.document()).schedulejob(page, [None])
+
+
+def generate(page, tilelist=None, center=None):
+    """Schedule the tiles of a page to be generated for the cache.
+    
+    If tilelist is None, all the tiles of the page are rendered.
+    The tiles closest to center (a QPoint relative to the page, defaulting
+    to the top left corner) are rendered first.
+    
+    """
+    if tilelist is None:
+        tilelist = tiles(page.width(), page.height())
+    scheduler(page.document()).schedulejob(page, tilelist, center)
+
+
+def prefetch(page, tilelist=None, center=None):
+    """Schedule the tiles of a page to be generated with low priority.
+    
+    This is used for pages that are expected to become visible soon.
+    Prefetch jobs only run when no page is waiting for tiles, and are
+    not started when the cache is almost full.
+    If tilelist is None, all the tiles of the page are rendered.
+    
+    """
+    if underpressure():
+        return
+    if tilelist is None:
+        tilelist = tiles(page.width(), page.height())
+    scheduler(page.document()).prefetchjob(page, tilelist, center)
+
+
+def cancel(page):
+    """Cancels the jobs the page is waiting for, e.g. because it is not visible anymore."""
+    s = _schedulers.get(page.document())
+    if s:
+        s.cancel(page)
+
+
+def cancelprefetch(document=None):
+    """Cancels the prefetch jobs for the given Poppler.Document or all documents."""
+    if document:
+        s = _schedulers.get(document)
+        schedulers = [s] if s else []
+    else:
+        schedulers = _schedulers.values()
+    for s in schedulers:
+        s.cancelprefetch()
+
+
+def scheduler(document):
+    """(Internal) Returns the Scheduler for the Poppler.Document, creating it if needed."""
     # Poppler-Qt4 crashes when different pages from a Document are rendered at the same time,
     # so we schedule them to be run in sequence.
-    document = page.document()
     try:
-        scheduler = _schedulers[document]
+        return _schedulers[document]
     except KeyError:
-        scheduler = _schedulers[document] = Scheduler()
-    scheduler.schedulejob(page)
+        s = _schedulers[document] = Scheduler()
+        return s
+
+
+def queuelength():
+    """Returns the number of jobs waiting to be rendered, for all documents."""
+    return sum(s.queueLength() for s in _schedulers.values())
+
 
+def waittime():
+    """Returns the average time in seconds recently started jobs waited in the queue."""
+    return _statistics.waitTime()
 
-def add(image, document, pageNumber, rotation, width, height):
-    """(Internal) Adds an image to the cache."""
+
+def statistics():
+    """Returns the Statistics instance recording the behaviour of the cache."""
+    return _statistics
+
+
+def underpressure():
+    """Returns True if the cache is too full to render images in advance."""
+    return _currentsize > _maxsize * _prefetchlimit
+
+
+def add(image, document, pageNumber, rotation, width, height, tile):
+    """(Internal) Adds an image of a tile to the cache."""
     pageKey = (pageNumber, rotation)
     sizeKey = (width, height)
-    _cache.setdefault(document, {}).setdefault(pageKey, {})[sizeKey] = [image, time.time()]
+    tiles = _cache.setdefault(document, {}).setdefault(pageKey, {}).setdefault(sizeKey, {})
     
     # maintain cache size
     global _maxsize, _currentsize
+    if tile in tiles:
+        _currentsize -= tiles[tile][0].byteCount()
+    tiles[tile] = [image, time.time()]
     _currentsize += image.byteCount()
     if _currentsize > _maxsize:
         purge()
@@ -140,23 +345,29 @@ def purge():
     """
     # make a list of the images, sorted on time, newest first
     images = iter(sorted((
-        (time, document, pageKey, sizeKey, image.byteCount())
+        (time, document, pageKey, sizeKey, tile, image.byteCount())
             for document, pageKeys in _cache.items()
             for pageKey, sizeKeys in pageKeys.items()
-            for sizeKey, (image, time) in sizeKeys.items()),
+            for sizeKey, tiles in sizeKeys.items()
+            for tile, (image, time) in tiles.items()),
                 reverse=True))
 
     # sum the size of the newest images
     global _maxsize, _currentsize
     byteCount = 0
     for item in images:
-        byteCount += item[4]
-        if byteCount > _maxsize:
+        if byteCount + item[5] > _maxsize:
+            images = itertools.chain([item], images)
             break
+        byteCount += item[5]
     _currentsize = byteCount
     # delete the other images
-    for time, document, pageKey, sizeKey, byteCount in images:
-        del _cache[document][pageKey][sizeKey]
+    for time, document, pageKey, sizeKey, tile, byteCount in images:
+        tiles = _cache[document][pageKey][sizeKey]
+        del tiles[tile]
+        if not tiles:
+            del _cache[document][pageKey][sizeKey]
+        _statistics.evictions += 1
 
 
 def links(page):
@@ -172,6 +383,86 @@ def links(page):
         return links
 
 
+def fingerprint(document, pageNumber):
+    """Returns a string identifying the contents of a page of the Poppler.Document.
+    
+    Pages with the same fingerprint look the same and have the same links.
+    The fingerprint is computed from a low resolution rendering of the page
+    and its links, which is slow, so this function is normally called in a
+    background thread. The result is cached.
+    
+    """
+    try:
+        return _fingerprints[document][pageNumber]
+    except KeyError:
+        pass
+    with lock(document):
+        options().write(document)
+        options(document).write(document)
+        page = document.page(pageNumber)
+        image = page.renderToImage(18.0, 18.0)
+        links = [(link.linkArea().normalized().getCoords(), getattr(link, 'url', lambda: '')())
+                 for link in page.links()]
+    h = hashlib.sha1()
+    h.update(image.constBits().asstring(image.byteCount()))
+    h.update(repr(sorted(links)))
+    result = h.hexdigest()
+    _fingerprints.setdefault(document, {})[pageNumber] = result
+    return result
+
+
+def reuse(old, new):
+    """Reuses the tiles and links of the old Poppler.Document for the new one.
+    
+    This is useful when a document is reloaded after it has been changed,
+    as mostly only a few pages will be different. Only the pages of the old
+    document that have cached tiles or links are considered. The pages are
+    compared in a background thread, and when an identical page is found, its
+    tiles and links are moved from the old to the new document.
+    
+    """
+    pageNumbers = set(pageNumber for pageNumber, rotation in _cache.get(old, ()))
+    pageNumbers.update(_links.get(old, ()))
+    if pageNumbers:
+        _reusers[new] = Reuser(old, new, pageNumbers)
+
+
+def reuser(document):
+    """Returns the Reuser that is looking for pages to reuse for the document.
+    
+    Returns None if reuse() was not called for the document or has completed.
+    
+    """
+    return _reusers.get(document)
+
+
+def _move(old, oldPageNumber, new, pageNumber):
+    """(Internal) Moves tiles and links of a page of the old document to the new one."""
+    global _currentsize
+    pages = _cache.get(old, {})
+    for pageKey in list(pages):
+        if pageKey[0] == oldPageNumber:
+            sizes = _cache.setdefault(new, {}).setdefault((pageNumber, pageKey[1]), {})
+            for sizeKey, tiles in pages.pop(pageKey).items():
+                # keep the tiles that were already rendered for the new document,
+                # the old ones they replace are not in the cache anymore
+                for tile, entry in sizes.get(sizeKey, {}).items():
+                    if tile in tiles:
+                        _currentsize -= tiles[tile][0].byteCount()
+                    tiles[tile] = entry
+                sizes[sizeKey] = tiles
+    try:
+        links = _links[old].pop(oldPageNumber)
+    except KeyError:
+        pass
+    else:
+        _links.setdefault(new, {}).setdefault(pageNumber, links)
+    # redraw the pages that are waiting for tiles
+    s = _schedulers.get(new)
+    if s:
+        s.reused(pageNumber)
+
+
 def options(document=None):
     """Returns a RenderOptions object for a document or the global one if no document is given."""
     global _globaloptions, _options
@@ -207,64 +498,255 @@ def setoptions(options, document=None):
             pass
 
 
+class Statistics(object):
+    """Records how the cache behaves, to be able to choose a good cache size.
+    
+    The counters are public attributes:
+    
+    hits:         number of tiles found in the cache
+    misses:       number of tiles not found in the cache
+    scaledMisses: number of misses that could be drawn scaled from another size
+    evictions:    number of tiles removed to keep the cache below its maximum size
+    diskHits:     number of tiles loaded from the disk cache instead of rendered
+    
+    The render times (per page) and wait times of recently rendered tiles are
+    kept as well.
+    
+    """
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Sets all counters to zero and forgets the timings."""
+        self.hits = 0
+        self.misses = 0
+        self.scaledMisses = 0
+        self.evictions = 0
+        self.diskHits = 0
+        self.renderTimes = collections.deque(maxlen=1000) # (pageNumber, seconds)
+        self.waitTimes = collections.deque(maxlen=1000)   # seconds
+    
+    def exactMisses(self):
+        """Returns the number of misses that were drawn as blank paper."""
+        return self.misses - self.scaledMisses
+    
+    def hitRatio(self):
+        """Returns the fraction of the requested tiles that were found in the cache."""
+        total = self.hits + self.misses
+        return float(self.hits) / total if total else 0.0
+    
+    def renderTime(self):
+        """Returns the average time in seconds it took to render a tile."""
+        times = [t for num, t in self.renderTimes]
+        return sum(times) / len(times) if times else 0.0
+    
+    def pageRenderTimes(self):
+        """Returns a dictionary mapping page numbers to their average tile render time."""
+        d = collections.defaultdict(list)
+        for num, t in self.renderTimes:
+            d[num].append(t)
+        return dict((num, sum(times) / len(times)) for num, times in d.items())
+    
+    def waitTime(self):
+        """Returns the average time in seconds tiles waited in the queue before rendering."""
+        times = list(self.waitTimes)
+        return sum(times) / len(times) if times else 0.0
+    
+    def documentSizes(self):
+        """Returns a dictionary mapping every Poppler.Document to the bytes its tiles use."""
+        return dict((document, sum(image.byteCount()
+                                   for sizeKeys in pageKeys.values()
+                                   for tiles in sizeKeys.values()
+                                   for image, time in tiles.values()))
+                    for document, pageKeys in _cache.items())
+    
+    def report(self):
+        """Returns a multi-line text summarizing the statistics (not translated)."""
+        lines = [
+            "cache size: {0:.1f} MB of {1} MB".format(_currentsize / 1048576.0, maxsize()),
+            "documents: {0}".format(", ".join(
+                "{0:.1f} MB".format(size / 1048576.0)
+                for size in sorted(self.documentSizes().values(), reverse=True)) or "-"),
+            "hits: {0} ({1:.0%})".format(self.hits, self.hitRatio()),
+            "misses: {0} exact, {1} scaled".format(self.exactMisses(), self.scaledMisses),
+            "evictions: {0}".format(self.evictions),
+            "disk cache hits: {0}".format(self.diskHits),
+            "render time: {0:.0f} ms per tile".format(self.renderTime() * 1000),
+            "slowest pages: {0}".format(", ".join(
+                "{0} ({1:.0f} ms)".format(num + 1, t * 1000)
+                for num, t in sorted(self.pageRenderTimes().items(),
+                                     key=lambda i: i[1], reverse=True)[:5]) or "-"),
+            "queue: {0} waiting, {1:.0f} ms average wait".format(
+                queuelength(), self.waitTime() * 1000),
+        ]
+        return "\n".join(lines)
+
+
+_statistics = Statistics()
+
+
 class Scheduler(object):
-    """Manages running rendering jobs in sequence for a Document."""
+    """Manages running rendering jobs in sequence for a Document.
+    
+    Waiting jobs are kept in a priority queue. Jobs a page is waiting for come
+    before prefetch jobs, then jobs are ordered on their distance to the center
+    of the requested area, and then the most recently requested jobs come first.
+    
+    """
     def __init__(self):
-        self._schedule = []     # order
+        self._queue = []        # heap of [prefetch, distance, order, job] entries
+        self._order = itertools.count()
         self._jobs = {}         # jobs on key
-        self._waiting = weakref.WeakKeyDictionary()      # jobs on page
+        self._waiting = weakref.WeakKeyDictionary()      # set of jobs on page
         self._running = None
         
-    def schedulejob(self, page):
-        """Creates or retriggers an existing Job.
+    def schedulejob(self, page, tiles, center=None):
+        """Creates or retriggers existing Jobs for the tiles of the page.
         
-        If a Job was already scheduled for the page, it is canceled.
-        The page's update() method will be called when the Job has completed.
+        If the page was waiting for tiles of a different size, those Jobs are
+        canceled. The page's update() method will be called every time one of
+        its Jobs has completed.
         
         """
         # uniquely identify the image to be generated
-        key = (page.pageNumber(), page.rotation(), page.width(), page.height())
+        size = (page.pageNumber(), page.rotation(), page.width(), page.height())
+        waiting = self._waiting.get(page)
+        if not waiting or next(iter(waiting)).key[:4] != size:
+            self.cancel(page)
+            waiting = self._waiting[page] = set()
+        for tile in tiles:
+            job = self.job(page, size, tile)
+            job.prefetch = False
+            job.pages.add(page)
+            waiting.add(job)
+            self.push(job, center)
+        self.checkStart()
+        
+    def prefetchjob(self, page, tiles, center=None):
+        """Creates low-priority Jobs for the tiles of the page.
+        
+        Tiles that are already scheduled are left alone.
+        
+        """
+        size = (page.pageNumber(), page.rotation(), page.width(), page.height())
+        for tile in tiles:
+            if size + (tile,) not in self._jobs:
+                job = self.job(page, size, tile)
+                job.prefetch = True
+                self.push(job, center)
+        self.checkStart()
+    
+    def job(self, page, size, tile):
+        """(Internal) Returns the Job for the tile, creating it if needed."""
+        key = size + (tile,)
         try:
-            job = self._jobs[key]
+            return self._jobs[key]
         except KeyError:
-            job = self._jobs[key] = Job(page)
+            job = self._jobs[key] = Job(page, tile)
             job.key = key
+            return job
+    
+    def push(self, job, center):
+        """(Internal) Puts the job in the queue, replacing its earlier position."""
+        if job.tile is None:
+            distance = -1 # the preview comes first
+        elif center is None:
+            distance = 0
         else:
-            self._schedule.remove(job)
-        self._schedule.append(job)
-        self._waiting[page] = job
-        self.checkStart()
-        
+            x, y, w, h = job.tile
+            distance = abs(x + w / 2 - center.x()) + abs(y + h / 2 - center.y())
+        if job.entry:
+            job.entry[-1] = None
+        job.entry = [job.prefetch, distance, -next(self._order), job]
+        heapq.heappush(self._queue, job.entry)
+    
+    def cancel(self, page):
+        """Cancels the jobs the page is waiting for, unless other pages need them."""
+        running = self._running and self._running.job
+        for job in self._waiting.pop(page, ()):
+            job.pages.discard(page)
+            if not job.pages and job is not running:
+                self.remove(job)
+    
+    def cancelprefetch(self):
+        """Cancels all low-priority Jobs that are not running."""
+        running = self._running and self._running.job
+        for job in list(self._jobs.values()):
+            if job.prefetch and job is not running:
+                self.remove(job)
+    
+    def remove(self, job):
+        """(Internal) Removes the job from the queue and the pages waiting for it."""
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if job.entry:
+            job.entry[-1] = None
+        for page in list(job.pages):
+            jobs = self._waiting.get(page)
+            if jobs:
+                jobs.discard(job)
+                if not jobs:
+                    del self._waiting[page]
+    
     def checkStart(self):
         """Starts a job if none is running and at least one is waiting."""
-        while self._schedule and not self._running:
-            job = self._schedule[-1]
+        while self._queue and not self._running:
+            job = heapq.heappop(self._queue)[-1]
+            if job is None:
+                continue # this entry was canceled or rescheduled
+            job.entry = None
             document = job.document()
-            if document and job in self._waiting.values():
+            if document and (job.pages or job.prefetch and not underpressure()):
+                _statistics.waitTimes.append(time.time() - job.time)
                 self._running = Runner(self, document, job)
-                break
             else:
-                self.done(job)
+                self.remove(job)
             
     def done(self, job):
         """Called when the job has completed."""
-        del self._jobs[job.key]
-        self._schedule.remove(job)
+        pages = list(job.pages)
+        self.remove(job)
         self._running = None
+        for page in pages:
+            if job.tile is not None and page not in self._waiting:
+                # all tiles are there, the preview is not needed anymore
+                try:
+                    del _previews[job.document()][(job.pageNumber, job.rotation)]
+                except KeyError:
+                    pass
+            page.update()
+    
+    def reused(self, pageNumber):
+        """Called when tiles of the page are reused from another document.
+        
+        The pages waiting for tiles with the page number are redrawn, requesting
+        the tiles that are still missing.
+        
+        """
         for page in list(self._waiting):
-            if self._waiting[page] is job:
+            if page.pageNumber() == pageNumber:
+                self.cancel(page)
                 page.update()
-                del self._waiting[page]
+    
+    def queueLength(self):
+        """Returns the number of jobs waiting to be run."""
+        return len(self._jobs) - (1 if self._running else 0)
 
 
 class Job(object):
     """Simply contains data needed to create an image later."""
-    def __init__(self, page):
+    prefetch = False
+    entry = None
+    
+    def __init__(self, page, tile):
         self.document = weakref.ref(page.document())
         self.pageNumber = page.pageNumber()
         self.rotation = page.rotation()
         self.width = page.width()
         self.height = page.height()
+        self.tile = tile
+        self.pages = weakref.WeakSet()  # the pages waiting for this job
+        self.time = time.time()
 
 
 class Runner(QThread):
@@ -283,16 +765,107 @@ class Runner(QThread):
         pageSize = page.pageSize()
         if self.job.rotation & 1:
             pageSize.transpose()
+        if self.job.tile is None:
+            with lock(self.document):
+                options().write(self.document)
+                options(self.document).write(self.document)
+                # render quickly without antialiasing
+                hints = self.document.renderHints()
+                self.document.setRenderHint(int(hints), False)
+                self.image = page.renderToImage(_previewresolution, _previewresolution,
+                                                -1, -1, -1, -1, self.job.rotation)
+                self.document.setRenderHint(int(hints))
+            return
         xres = 72.0 * self.job.width / pageSize.width()
         yres = 72.0 * self.job.height / pageSize.height()
+        x, y, w, h = self.job.tile
+        disk, key = _diskcache, self.diskKey()
+        if disk and key:
+            self.image = disk.image(key)
+            if self.image is not None:
+                _statistics.diskHits += 1
+                return
         with lock(self.document):
+            start = time.time()
             options().write(self.document)
             options(self.document).write(self.document)
-            self.image = page.renderToImage(xres, yres, 0, 0, self.job.width, self.job.height, self.job.rotation)
+            self.image = page.renderToImage(xres, yres, x, y, w, h, self.job.rotation)
+            _statistics.renderTimes.append((self.job.pageNumber, time.time() - start))
+        if disk and key:
+            disk.add(key, self.image)
+    
+    def diskKey(self):
+        """Returns the key to store our image in the disk cache, or None."""
+        documentkey = _documentkeys.get(self.document)
+        if documentkey:
+            hints = options(self.document).renderHint()
+            if hints is None:
+                hints = options().renderHint()
+            color = options(self.document).paperColor() or options().paperColor()
+            color = color.name() if color else None
+            job = self.job
+            return (documentkey, job.pageNumber, job.rotation, job.width, job.height,
+                    tuple(job.tile), int(hints or 0), color)
         
     def slotFinished(self):
         """Called when the thread has completed."""
-        add(self.image, self.document, self.job.pageNumber, self.job.rotation, self.job.width, self.job.height)
+        if self.job.tile is None:
+            pageKey = (self.job.pageNumber, self.job.rotation)
+            _previews.setdefault(self.document, {})[pageKey] = self.image
+        else:
+            add(self.image, self.document, self.job.pageNumber, self.job.rotation,
+                self.job.width, self.job.height, self.job.tile)
         self.scheduler.done(self.job)
         self.scheduler.checkStart()
 
+
+class Reuser(QThread):
+    """Finds pages in the new document that are identical to pages of the old.
+    
+    For every identical page found, the tiles and links of the old page are
+    moved to the new page, and then the moved() signal is emitted with the old
+    and new page number. The done() signal is emitted when all pages have been
+    compared.
+    
+    """
+    found = pyqtSignal(int, int)
+    moved = pyqtSignal(int, int)
+    done = pyqtSignal()
+    
+    def __init__(self, old, new, pageNumbers):
+        super(Reuser, self).__init__()
+        self.old = old
+        self.new = new
+        self.pageNumbers = pageNumbers
+        self.found.connect(self.slotFound)
+        self.finished.connect(self.slotFinished)
+        self.start()
+    
+    def run(self):
+        """Main method of this thread, called by Qt on start()."""
+        fingerprints = {}
+        for num in sorted(self.pageNumbers):
+            if num < self.old.numPages():
+                fingerprints[fingerprint(self.old, num)] = num
+        # first look at the pages with the same number, then the others
+        count = self.new.numPages()
+        candidates = sorted(n for n in self.pageNumbers if n < count)
+        candidates.extend(n for n in range(count) if n not in self.pageNumbers)
+        for num in candidates:
+            if not fingerprints:
+                break
+            oldnum = fingerprints.pop(fingerprint(self.new, num), None)
+            if oldnum is not None:
+                self.found.emit(oldnum, num)
+    
+    def slotFound(self, oldPageNumber, pageNumber):
+        """Called in the main thread when an identical page was found."""
+        _move(self.old, oldPageNumber, self.new, pageNumber)
+        self.moved.emit(oldPageNumber, pageNumber)
+    
+    def slotFinished(self):
+        """Called when the thread has completed."""
+        if _reusers.get(self.new) is self:
+            del _reusers[self.new]
+        self.old = self.new = None
+        self.done.emit()
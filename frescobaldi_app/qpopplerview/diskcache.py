@@ -0,0 +1,151 @@
+# This file is part of the qpopplerview package.
+#
+# Copyright (c) 2010 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+
+"""
+A persistent cache of rendered tiles on disk.
+"""
+
+import hashlib
+import os
+import threading
+
+from PyQt4.QtGui import QImage
+
+
+class DiskCache(object):
+    """Stores rendered images as compressed PNG files in a directory.
+    
+    Images are stored under a key, which should be a tuple of strings and
+    numbers uniquely describing the image (the cache module uses the key
+    of the document contents, the page number, rotation, size and tile).
+    
+    The total size of the files is limited; the least recently used files are
+    deleted first. All methods may be called from any thread.
+    
+    """
+    def __init__(self, directory, maxsize=200):
+        """Initializes the DiskCache, using directory and maximum size in Megabytes."""
+        self._directory = directory
+        self._maxsize = maxsize * 1048576
+        self._currentsize = None    # unknown until the directory is scanned
+        self._lock = threading.Lock()
+    
+    def directory(self):
+        """Returns the directory the images are stored in."""
+        return self._directory
+    
+    def setmaxsize(self, maxsize):
+        """Sets the maximum size in Megabytes."""
+        self._maxsize = maxsize * 1048576
+        self.purge()
+    
+    def maxsize(self):
+        """Returns the maximum size in Megabytes."""
+        return self._maxsize / 1048576
+    
+    def filename(self, key):
+        """Returns the filename the image for the key is stored in."""
+        name = hashlib.sha1(repr(key)).hexdigest()
+        return os.path.join(self._directory, name[:2], name + '.png')
+        
+    def image(self, key):
+        """Returns the QImage stored under the key, or None."""
+        filename = self.filename(key)
+        if os.path.exists(filename):
+            image = QImage(filename)
+            if not image.isNull():
+                try:
+                    os.utime(filename, None) # mark as recently used
+                except (IOError, OSError):
+                    pass
+                return image
+    
+    def add(self, key, image):
+        """Stores the QImage under the key."""
+        filename = self.filename(key)
+        try:
+            os.makedirs(os.path.dirname(filename))
+        except (IOError, OSError):
+            pass
+        temp = filename + '.{0}.tmp'.format(threading.current_thread().ident)
+        try:
+            saved = image.save(temp, 'PNG')
+            if saved:
+                size = os.path.getsize(temp)
+                if os.name == 'nt' and os.path.exists(filename):
+                    # os.rename() does not replace an existing file on Windows
+                    os.remove(filename)
+                os.rename(temp, filename)
+        except (IOError, OSError):
+            saved = False
+        if not saved:
+            # don't leave (partially written) temporary files behind
+            try:
+                os.remove(temp)
+            except (IOError, OSError):
+                pass
+            return
+        with self._lock:
+            if self._currentsize is not None:
+                self._currentsize += size
+                if self._currentsize <= self._maxsize:
+                    return
+        self.purge()
+    
+    def purge(self):
+        """Deletes the least recently used files to stay below the maximum size."""
+        with self._lock:
+            files = []
+            for root, dirs, names in os.walk(self._directory):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except (IOError, OSError):
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, path))
+            files.sort(reverse=True)
+            # keep the newest files, leaving some room to not purge too often
+            limit = self._maxsize * 0.9
+            size = 0
+            for index, (mtime, filesize, path) in enumerate(files):
+                if size + filesize > limit:
+                    break
+                size += filesize
+            else:
+                index = len(files)
+            self._currentsize = size
+            for mtime, filesize, path in files[index:]:
+                try:
+                    os.remove(path)
+                except (IOError, OSError):
+                    pass
+    
+    def clear(self):
+        """Deletes all stored images."""
+        with self._lock:
+            for root, dirs, names in os.walk(self._directory):
+                for name in names:
+                    try:
+                        os.remove(os.path.join(root, name))
+                    except (IOError, OSError):
+                        pass
+            self._currentsize = 0
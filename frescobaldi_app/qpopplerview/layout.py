@@ -22,6 +22,7 @@
 Manages and positions a group of Page instances.
 """
 
+import bisect
 import weakref
 
 from PyQt4.QtCore import QObject, QPoint, QRect, QSize, Qt, pyqtSignal
@@ -58,6 +59,7 @@ class AbstractLayout(QObject):
         self._scale = 1.0
         self._scaleChanged = False
         self._dpi = (72, 72)
+        self._pageMap = None
         
     def own(self, page):
         """(Internal) Makes the page have ourselves as layout."""
@@ -65,10 +67,21 @@ class AbstractLayout(QObject):
             page.layout().remove(page)
         page._layout = weakref.ref(self)
         page.computeSize()
+        self.invalidate()
     
     def disown(self, page):
         """(Internal) Removes ourselves as owner of the page."""
         page._layout = lambda: None
+        self.invalidate()
+    
+    def invalidate(self):
+        """(Internal) Called when pages are added or removed, drops the page indexes.
+        
+        Layouts that keep indexes to find pages faster should reimplement this
+        to clear them (and call the base implementation).
+        
+        """
+        self._pageMap = None
         
     def append(self, page):
         self.own(page)
@@ -253,17 +266,11 @@ class AbstractLayout(QObject):
         Returns None if that page is not available.
         
         """
-        # Specific layouts may use faster algorithms to find the page.
-        try:
-            page = self[pageNumber]
-        except IndexError:
-            pass
-        else:
-            if page.document() == document:
-                return page
-        for page in self:
-            if page.document() == document and page.pageNumber() == pageNumber:
-                return page
+        if self._pageMap is None:
+            # in reverse order, so the first page wins if a page appears twice
+            self._pageMap = dict(((page.document(), page.pageNumber()), page)
+                                 for page in reversed(self._pages))
+        return self._pageMap.get((document, pageNumber))
     
     def pages(self):
         """Yields our pages that are visible()."""
@@ -330,6 +337,7 @@ class Layout(AbstractLayout):
     def __init__(self):
         super(Layout, self).__init__()
         self._orientation = Qt.Vertical
+        self._index = None
         
     def setOrientation(self, orientation):
         """Sets our orientation to either Qt.Vertical or Qt.Horizontal."""
@@ -357,5 +365,54 @@ class Layout(AbstractLayout):
                 left += page.width() + self._spacing
             left += self._margin - self._spacing
             self.setSize(QSize(left, height))
-            
+        self.createIndex()
+    
+    def invalidate(self):
+        """(Internal) Drops the page indexes."""
+        super(Layout, self).invalidate()
+        self._index = None
+    
+    def createIndex(self):
+        """(Internal) Stores the positions of the visible pages, in layout order.
+        
+        This is called by reLayout(), and lets pageAt() and pagesAt() find
+        pages using a binary search.
+        
+        """
+        if self._orientation == Qt.Vertical:
+            start, end = QRect.top, QRect.bottom
+        else:
+            start, end = QRect.left, QRect.right
+        pages = list(self.pages())
+        rects = [page.rect() for page in pages]
+        self._index = (
+            [start(rect) for rect in rects],
+            [end(rect) for rect in rects],
+            pages)
+    
+    def pageAt(self, point):
+        """Returns the page that contains the given QPoint."""
+        if self._index is None:
+            return super(Layout, self).pageAt(point)
+        starts, ends, pages = self._index
+        pos = point.y() if self._orientation == Qt.Vertical else point.x()
+        i = bisect.bisect_right(starts, pos) - 1
+        if i >= 0 and pages[i].rect().contains(point):
+            return pages[i]
+    
+    def pagesAt(self, rect):
+        """Yields the pages touched by the given QRect."""
+        if self._index is None:
+            for page in super(Layout, self).pagesAt(rect):
+                yield page
+            return
+        starts, ends, pages = self._index
+        if self._orientation == Qt.Vertical:
+            first, last = rect.top(), rect.bottom()
+        else:
+            first, last = rect.left(), rect.right()
+        for i in range(bisect.bisect_left(ends, first), bisect.bisect_right(starts, last)):
+            if pages[i].rect().intersects(rect):
+                yield pages[i]
+
 
@@ -27,7 +27,7 @@ import weakref
 from PyQt4.QtCore import QPoint, QRect
 from PyQt4.QtGui import QPainter, QRegion, QWidget
 
-from . import cache
+from .page import paintTiles
 
 
 class Magnifier(QWidget):
@@ -89,17 +89,9 @@ class Magnifier(QWidget):
         relx = pagePos.x() / float(page.width())
         rely = pagePos.y() / float(page.height())
         
-        image = cache.image(self._page)
-        img_rect = QRect(self.rect())
-        if not image:
-            cache.generate(self._page)
-            image = cache.image(self._page, False)
-            if image:
-                img_rect.setWidth(self.width() * image.width() / self._page.width())
-                img_rect.setHeight(self.height() * image.height() / self._page.height())
-        if image:
-            img_rect.moveCenter(QPoint(relx * image.width(), rely * image.height()))
-            QPainter(self).drawImage(self.rect(), image, img_rect)
+        rect = QRect(self.rect())
+        rect.moveCenter(QPoint(relx * self._page.width(), rely * self._page.height()))
+        paintTiles(QPainter(self), self._page, rect, QPoint(0, 0))
 
 
 class Page(object):
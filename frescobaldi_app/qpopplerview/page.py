@@ -159,38 +159,19 @@ class Page(object):
         if not update_rect:
             return
         image_rect = QRect(update_rect.topLeft() - self.rect().topLeft(), update_rect.size())
-        image = cache.image(self)
-        self._waiting = not image
-        if image:
-            painter.drawImage(update_rect, image, image_rect)
-        else:
-            # schedule an image to be generated, if done our update() method is called
-            cache.generate(self)
-            # find suitable image to be scaled from other size
-            image = cache.image(self, False)
-            if image:
-                hscale = float(image.width()) / self.width()
-                vscale = float(image.height()) / self.height()
-                image_rect = QRectF(image_rect.x() * hscale, image_rect.y() * vscale,
-                                    image_rect.width() * hscale, image_rect.height() * vscale)
-                painter.drawImage(QRectF(update_rect), image, image_rect)
-            else:
-                # draw blank paper, using the background color of the cache rendering (if set)
-                # or from the document itself.
-                color = (cache.options(self.document()).paperColor()
-                         or cache.options().paperColor() or self.document().paperColor())
-                painter.fillRect(update_rect, color)
+        self._waiting = not paintTiles(painter, self, image_rect, update_rect.topLeft())
 
     def update(self):
-        """Called when an image is drawn."""
-        # only redraw when we were waiting for a correctly sized image.
+        """Called when a tile is drawn."""
+        # only redraw when we were waiting for correctly sized tiles.
         if self._waiting and self.layout():
             self.layout().updatePage(self)
     
     def repaint(self):
         """Call this to force a repaint (e.g. when the rendering options are changed)."""
         self._waiting = True
-        cache.generate(self)
+        if self.layout():
+            self.layout().updatePage(self)
     
     def image(self, rect, xdpi=72.0, ydpi=None, options=None):
         """Returns a QImage of the specified rectangle (relative to our layout).
@@ -314,3 +295,76 @@ class Page(object):
         rect.setCoords(left * hscale, top * vscale, right * hscale, bottom * vscale)
         return rect
         
+
+
+def paintTiles(painter, page, rect, pos):
+    """Paints the rect (in pixels, relative to the page) of the page at pos.
+    
+    The top-left corner of the rect is drawn at pos (in painter coordinates).
+    
+    The page may be a Page or any other object having the methods the cache
+    uses to create and find images (see the magnifier module).
+    
+    Tiles that are not available in the cache are scheduled to be rendered
+    (the page's update() method is called when done). Meanwhile they are
+    scaled from a rendering at another size, or drawn from a quick preview
+    rendering of the whole page, or as blank paper.
+    
+    Returns True if all tiles were available at the size of the page.
+    
+    """
+    offset = pos - rect.topLeft()
+    missing = []
+    for tile in cache.tiles(page.width(), page.height(), rect):
+        tile_rect = QRect(*tile)
+        image = cache.image(page, tile)
+        if image:
+            r = tile_rect & rect
+            painter.drawImage(r.translated(offset), image, r.translated(-tile_rect.topLeft()))
+        else:
+            missing.append(tile_rect)
+    if not missing:
+        return True
+    # draw blank paper, using the background color of the cache rendering (if set)
+    # or from the document itself.
+    color = (cache.options(page.document()).paperColor()
+             or cache.options().paperColor() or page.document().paperColor())
+    for tile_rect in missing:
+        painter.fillRect((tile_rect & rect).translated(offset), color)
+    # draw the quick preview rendering, if available
+    preview = cache.preview(page)
+    if preview:
+        hscale = float(preview.width()) / page.width()
+        vscale = float(preview.height()) / page.height()
+        for tile_rect in missing:
+            r = tile_rect & rect
+            source = QRectF(r.x() * hscale, r.y() * vscale, r.width() * hscale, r.height() * vscale)
+            painter.drawImage(QRectF(r.translated(offset)), preview, source)
+    # find suitable tiles to be scaled from other size
+    complete = True
+    size = cache.closest(page)
+    if size:
+        hscale = float(size[0]) / page.width()
+        vscale = float(size[1]) / page.height()
+        for tile_rect in missing:
+            r = tile_rect & rect
+            source = QRectF(r.x() * hscale, r.y() * vscale, r.width() * hscale, r.height() * vscale)
+            scaled = False
+            for tile in cache.tiles(size[0], size[1], source.toAlignedRect()):
+                image = cache.scaled(page, size, tile)
+                if image:
+                    s = source & QRectF(*tile)
+                    target = QRectF(s.x() / hscale, s.y() / vscale, s.width() / hscale, s.height() / vscale)
+                    painter.drawImage(target.translated(offset), image, s.translated(-tile.x, -tile.y))
+                    scaled = True
+            if scaled:
+                cache.statistics().scaledMisses += 1
+            else:
+                complete = False
+    else:
+        complete = False
+    if not complete and not preview:
+        cache.generatepreview(page)
+    # schedule the tiles to be generated, if done our update() method is called
+    cache.generate(page, [cache.Tile(*r.getRect()) for r in missing], rect.center())
+    return False
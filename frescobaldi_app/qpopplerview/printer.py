@@ -22,7 +22,9 @@
 Printing functionality.
 """
 
-from PyQt4.QtCore import QFile, QIODevice, Qt
+import threading
+
+from PyQt4.QtCore import QFile, QIODevice, Qt, QThread
 from PyQt4.QtGui import QColor, QPainter, QPrinter
 
 from .locking import lock
@@ -84,11 +86,20 @@ class Printer(object):
     does not work correctly in all cases and is not well supported by
     the Poppler developers at this time.
     
+    The pages are rendered by a number of worker threads, while the rendered
+    pages are sent to the QPrinter in order. At most pagesInFlight() pages
+    are being rendered or waiting to be printed at the same time, which
+    bounds the memory used. If a document loader is set, every worker
+    renders from its own Poppler.Document, so the workers do not need to
+    wait for each other.
+    
     """
     def __init__(self):
         self._stop = False
         self._resolution = 300
         self._document = None
+        self._documentLoader = None
+        self._pagesInFlight = max(2, QThread.idealThreadCount())
         self._printer = None
         opts = render.RenderOptions()
         opts.setRenderHint(0)
@@ -103,6 +114,32 @@ class Printer(object):
         """Returns the previously set Poppler.Document."""
         return self._document
         
+    def setDocumentLoader(self, loader):
+        """Sets a callable that returns a new instance of the Poppler.Document.
+        
+        If set, every worker thread renders using its own document, otherwise
+        the workers share the document set with setDocument().
+        
+        """
+        self._documentLoader = loader
+    
+    def documentLoader(self):
+        """Returns the document loader, if set."""
+        return self._documentLoader
+    
+    def setPagesInFlight(self, count):
+        """Sets the maximum number of pages that are rendered in advance.
+        
+        This also is the maximum number of worker threads. By default, the
+        number of processor cores is used, but at least 2.
+        
+        """
+        self._pagesInFlight = max(1, count)
+    
+    def pagesInFlight(self):
+        """Returns the maximum number of pages that are rendered in advance."""
+        return self._pagesInFlight
+    
     def setPrinter(self, printer):
         """Sets the QPrinter to print to (mandatory)."""
         self._printer = printer
@@ -162,25 +199,79 @@ class Printer(object):
 
         total = len(pages)
         
+        workers = [threading.Thread(target=self._render, args=(pages, resolution))
+                   for i in range(min(self.pagesInFlight(), total))]
+        self._images = {}
+        self._next = 0
+        self._done = False
+        self._slots = threading.Semaphore(self.pagesInFlight())
+        self._ready = threading.Condition()
+        for w in workers:
+            w.start()
+        
+        try:
+            for num, pageNum in enumerate(pages, 1):
+                if self._stop:
+                    return p.abort()
+                self.progress(num, total, pageNum)
+                with self._ready:
+                    while num - 1 not in self._images and not self._stop:
+                        self._ready.wait(0.2)
+                    img = self._images.pop(num - 1, None)
+                if img is None:
+                    return p.abort()
+                self._slots.release()
+                if num > 1:
+                    p.newPage()
+                rect = img.rect()
+                rect.moveCenter(center)
+                painter.drawImage(rect, img)
+        finally:
+            # let the workers quit, also when printing was aborted
+            self._done = True
+            for w in workers:
+                self._slots.release()
+            for w in workers:
+                w.join()
+            self._images.clear()
+        
+        return painter.end()
+        
+    def _render(self, pages, resolution):
+        """(Internal) Renders pages in a worker thread, until all are rendered.
+        
+        If rendering fails, printing is stopped, so that print_() does not
+        wait forever for the page.
+        
+        """
+        try:
+            self._renderPages(pages, resolution)
+        except Exception:
+            with self._ready:
+                self._stop = True
+                self._ready.notify_all()
+            raise
+    
+    def _renderPages(self, pages, resolution):
+        """(Internal) Called by _render() to do the actual work."""
         opts = self.renderOptions()
-        document = self.document()
-        
-        for num, pageNum in enumerate(pages, 1):
-            if self._stop:
-                return p.abort()
-            self.progress(num, total, pageNum)
-            if num > 1:
-                p.newPage()
+        loader = self.documentLoader()
+        document = (loader and loader()) or self.document()
+        while True:
+            self._slots.acquire()
+            with self._ready:
+                index = self._next
+                if self._stop or self._done or index >= len(pages):
+                    return
+                self._next += 1
             with lock(document):
                 opts.write(document)
-                page = document.page(pageNum - 1)
+                page = document.page(pages[index] - 1)
                 img = page.renderToImage(resolution, resolution)
-            rect = img.rect()
-            rect.moveCenter(center)
-            painter.drawImage(rect, img)
-        
-        return painter.end()
-        
+            with self._ready:
+                self._images[index] = img
+                self._ready.notify_all()
+    
     def abort(self):
         """Instructs the printer to cancel the job."""
         self._stop = True
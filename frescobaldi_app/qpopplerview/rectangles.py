@@ -23,6 +23,7 @@ Manages lists of rectangular objects and quickly finds them.
 """
 
 import bisect
+import math
 
 
 Left   = 0
@@ -36,8 +37,9 @@ class Rectangles(object):
     Manages a list of rectangular objects and quickly finds objects at
     some point, in some rectangle or intersecting some rectangle.
     
-    The implementation uses four lists of the objects sorted on either
-    coordinate, so retrieval is fast.
+    The implementation divides the area covered by the objects in a grid of
+    cells, each cell knowing the objects that touch it, so a search only needs
+    to look at the few objects in the cells it covers.
     
     Bulk adding is done in the constructor or via the bulk_add() method (which
     clears the indexes, that are recreated on first search).  Single objects
@@ -60,6 +62,7 @@ class Rectangles(object):
         """
         self._items = {} # maps object to the result of func(object)
         self._index = {} # maps side to indices, objects (index=coordinate of that side)
+        self._grid = None # the Grid, created on first search
         if func:
             self._func = func
         if objects:
@@ -74,6 +77,8 @@ class Rectangles(object):
             i = bisect.bisect_left(indices, coords[side])
             indices.insert(i, coords[side])
             objects.insert(i, obj)
+        if self._grid is not None:
+            self._grid.add(obj, coords)
     
     def bulk_add(self, objects):
         """Adds many new items to the index using the function given in the constructor.
@@ -83,43 +88,56 @@ class Rectangles(object):
         """
         self._items.update((obj, self._func(obj)) for obj in objects)
         self._index.clear()
+        self._grid = None
         
     def remove(self, obj):
         """Removes an object from our list. Keeps the index intact."""
-        del self._items[obj]
+        coords = self._items.pop(obj)
         for indices, objects in self._index.values():
             i = objects.index(obj)
             del objects[i]
             del indices[i]
+        if self._grid is not None:
+            self._grid.remove(obj, coords)
             
     def clear(self):
         """Empties the list of items."""
         self._items.clear()
         self._index.clear()
+        self._grid = None
         
     def at(self, x, y):
         """Returns a set() of objects that are touched by the given point."""
-        return self._test(
-            (self._smaller, Top, y),
-            (self._larger, Bottom, y),
-            (self._smaller, Left, x),
-            (self._larger, Right, x))
+        items = self._items
+        return set(obj for obj in self._search(x, y, x, y)
+            if items[obj][Left] <= x <= items[obj][Right]
+            and items[obj][Top] <= y <= items[obj][Bottom])
          
     def inside(self, left, top, right, bottom):
         """Returns a set() of objects that are fully in the given rectangle."""
-        return self._test(
-            (self._larger, Top, top),
-            (self._smaller, Bottom, bottom),
-            (self._larger, Left, left),
-            (self._smaller, Right, right))
+        items = self._items
+        return set(obj for obj in self._search(left, top, right, bottom)
+            if left <= items[obj][Left] and items[obj][Right] <= right
+            and top <= items[obj][Top] and items[obj][Bottom] <= bottom)
     
     def intersecting(self, left, top, right, bottom):
         """Returns a set() of objects intersecting the given rectangle."""
-        return self._test(
-            (self._smaller, Top, bottom),
-            (self._larger, Bottom, top),
-            (self._smaller, Left, right),
-            (self._larger, Right, left))
+        items = self._items
+        return set(obj for obj in self._search(left, top, right, bottom)
+            if items[obj][Left] <= right and left <= items[obj][Right]
+            and items[obj][Top] <= bottom and top <= items[obj][Bottom])
+
+    def batch_at(self, points):
+        """Returns a list with a set() of objects for every (x, y) point."""
+        return [self.at(x, y) for x, y in points]
+    
+    def batch_intersecting(self, rects):
+        """Returns a list with a set() of intersecting objects for every rectangle.
+        
+        Every rectangle is a four-tuple (left, top, right, bottom).
+        
+        """
+        return [self.intersecting(*rect) for rect in rects]
 
     def closest(self, obj, side):
         """Returns the object closest to the given one, going to the given side."""
@@ -157,37 +175,17 @@ class Rectangles(object):
         return bool(self._items)
         
     # private helper methods
-    def _test(self, *tests):
-        """Performs tests and returns objects that fulfill all of them.
+    def _search(self, left, top, right, bottom):
+        """Yields the objects in the grid cells touching the given rectangle.
         
-        Every test should be a three tuple(method, side, value).
-        Method is either self._smaller or self._larger.
-        Returns a (possibly empty) set.
+        Objects touching more than one cell may be yielded more than once.
         
         """
-        result = None
-        for meth, side, value in tests:
-            objects = meth(side, value)
-            if not result:
-                result = set(objects)
-            else:
-                result &= set(objects)
-            if not result:
-                break
-        return result
+        grid = self._grid
+        if grid is None:
+            grid = self._grid = Grid(self._items)
+        return grid.search(left, top, right, bottom)
     
-    def _smaller(self, side, value):
-        """Returns objects for side below value."""
-        indices, objects = self._sorted(side)
-        i = bisect.bisect_right(indices, value)
-        return objects[:i]
-
-    def _larger(self, side, value):
-        """Returns objects for side above value."""
-        indices, objects = self._sorted(side)
-        i = bisect.bisect_left(indices, value)
-        return objects[i:]
-        
     def _sorted(self, side):
         """Returns a two-tuple (indices, objects) sorted on index for the given side.""" 
         try:
@@ -201,5 +199,88 @@ class Rectangles(object):
                 result = [], []
             self._index[side] = result
             return result
-            
+
+
+class Grid(object):
+    """A uniform grid of cells, each having a list of the objects touching it.
+    
+    The size of the cells is chosen so that there are a few objects in every
+    cell on average, but the cells are never smaller than the average object.
+    Coordinates outside the grid are clamped to the cells at its border, so
+    objects added later are always found.
+    
+    """
+    density = 4 # the average number of objects per cell
+    
+    def __init__(self, items):
+        """Creates the grid for the items, a dictionary mapping objects to coordinates."""
+        self._cells = {}
+        if not items:
+            self._left = self._top = 0
+            self._cellWidth = self._cellHeight = 1
+            self._columns = self._rows = 1
+            return
+        coords = items.values()
+        left = min(c[Left] for c in coords)
+        top = min(c[Top] for c in coords)
+        right = max(c[Right] for c in coords)
+        bottom = max(c[Bottom] for c in coords)
+        count = len(coords)
+        size = max(1, int(math.sqrt(count / float(self.density))))
+        width = (right - left) or 1
+        height = (bottom - top) or 1
+        avgWidth = sum(c[Right] - c[Left] for c in coords) / float(count)
+        avgHeight = sum(c[Bottom] - c[Top] for c in coords) / float(count)
+        self._left = left
+        self._top = top
+        self._cellWidth = max(width / float(size), avgWidth) or 1
+        self._cellHeight = max(height / float(size), avgHeight) or 1
+        self._columns = int(math.ceil(width / self._cellWidth)) or 1
+        self._rows = int(math.ceil(height / self._cellHeight)) or 1
+        cells = self._cells
+        column, row = self.column, self.row
+        for obj, c in items.items():
+            columns = range(column(c[Left]), column(c[Right]) + 1)
+            for r in range(row(c[Top]), row(c[Bottom]) + 1):
+                for col in columns:
+                    try:
+                        cells[col, r].append(obj)
+                    except KeyError:
+                        cells[col, r] = [obj]
+    
+    def column(self, x):
+        """Returns the column of the cell containing the x coordinate."""
+        return min(max(0, int((x - self._left) / self._cellWidth)), self._columns - 1)
+    
+    def row(self, y):
+        """Returns the row of the cell containing the y coordinate."""
+        return min(max(0, int((y - self._top) / self._cellHeight)), self._rows - 1)
+    
+    def cells(self, left, top, right, bottom):
+        """Yields the (column, row) keys of the cells touching the rectangle."""
+        columns = range(self.column(left), self.column(right) + 1)
+        for row in range(self.row(top), self.row(bottom) + 1):
+            for column in columns:
+                yield column, row
+    
+    def add(self, obj, coords):
+        """Adds the object with the given coordinates to the cells it touches."""
+        for key in self.cells(*coords):
+            self._cells.setdefault(key, []).append(obj)
+    
+    def remove(self, obj, coords):
+        """Removes the object with the given coordinates from the cells it touches."""
+        for key in self.cells(*coords):
+            objects = self._cells[key]
+            objects.remove(obj)
+            if not objects:
+                del self._cells[key]
+    
+    def search(self, left, top, right, bottom):
+        """Yields the objects in the cells touching the rectangle."""
+        cells = self._cells
+        for key in self.cells(left, top, right, bottom):
+            for obj in cells.get(key, ()):
+                yield obj
+
 
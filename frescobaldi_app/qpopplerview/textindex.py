@@ -0,0 +1,199 @@
+# This file is part of the qpopplerview package.
+#
+# Copyright (c) 2010 - 2012 by Wilbert Berendsen
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+# See http://www.gnu.org/licenses/ for more information.
+
+
+
+"""
+A full-text index of Poppler documents.
+
+The text of all pages is extracted in a background thread, page by page.
+Searching the index is then done without calling into Poppler.
+"""
+
+import bisect
+import weakref
+
+from PyQt4.QtCore import QObject, QRectF, QThread, pyqtSignal
+
+from .locking import lock
+from . import cache
+
+
+_indexes = weakref.WeakKeyDictionary()
+
+
+def index(document):
+    """Returns the TextIndex for the Poppler.Document, creating and starting it if needed."""
+    try:
+        return _indexes[document]
+    except KeyError:
+        idx = _indexes[document] = TextIndex(document)
+        idx.start()
+        return idx
+
+
+def reuse(old, new):
+    """Creates the TextIndex for the new Poppler.Document, reusing the text of the old.
+    
+    This must be called directly after cache.reuse(old, new). The text of
+    the pages the cache finds to be identical is copied from the index of
+    the old document, if it has one, and the other pages are extracted
+    when the cache is ready comparing pages.
+    
+    """
+    idx = _indexes[new] = TextIndex(new)
+    reuser = cache.reuser(new)
+    oldidx = _indexes.get(old)
+    if reuser and oldidx:
+        reuser.moved.connect(lambda oldnum, num: idx.copy(oldidx, oldnum, num))
+        reuser.done.connect(idx.start)
+    else:
+        idx.start()
+    return idx
+
+
+class TextIndex(QObject):
+    """Stores the text of every page of a Poppler.Document, with the positions of the words.
+    
+    The changed() signal is emitted when the text of pages has become available.
+    
+    """
+    changed = pyqtSignal()
+    
+    def __init__(self, document):
+        super(TextIndex, self).__init__()
+        self._document = weakref.ref(document)
+        self._pages = {}
+        self._extractor = None
+        self._complete = False
+    
+    def document(self):
+        """Returns the Poppler.Document, or None if it has been deleted."""
+        return self._document()
+    
+    def start(self):
+        """Starts extracting the text of the pages not yet in the index."""
+        document = self.document()
+        if document is None or self._extractor or self._complete:
+            return
+        pageNumbers = [num for num in range(document.numPages()) if num not in self._pages]
+        if pageNumbers:
+            self._extractor = Extractor(document, pageNumbers)
+            self._extractor.found.connect(self.slotFound)
+            self._extractor.finished.connect(self.slotFinished)
+            self._extractor.start()
+        else:
+            self._complete = True
+    
+    def isComplete(self):
+        """Returns True if the text of all pages is in the index."""
+        return self._complete
+    
+    def copy(self, other, otherPageNumber, pageNumber):
+        """Copies the text of a page from another TextIndex if it has it."""
+        try:
+            self._pages[pageNumber] = other._pages[otherPageNumber]
+        except KeyError:
+            return
+        self.changed.emit()
+    
+    def slotFound(self, pageNumber, page):
+        """Called when the text of a page has been extracted."""
+        self._pages[pageNumber] = page
+        self.changed.emit()
+    
+    def slotFinished(self):
+        """Called when the text of all pages has been extracted."""
+        self._extractor = None
+        self._complete = True
+    
+    def text(self, pageNumber):
+        """Returns the text of the page, or None if it has not been extracted yet.
+        
+        The words are separated by a space.
+        
+        """
+        try:
+            return self._pages[pageNumber][0]
+        except KeyError:
+            pass
+    
+    def search(self, text):
+        """Returns a list of (pageNumber, rect) tuples for all occurrences of text.
+        
+        The search is case insensitive, and every word that contains a part of
+        a found occurrence yields a rect, which is a QRectF inside (0, 0, 1, 1)
+        like the linkArea attribute of a Poppler.Link.
+        
+        """
+        text = text.lower()
+        result = []
+        if not text:
+            return result
+        for pageNumber, (pagetext, starts, rects) in sorted(self._pages.items()):
+            lowered = pagetext.lower()
+            pos = lowered.find(text)
+            while pos != -1:
+                end = pos + len(text)
+                first = bisect.bisect_right(starts, pos) - 1
+                last = bisect.bisect_left(starts, end)
+                result.extend((pageNumber, rect) for rect in rects[first:last])
+                pos = lowered.find(text, end)
+        return result
+
+
+class Extractor(QThread):
+    """Extracts the text of pages of a Poppler.Document in a background thread.
+    
+    For every page, the found signal is emitted with the page number and a
+    three-tuple (text, starts, rects). The text contains all words separated by
+    a space, starts lists the position of every word in the text, and rects the
+    bounding rectangle of every word, inside (0, 0, 1, 1).
+    
+    """
+    found = pyqtSignal(int, object)
+    
+    def __init__(self, document, pageNumbers):
+        super(Extractor, self).__init__()
+        self.document = document
+        self.pageNumbers = pageNumbers
+        self.finished.connect(self.slotFinished)
+    
+    def run(self):
+        """Main method of this thread, called by Qt on start()."""
+        for num in self.pageNumbers:
+            with lock(self.document):
+                page = self.document.page(num)
+                size = page.pageSizeF()
+                boxes = [(box.text(), box.boundingBox()) for box in page.textList()]
+            w, h = size.width() or 1, size.height() or 1
+            words, starts, rects = [], [], []
+            pos = 0
+            for text, r in boxes:
+                words.append(text)
+                starts.append(pos)
+                rects.append(QRectF(r.x() / w, r.y() / h, r.width() / w, r.height() / h))
+                pos += len(text) + 1
+            self.found.emit(num, (' '.join(words), starts, rects))
+    
+    def slotFinished(self):
+        """Called when the thread has completed."""
+        self.document = None
+
+
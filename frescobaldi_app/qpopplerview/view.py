@@ -23,11 +23,12 @@ View widget to display PDF documents.
 """
 
 
-from PyQt4.QtCore import QPoint, QSize, QTimer, Qt, pyqtSignal
+from PyQt4.QtCore import QPoint, QRect, QSize, QTimer, Qt, pyqtSignal
 from PyQt4.QtGui import QPalette, QScrollArea, QStyle, QHelpEvent
 
 from math import sqrt
 import copy
+import weakref
 from . import surface
 from .kineticscrollarea import KineticScrollArea
 from . import cache
@@ -64,6 +65,15 @@ class View(KineticScrollArea):
         self._centerPos = False
         self._resizeTimer = QTimer(singleShot = True, timeout = self._resizeTimeout)
         
+        # prefetching of pages about to become visible
+        self._prefetchEnabled = True
+        self._scrollPos = QPoint()
+        self._scrollDirection = QPoint(0, 1)
+        self._visiblePages = weakref.WeakSet()
+        self._prefetchTimer = QTimer(singleShot = True, interval = 200, timeout = self._prefetchTimeout)
+        self.horizontalScrollBar().valueChanged.connect(self._scrolled)
+        self.verticalScrollBar().valueChanged.connect(self._scrolled)
+        
     def surface(self):
         """Returns our Surface, the widget drawing the page(s)."""
         sf = self.widget()
@@ -120,6 +130,23 @@ class View(KineticScrollArea):
         """
         self._wheelZoomModifier = key
         
+    def setPrefetchEnabled(self, enabled):
+        """Sets whether pages just outside the viewport are rendered in advance.
+        
+        When enabled (the default), parts of pages that will become visible
+        when the user continues scrolling in the same direction, and the page
+        after the current page, are rendered with low priority.
+        
+        """
+        self._prefetchEnabled = enabled
+        if not enabled:
+            self._prefetchTimer.stop()
+            self.cancelPrefetch()
+    
+    def prefetchEnabled(self):
+        """Returns whether prefetching of pages is enabled."""
+        return self._prefetchEnabled
+        
     def load(self, document):
         """Convenience method to load all the pages from the given Poppler.Document."""
         self.surface().pageLayout().load(document)
@@ -127,6 +154,8 @@ class View(KineticScrollArea):
         if self.viewMode():
             self.fit()
         self.surface().pageLayout().update()
+        if self._prefetchEnabled:
+            self._prefetchTimer.start()
 
     def clear(self):
         """Convenience method to clear the current layout."""
@@ -150,6 +179,66 @@ class View(KineticScrollArea):
         rect.intersect(self.surface().rect())
         return self.surface().pageLayout().pagesAt(rect)
 
+    def prefetch(self, rect):
+        """Renders the parts of the pages in rect (relative to the surface) in advance.
+        
+        Visible pages are skipped, because they are already being rendered.
+        
+        """
+        visible = set(self.visiblePages())
+        for page in self.surface().pageLayout().pagesAt(rect):
+            if page not in visible:
+                r = rect.translated(-page.pos())
+                tiles = cache.tiles(page.width(), page.height(), r)
+                cache.prefetch(page, tiles, r.center())
+    
+    def cancelPrefetch(self):
+        """Cancels rendering pages in advance, e.g. when the user jumps elsewhere."""
+        for document in set(page.document() for page in self.surface().pageLayout()):
+            cache.cancelprefetch(document)
+    
+    def _scrolled(self):
+        """(Internal) Called when the View scrolls.
+        
+        Cancels rendering pages that scrolled out of view and records the
+        scroll direction.
+        
+        """
+        visible = set(self.visiblePages())
+        for page in self._visiblePages:
+            if page not in visible:
+                cache.cancel(page)
+        self._visiblePages = weakref.WeakSet(visible)
+        pos = self.scrollOffset()
+        diff, self._scrollPos = pos - self._scrollPos, pos
+        if not self._prefetchEnabled:
+            return
+        size = self.viewport().size()
+        if abs(diff.x()) > size.width() * 2 or abs(diff.y()) > size.height() * 2:
+            # the user jumped elsewhere
+            self.cancelPrefetch()
+        elif diff.x() or diff.y():
+            self._scrollDirection = QPoint(cmp(diff.x(), 0), cmp(diff.y(), 0))
+        self._prefetchTimer.start()
+    
+    def _prefetchTimeout(self):
+        """(Internal) Prefetches the area ahead of the scroll direction and the next page."""
+        self.cancelPrefetch()
+        if cache.underpressure():
+            return
+        rect = self.viewport().rect()
+        rect.translate(-self.surface().pos())
+        size = rect.size()
+        # the page after the current one, as displayed when paging forward
+        layout = self.surface().pageLayout()
+        num = self.currentPageNumber() + 1
+        if 0 < num < len(layout):
+            margin = QPoint(layout.margin(), layout.margin())
+            self.prefetch(QRect(layout[num].pos() - margin, size))
+        # the area that becomes visible when scrolling further
+        d = self._scrollDirection
+        self.prefetch(rect.translated(d.x() * size.width(), d.y() * size.height()))
+        
     def redraw(self):
         """Redraws, e.g. when you changed rendering hints or papercolor on the document."""
         pages = list(self.visiblePages())
@@ -37,6 +37,10 @@ class Completer(QCompleter):
     
     Call showCompletionPopup() to force the popup to show.
     
+    If the model has a setCompletionPrefix() method (like
+    listmodel.CompletionListModel), the model filters itself and its rows
+    are shown unfiltered.
+    
     """
     autoComplete = True
     autoCompleteLength = 2
@@ -44,6 +48,14 @@ class Completer(QCompleter):
     def __init__(self, *args, **kwargs):
         super(Completer, self).__init__(*args, **kwargs)
         self.activated[QModelIndex].connect(self.insertCompletion)
+    
+    def setModel(self, model):
+        """Reimplemented to let a model filter itself if it can."""
+        super(Completer, self).setModel(model)
+        if hasattr(model, 'setCompletionPrefix'):
+            self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        else:
+            self.setCompletionMode(QCompleter.PopupCompletion)
         
     def eventFilter(self, obj, ev):
         if ev.type() != QEvent.KeyPress:
@@ -131,6 +143,9 @@ class Completer(QCompleter):
             return
         text = cursor.selectedText()
         if forced or (self.autoComplete and len(text) >= self.autoCompleteLength):
+            model = self.model()
+            if hasattr(model, 'setCompletionPrefix'):
+                model.setCompletionPrefix(text)
             self.setCompletionPrefix(text)
             # hide if there is only one completion left
             if (not self.setCurrentRow(1) and self.setCurrentRow(0)
@@ -152,11 +167,18 @@ class Completer(QCompleter):
         
         The default implementation reads the model data under the Qt.EditRole,
         and inserts that with the (already entered) completionPrefix removed.
+        If the completion does not start with the prefix (e.g. because the
+        model matched it ignoring case), the prefix is replaced.
         
         """
         text = self.completionModel().data(index, Qt.EditRole)
-        text = text[len(self.completionPrefix()):]
-        self.textCursor().insertText(text)
+        prefix = self.completionPrefix()
+        cursor = self.textCursor()
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+        else:
+            cursor.movePosition(QTextCursor.Left, QTextCursor.KeepAnchor, len(prefix))
+        cursor.insertText(text)
 
 
 